@@ -0,0 +1,114 @@
+"""Store transaction type/status as VARCHAR + CHECK instead of Postgres ENUM
+
+Revision ID: 3a7e9c1d5b20
+Revises: merge_20251226
+Create Date: 2026-01-05
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '3a7e9c1d5b20'
+down_revision = 'merge_20251226'
+branch_labels = None
+depends_on = None
+
+
+TRANSACTION_TYPES = (
+    'AUCTION', 'BUY_NOW', 'FIXED_PRICE', 'TRANSFER', 'TOPUP', 'BIOME_BUY', 'BIOME_SELL'
+)
+TRANSACTION_STATUSES = ('PENDING', 'COMPLETED', 'FAILED', 'REFUNDED')
+
+UNIFIED_VIEW_SQL = '''
+CREATE VIEW v_unified_transactions AS
+SELECT
+    transaction_id,
+    buyer_id,
+    seller_id,
+    land_id,
+    listing_id,
+    transaction_type,
+    amount_bdt,
+    status,
+    platform_fee_bdt,
+    gateway_fee_bdt,
+    gateway_name,
+    gateway_transaction_id,
+    completed_at,
+    created_at,
+    biome,
+    shares,
+    price_per_share_bdt,
+    CASE
+        WHEN transaction_type IN ('BIOME_BUY', 'BIOME_SELL') THEN 'biome'
+        WHEN transaction_type IN ('BUY_NOW', 'FIXED_PRICE', 'AUCTION', 'TRANSFER') THEN 'marketplace'
+        WHEN transaction_type = 'TOPUP' THEN 'wallet'
+        ELSE 'unknown'
+    END AS transaction_source
+FROM transactions
+ORDER BY created_at DESC
+'''
+
+
+def _in_list(values) -> str:
+    return ", ".join(f"'{v}'" for v in values)
+
+
+def upgrade() -> None:
+    # The unified view depends on both columns; rebuild it around the type change.
+    op.execute('DROP VIEW IF EXISTS v_unified_transactions')
+
+    op.alter_column(
+        'transactions', 'transaction_type',
+        type_=sa.String(length=20),
+        existing_nullable=False,
+        postgresql_using='transaction_type::text'
+    )
+    op.alter_column(
+        'transactions', 'status',
+        type_=sa.String(length=20),
+        existing_nullable=False,
+        postgresql_using='status::text'
+    )
+
+    op.create_check_constraint(
+        'check_transaction_type',
+        'transactions',
+        f"transaction_type IN ({_in_list(TRANSACTION_TYPES)})"
+    )
+    op.create_check_constraint(
+        'check_transaction_status',
+        'transactions',
+        f"status IN ({_in_list(TRANSACTION_STATUSES)})"
+    )
+
+    op.execute('DROP TYPE IF EXISTS transactiontype')
+    op.execute('DROP TYPE IF EXISTS transactionstatus')
+
+    op.execute(UNIFIED_VIEW_SQL)
+
+
+def downgrade() -> None:
+    op.execute('DROP VIEW IF EXISTS v_unified_transactions')
+
+    op.drop_constraint('check_transaction_status', 'transactions', type_='check')
+    op.drop_constraint('check_transaction_type', 'transactions', type_='check')
+
+    op.execute(f"CREATE TYPE transactiontype AS ENUM ({_in_list(TRANSACTION_TYPES)})")
+    op.execute(f"CREATE TYPE transactionstatus AS ENUM ({_in_list(TRANSACTION_STATUSES)})")
+
+    op.alter_column(
+        'transactions', 'transaction_type',
+        type_=sa.Enum(*TRANSACTION_TYPES, name='transactiontype'),
+        existing_nullable=False,
+        postgresql_using='transaction_type::transactiontype'
+    )
+    op.alter_column(
+        'transactions', 'status',
+        type_=sa.Enum(*TRANSACTION_STATUSES, name='transactionstatus'),
+        existing_nullable=False,
+        postgresql_using='status::transactionstatus'
+    )
+
+    op.execute(UNIFIED_VIEW_SQL)
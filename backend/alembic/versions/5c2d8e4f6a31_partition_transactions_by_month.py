@@ -0,0 +1,161 @@
+"""Range-partition transactions by month on created_at
+
+Revision ID: 5c2d8e4f6a31
+Revises: 3a7e9c1d5b20
+Create Date: 2026-01-06
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '5c2d8e4f6a31'
+down_revision = '3a7e9c1d5b20'
+branch_labels = None
+depends_on = None
+
+
+COLUMNS = '''
+    transaction_id, land_id, seller_id, buyer_id, listing_id,
+    transaction_type, amount_bdt, currency, status,
+    gateway_name, gateway_transaction_id, platform_fee_bdt, gateway_fee_bdt,
+    biome, shares, price_per_share_bdt,
+    created_at, completed_at, updated_at
+'''
+
+CREATE_TABLE_SQL = '''
+CREATE TABLE transactions (
+    transaction_id UUID NOT NULL,
+    land_id UUID REFERENCES lands (land_id),
+    seller_id UUID REFERENCES users (user_id),
+    buyer_id UUID NOT NULL REFERENCES users (user_id),
+    listing_id UUID REFERENCES listings (listing_id),
+    transaction_type VARCHAR(20) NOT NULL,
+    amount_bdt INTEGER NOT NULL,
+    currency VARCHAR(3) NOT NULL,
+    status VARCHAR(20) NOT NULL,
+    gateway_name VARCHAR(50),
+    gateway_transaction_id VARCHAR(255),
+    platform_fee_bdt INTEGER NOT NULL,
+    gateway_fee_bdt INTEGER NOT NULL,
+    biome VARCHAR(50),
+    shares FLOAT,
+    price_per_share_bdt INTEGER,
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL,
+    completed_at TIMESTAMP WITH TIME ZONE,
+    updated_at TIMESTAMP WITH TIME ZONE NOT NULL,
+    PRIMARY KEY (transaction_id, created_at),
+    CONSTRAINT check_nonnegative_amount CHECK (amount_bdt >= 0),
+    CONSTRAINT check_transaction_type CHECK (transaction_type IN (
+        'AUCTION', 'BUY_NOW', 'FIXED_PRICE', 'TRANSFER', 'TOPUP', 'BIOME_BUY', 'BIOME_SELL'
+    )),
+    CONSTRAINT check_transaction_status CHECK (status IN (
+        'PENDING', 'COMPLETED', 'FAILED', 'REFUNDED'
+    ))
+) PARTITION BY RANGE (created_at)
+'''
+
+# Creates one partition per month from the oldest row through next month,
+# plus a DEFAULT partition as a safety net for rows outside that range.
+CREATE_PARTITIONS_SQL = '''
+DO $$
+DECLARE
+    month_start DATE;
+    last_month DATE := (date_trunc('month', now()) + interval '1 month')::date;
+BEGIN
+    SELECT COALESCE(date_trunc('month', min(created_at))::date, date_trunc('month', now())::date)
+      INTO month_start
+      FROM transactions_legacy;
+    WHILE month_start <= last_month LOOP
+        EXECUTE format(
+            'CREATE TABLE IF NOT EXISTS %I PARTITION OF transactions FOR VALUES FROM (%L) TO (%L)',
+            'transactions_' || to_char(month_start, 'YYYY_MM'),
+            month_start,
+            (month_start + interval '1 month')::date
+        );
+        month_start := (month_start + interval '1 month')::date;
+    END LOOP;
+END $$;
+'''
+
+UNIFIED_VIEW_SQL = '''
+CREATE VIEW v_unified_transactions AS
+SELECT
+    transaction_id,
+    buyer_id,
+    seller_id,
+    land_id,
+    listing_id,
+    transaction_type,
+    amount_bdt,
+    status,
+    platform_fee_bdt,
+    gateway_fee_bdt,
+    gateway_name,
+    gateway_transaction_id,
+    completed_at,
+    created_at,
+    biome,
+    shares,
+    price_per_share_bdt,
+    CASE
+        WHEN transaction_type IN ('BIOME_BUY', 'BIOME_SELL') THEN 'biome'
+        WHEN transaction_type IN ('BUY_NOW', 'FIXED_PRICE', 'AUCTION', 'TRANSFER') THEN 'marketplace'
+        WHEN transaction_type = 'TOPUP' THEN 'wallet'
+        ELSE 'unknown'
+    END AS transaction_source
+FROM transactions
+ORDER BY created_at DESC
+'''
+
+INDEXES = (
+    ('idx_transactions_seller', ['seller_id', 'created_at']),
+    ('idx_transactions_buyer', ['buyer_id', 'created_at']),
+    ('idx_transactions_status', ['status']),
+    ('idx_transactions_created_at', ['created_at']),
+    ('idx_transactions_gateway_txn', ['gateway_transaction_id']),
+    ('idx_transactions_biome', ['biome']),
+    ('ix_transactions_land_id', ['land_id']),
+    ('ix_transactions_status', ['status']),
+    ('ix_transactions_transaction_type', ['transaction_type']),
+    ('ix_transactions_biome', ['biome']),
+)
+
+
+def upgrade() -> None:
+    op.execute('DROP VIEW IF EXISTS v_unified_transactions')
+    op.execute('ALTER TABLE transactions RENAME TO transactions_legacy')
+
+    op.execute(CREATE_TABLE_SQL)
+    op.execute(CREATE_PARTITIONS_SQL)
+    op.execute('CREATE TABLE transactions_default PARTITION OF transactions DEFAULT')
+
+    op.execute(f'INSERT INTO transactions ({COLUMNS}) SELECT {COLUMNS} FROM transactions_legacy')
+    op.execute('DROP TABLE transactions_legacy CASCADE')
+
+    for name, columns in INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {name}")
+        op.create_index(name, 'transactions', columns)
+
+    op.execute(UNIFIED_VIEW_SQL)
+
+
+def downgrade() -> None:
+    op.execute('DROP VIEW IF EXISTS v_unified_transactions')
+    op.execute('ALTER TABLE transactions RENAME TO transactions_partitioned')
+
+    op.execute(
+        CREATE_TABLE_SQL
+        .replace('PRIMARY KEY (transaction_id, created_at)', 'PRIMARY KEY (transaction_id)')
+        .replace(') PARTITION BY RANGE (created_at)', ')')
+        .replace('gateway_transaction_id VARCHAR(255),', 'gateway_transaction_id VARCHAR(255) UNIQUE,')
+    )
+    op.execute(f'INSERT INTO transactions ({COLUMNS}) SELECT {COLUMNS} FROM transactions_partitioned')
+    op.execute('DROP TABLE transactions_partitioned CASCADE')
+
+    for name, columns in INDEXES:
+        if name == 'idx_transactions_gateway_txn':
+            continue
+        op.create_index(name, 'transactions', columns)
+
+    op.execute(UNIFIED_VIEW_SQL)
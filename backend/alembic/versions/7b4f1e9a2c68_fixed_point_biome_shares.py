@@ -0,0 +1,86 @@
+"""Store biome share counts as NUMERIC(18,6) instead of double precision
+
+Revision ID: 7b4f1e9a2c68
+Revises: 5c2d8e4f6a31
+Create Date: 2026-01-07
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '7b4f1e9a2c68'
+down_revision = '5c2d8e4f6a31'
+branch_labels = None
+depends_on = None
+
+
+UNIFIED_VIEW_SQL = '''
+CREATE VIEW v_unified_transactions AS
+SELECT
+    transaction_id,
+    buyer_id,
+    seller_id,
+    land_id,
+    listing_id,
+    transaction_type,
+    amount_bdt,
+    status,
+    platform_fee_bdt,
+    gateway_fee_bdt,
+    gateway_name,
+    gateway_transaction_id,
+    completed_at,
+    created_at,
+    biome,
+    shares,
+    price_per_share_bdt,
+    CASE
+        WHEN transaction_type IN ('BIOME_BUY', 'BIOME_SELL') THEN 'biome'
+        WHEN transaction_type IN ('BUY_NOW', 'FIXED_PRICE', 'AUCTION', 'TRANSFER') THEN 'marketplace'
+        WHEN transaction_type = 'TOPUP' THEN 'wallet'
+        ELSE 'unknown'
+    END AS transaction_source
+FROM transactions
+ORDER BY created_at DESC
+'''
+
+
+def upgrade() -> None:
+    op.execute('DROP VIEW IF EXISTS v_unified_transactions')
+
+    op.alter_column(
+        'transactions', 'shares',
+        type_=sa.Numeric(18, 6),
+        existing_type=sa.Float(),
+        existing_nullable=True,
+        postgresql_using='round(shares::numeric, 6)'
+    )
+    op.alter_column(
+        'biome_holdings', 'shares',
+        type_=sa.Numeric(18, 6),
+        existing_type=sa.Float(),
+        existing_nullable=False,
+        postgresql_using='round(shares::numeric, 6)'
+    )
+
+    op.execute(UNIFIED_VIEW_SQL)
+
+
+def downgrade() -> None:
+    op.execute('DROP VIEW IF EXISTS v_unified_transactions')
+
+    op.alter_column(
+        'biome_holdings', 'shares',
+        type_=sa.Float(),
+        existing_type=sa.Numeric(18, 6),
+        existing_nullable=False
+    )
+    op.alter_column(
+        'transactions', 'shares',
+        type_=sa.Float(),
+        existing_type=sa.Numeric(18, 6),
+        existing_nullable=True
+    )
+
+    op.execute(UNIFIED_VIEW_SQL)
@@ -0,0 +1,28 @@
+"""Add covering index for the per-request account lock check
+
+Revision ID: 9d3a6b2e7f14
+Revises: 7b4f1e9a2c68
+Create Date: 2026-01-08
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '9d3a6b2e7f14'
+down_revision = '7b4f1e9a2c68'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'idx_users_lock_state',
+        'users',
+        ['user_id'],
+        postgresql_include=['locked_until']
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_users_lock_state', table_name='users')
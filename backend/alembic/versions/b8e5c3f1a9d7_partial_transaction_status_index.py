@@ -0,0 +1,32 @@
+"""Replace duplicate transaction status indexes with a partial (status, created_at) index
+
+Revision ID: b8e5c3f1a9d7
+Revises: 9d3a6b2e7f14
+Create Date: 2026-01-09
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'b8e5c3f1a9d7'
+down_revision = '9d3a6b2e7f14'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute('DROP INDEX IF EXISTS ix_transactions_status')
+    op.execute('DROP INDEX IF EXISTS idx_transactions_status')
+    op.create_index(
+        'idx_tx_status_created',
+        'transactions',
+        ['status', 'created_at'],
+        postgresql_where=sa.text("status IN ('PENDING', 'FAILED')")
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_tx_status_created', table_name='transactions')
+    op.create_index('idx_transactions_status', 'transactions', ['status'])
+    op.create_index('ix_transactions_status', 'transactions', ['status'])
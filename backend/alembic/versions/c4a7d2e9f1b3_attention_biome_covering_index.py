@@ -0,0 +1,30 @@
+"""Cover attention score totals per biome with a (biome) INCLUDE (score) index
+
+Revision ID: c4a7d2e9f1b3
+Revises: b8e5c3f1a9d7
+Create Date: 2026-01-10
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'c4a7d2e9f1b3'
+down_revision = 'b8e5c3f1a9d7'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'idx_attention_scores_biome_score',
+        'attention_scores',
+        ['biome'],
+        postgresql_include=['score']
+    )
+    op.drop_index('idx_attention_scores_biome', table_name='attention_scores')
+
+
+def downgrade() -> None:
+    op.create_index('idx_attention_scores_biome', 'attention_scores', ['biome'], unique=False)
+    op.drop_index('idx_attention_scores_biome_score', table_name='attention_scores')
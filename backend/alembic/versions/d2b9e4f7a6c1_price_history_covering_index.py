@@ -0,0 +1,35 @@
+"""Cover biome price history range reads with (biome, timestamp) INCLUDE columns
+
+Revision ID: d2b9e4f7a6c1
+Revises: c4a7d2e9f1b3
+Create Date: 2026-01-12
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'd2b9e4f7a6c1'
+down_revision = 'c4a7d2e9f1b3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'idx_biome_price_history_biome_time_covering',
+        'biome_price_history',
+        ['biome', 'timestamp'],
+        postgresql_include=['price_bdt', 'market_cash_bdt', 'attention_score']
+    )
+    op.drop_index('idx_biome_price_history_biome_time', table_name='biome_price_history')
+
+
+def downgrade() -> None:
+    op.create_index(
+        'idx_biome_price_history_biome_time',
+        'biome_price_history',
+        ['biome', 'timestamp'],
+        unique=False
+    )
+    op.drop_index('idx_biome_price_history_biome_time_covering', table_name='biome_price_history')
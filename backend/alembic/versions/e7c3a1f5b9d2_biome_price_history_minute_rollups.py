@@ -0,0 +1,45 @@
+"""Add biome_price_history_1m for per-minute price history rollups
+
+Revision ID: e7c3a1f5b9d2
+Revises: d2b9e4f7a6c1
+Create Date: 2026-01-13
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = 'e7c3a1f5b9d2'
+down_revision = 'd2b9e4f7a6c1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Reuse existing biome enum created by earlier migrations
+    biome_enum = postgresql.ENUM(
+        'ocean', 'beach', 'plains', 'forest', 'desert', 'mountain', 'snow',
+        name='biome',
+        create_type=False,
+        validate_strings=True
+    )
+
+    op.create_table(
+        'biome_price_history_1m',
+        sa.Column('biome', biome_enum, nullable=False),
+        sa.Column('bucket_start', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('price_avg_bdt', sa.Float(), nullable=False),
+        sa.Column('price_min_bdt', sa.Float(), nullable=False),
+        sa.Column('price_max_bdt', sa.Float(), nullable=False),
+        sa.Column('price_last_bdt', sa.Float(), nullable=False),
+        sa.Column('market_cash_bdt', sa.Integer(), nullable=False),
+        sa.Column('attention_score', sa.Float(), nullable=False),
+        sa.Column('sample_count', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['biome'], ['biome_markets.biome'], ),
+        sa.PrimaryKeyConstraint('biome', 'bucket_start')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('biome_price_history_1m')
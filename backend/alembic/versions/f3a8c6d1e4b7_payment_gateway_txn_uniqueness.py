@@ -0,0 +1,42 @@
+"""Add payment_gateway_txn to keep gateway transaction ids unique
+
+The transactions table is partitioned by created_at, so its old UNIQUE
+constraint on gateway_transaction_id became a plain index. This small
+non-partitioned table restores the guarantee for webhook credits.
+
+Revision ID: f3a8c6d1e4b7
+Revises: e7c3a1f5b9d2
+Create Date: 2026-01-14
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'f3a8c6d1e4b7'
+down_revision = 'e7c3a1f5b9d2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'payment_gateway_txn',
+        sa.Column('gateway_transaction_id', sa.String(255), nullable=False),
+        sa.Column('gateway', sa.String(50), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.PrimaryKeyConstraint('gateway_transaction_id')
+    )
+
+    # Claim every id already credited so redelivered webhooks stay no-ops
+    op.execute('''
+        INSERT INTO payment_gateway_txn (gateway_transaction_id, gateway, created_at)
+        SELECT gateway_transaction_id, COALESCE(MIN(gateway_name), 'unknown'), MIN(created_at)
+        FROM transactions
+        WHERE gateway_transaction_id IS NOT NULL
+        GROUP BY gateway_transaction_id
+    ''')
+
+
+def downgrade() -> None:
+    op.drop_table('payment_gateway_txn')
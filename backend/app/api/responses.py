@@ -0,0 +1,42 @@
+"""
+API response classes
+orjson-backed JSON rendering used as the application's default response class
+"""
+
+from decimal import Decimal
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+def _default(obj: Any) -> Any:
+    """Encode types orjson does not handle natively."""
+    if isinstance(obj, Decimal):
+        return str(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response rendered in a single orjson pass.
+
+    datetime, UUID, enum and numpy values are serialized natively (naive
+    datetimes are treated as UTC); Decimal falls back to its string form.
+    Routes that return one of these directly also bypass FastAPI's
+    ``jsonable_encoder`` walk.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            default=_default,
+            option=(
+                orjson.OPT_UTC_Z
+                | orjson.OPT_NAIVE_UTC
+                | orjson.OPT_NON_STR_KEYS
+                | orjson.OPT_SERIALIZE_NUMPY
+            )
+        )
@@ -5,7 +5,7 @@ Dashboard, user management, system monitoring, and configuration
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, desc, and_, or_, text
+from sqlalchemy import select, update, func, desc, and_, or_, text, Float
 from typing import List, Optional
 from datetime import datetime, timedelta
 import time
@@ -27,9 +27,11 @@ from app.models.transaction import Transaction, TransactionStatus, TransactionTy
 from app.models.chat import ChatSession
 from app.models.chat import Message
 from app.models.audit_log import AuditLog, AuditEventCategory
+from app.models.ban import Ban
 from app.models.admin_config import AdminConfig
 from app.models.announcement import Announcement
 from app.models.report import Report
+from app.services.audit_log_service import audit_log_batcher
 from app.services.cache_service import cache_service
 from app.services.websocket_service import connection_manager
 from app.models.ip_access_control import IPBlacklist, IPWhitelist
@@ -42,24 +44,29 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/admin", tags=["admin"])
 
 
-def create_audit_log(
+async def record_audit_log(
     actor_id: str,
     event_type: str,
     resource_type: str,
     resource_id: str = None,
     action: str = None,
     details: dict = None
-) -> AuditLog:
-    """Helper to create audit logs with correct field structure"""
-    return AuditLog(
-        actor_id=actor_id,
-        event_type=event_type,
-        event_category=AuditEventCategory.ADMIN,
-        resource_type=resource_type,
-        resource_id=str(resource_id) if resource_id else None,
-        action=action,
-        details=details
-    )
+) -> None:
+    """
+    Queue an admin audit log with correct field structure.
+
+    Called after the action's own commit; the row is written by the
+    background audit_log_batcher, so the request never waits on its insert.
+    """
+    await audit_log_batcher.enqueue({
+        "actor_id": actor_id,
+        "event_type": event_type,
+        "event_category": AuditEventCategory.ADMIN,
+        "resource_type": resource_type,
+        "resource_id": str(resource_id) if resource_id else None,
+        "action": action,
+        "details": details,
+    })
 
 
 def _get_db_dump_params() -> dict:
@@ -293,7 +300,7 @@ async def get_dashboard_stats(
         return stats
 
     except Exception as e:
-        logger.error(f"Error getting dashboard stats: {e}")
+        logger.error("Error getting dashboard stats: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to fetch dashboard statistics"
@@ -346,7 +353,7 @@ async def get_revenue_analytics(
         }
 
     except Exception as e:
-        logger.error(f"Error getting revenue analytics: {e}")
+        logger.error("Error getting revenue analytics: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to fetch revenue analytics"
@@ -389,7 +396,7 @@ async def get_user_analytics(
         }
 
     except Exception as e:
-        logger.error(f"Error getting user analytics: {e}")
+        logger.error("Error getting user analytics: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to fetch user analytics"
@@ -447,14 +454,16 @@ async def get_market_trends(
     """Market trends: listing price stats and transaction averages."""
     start = datetime.utcnow() - timedelta(days=days)
 
+    # AVG() over integers is NUMERIC; cast in SQL so the driver hands back
+    # floats rather than Decimals that need converting before encoding.
     listing_stats = await db.execute(
-        select(func.avg(Listing.price_bdt), func.count(Listing.listing_id))
+        select(func.avg(Listing.price_bdt).cast(Float), func.count(Listing.listing_id))
         .where(Listing.created_at >= start)
     )
     avg_listing_price, listings_created = listing_stats.first()
 
     txn_stats = await db.execute(
-        select(func.avg(Transaction.amount_bdt), func.count(Transaction.transaction_id))
+        select(func.avg(Transaction.amount_bdt).cast(Float), func.count(Transaction.transaction_id))
         .where(Transaction.status == "COMPLETED", Transaction.created_at >= start)
     )
     avg_txn_amount, txn_count = txn_stats.first()
@@ -462,9 +471,9 @@ async def get_market_trends(
     return {
         "window_days": days,
         "listings_created": listings_created or 0,
-        "avg_listing_price_bdt": float(avg_listing_price) if avg_listing_price else None,
+        "avg_listing_price_bdt": avg_listing_price or None,
         "transactions_completed": txn_count or 0,
-        "avg_transaction_amount_bdt": float(avg_txn_amount) if avg_txn_amount else None,
+        "avg_transaction_amount_bdt": avg_txn_amount or None,
     }
 
 
@@ -510,7 +519,7 @@ async def get_system_latency(
         await db.execute(text("SELECT 1"))
         db_latency_ms = (time.monotonic() - start) * 1000
     except Exception as e:
-        logger.error(f"DB latency probe failed: {e}")
+        logger.error("DB latency probe failed: %s", e)
 
     if cache_service.client:
         try:
@@ -518,7 +527,7 @@ async def get_system_latency(
             await cache_service.client.ping()
             cache_latency_ms = (time.monotonic() - start) * 1000
         except Exception as e:
-            logger.error(f"Cache latency probe failed: {e}")
+            logger.error("Cache latency probe failed: %s", e)
 
     return {
         "db_latency_ms": db_latency_ms,
@@ -620,7 +629,7 @@ async def get_query_performance(
         await _time_query("listings_count", select(func.count(Listing.listing_id)))
         await _time_query("transactions_count", select(func.count(Transaction.transaction_id)))
     except Exception as e:
-        logger.error(f"Query performance probe failed: {e}")
+        logger.error("Query performance probe failed: %s", e)
 
     return {"timings_ms": timings}
 
@@ -697,7 +706,7 @@ async def get_market_health(
     success_rate = (sold_count / denominator) if denominator else None
 
     avg_time_to_sale_seconds = await db.scalar(
-        select(func.avg(func.extract("epoch", Listing.sold_at - Listing.created_at))).where(
+        select(func.avg(func.extract("epoch", Listing.sold_at - Listing.created_at)).cast(Float)).where(
             Listing.status == ListingStatus.SOLD,
             Listing.sold_at.isnot(None),
             Listing.sold_at >= start,
@@ -759,7 +768,7 @@ async def get_system_performance(
     try:
         await db.execute(select(1))
     except Exception as e:
-        logger.error(f"DB check failed: {e}")
+        logger.error("DB check failed: %s", e)
         db_ok = False
 
     cache_ok = await cache_service.is_healthy()
@@ -836,7 +845,7 @@ async def list_users(
         }
 
     except Exception as e:
-        logger.error(f"Error listing users: {e}")
+        logger.error("Error listing users: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to list users"
@@ -986,8 +995,10 @@ async def update_user(
             db.add(transaction)
             await db.commit()
 
+        await db.commit()
+
         # Log action
-        audit_log = create_audit_log(
+        await record_audit_log(
             actor_id=admin["sub"],
             event_type="update_user",
             resource_type="user",
@@ -995,8 +1006,6 @@ async def update_user(
             action="Admin updated user",
             details={"changes": update_data.dict(exclude_none=True)}
         )
-        db.add(audit_log)
-        await db.commit()
 
         return {
             "message": "User updated successfully",
@@ -1007,7 +1016,7 @@ async def update_user(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error updating user: {e}")
+        logger.error("Error updating user: %s", e)
         await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -1053,7 +1062,7 @@ async def get_system_health(
         }
 
     except Exception as e:
-        logger.error(f"Error checking system health: {e}")
+        logger.error("Error checking system health: %s", e)
         return {
             "status": "error",
             "error": str(e),
@@ -1113,7 +1122,7 @@ async def get_audit_logs(
         }
 
     except Exception as e:
-        logger.error(f"Error fetching audit logs: {e}")
+        logger.error("Error fetching audit logs: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to fetch audit logs"
@@ -1197,7 +1206,7 @@ async def get_marketplace_listings(
         }
 
     except Exception as e:
-        logger.error(f"Error getting marketplace listings: {e}")
+        logger.error("Error getting marketplace listings: %s", e)
         from fastapi import status as http_status
         raise HTTPException(
             status_code=http_status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -1214,18 +1223,23 @@ async def remove_listing(
 ):
     """Remove a fraudulent or inappropriate listing"""
     try:
-        listing = await db.get(Listing, listing_id)
-        if not listing:
-            raise HTTPException(status_code=404, detail="Listing not found")
-
-        # Update listing status
+        # Update listing status in one UPDATE ... RETURNING round trip
         from app.models.listing import ListingStatus as _ListingStatus
         from datetime import datetime, timezone
-        listing.status = _ListingStatus.CANCELLED
-        listing.updated_at = datetime.now(timezone.utc)
+        result = await db.execute(
+            update(Listing)
+            .where(Listing.listing_id == listing_id)
+            .values(status=_ListingStatus.CANCELLED, updated_at=datetime.now(timezone.utc))
+            .returning(Listing.listing_id)
+            .execution_options(synchronize_session="fetch")
+        )
+        if result.scalar_one_or_none() is None:
+            raise HTTPException(status_code=404, detail="Listing not found")
+
+        await db.commit()
 
         # Log action
-        audit_log = create_audit_log(
+        await record_audit_log(
             actor_id=admin["sub"],
             event_type="remove_listing",
             resource_type="listing",
@@ -1233,9 +1247,6 @@ async def remove_listing(
             action="Removed listing",
             details={"reason": reason}
         )
-        db.add(audit_log)
-
-        await db.commit()
 
         return {
             "message": "Listing removed successfully",
@@ -1246,7 +1257,7 @@ async def remove_listing(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error removing listing: {e}")
+        logger.error("Error removing listing: %s", e)
         await db.rollback()
         from fastapi import status as http_status
         raise HTTPException(
@@ -1321,7 +1332,7 @@ async def get_transactions(
         }
 
     except Exception as e:
-        logger.error(f"Error getting transactions: {e}")
+        logger.error("Error getting transactions: %s", e)
         from fastapi import status as http_status
         raise HTTPException(
             status_code=http_status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -1365,8 +1376,10 @@ async def refund_transaction(
         transaction.status = "refunded"
         transaction.updated_at = datetime.utcnow()
 
+        await db.commit()
+
         # Log action
-        audit_log = create_audit_log(
+        await record_audit_log(
             actor_id=admin["sub"],
             event_type="refund_transaction",
             resource_type="transaction",
@@ -1374,9 +1387,6 @@ async def refund_transaction(
             action="Refunded transaction",
             details={"reason": reason, "amount_bdt": transaction.amount_bdt}
         )
-        db.add(audit_log)
-
-        await db.commit()
 
         return {
             "message": "Transaction refunded successfully",
@@ -1388,7 +1398,7 @@ async def refund_transaction(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error refunding transaction: {e}")
+        logger.error("Error refunding transaction: %s", e)
         await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -1436,7 +1446,7 @@ async def export_transactions(
         }
 
     except Exception as e:
-        logger.error(f"Error exporting transactions: {e}")
+        logger.error("Error exporting transactions: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to export transactions"
@@ -1639,7 +1649,7 @@ async def get_economic_settings(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error getting economic settings: {e}")
+        logger.error("Error getting economic settings: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to fetch economic settings"
@@ -2077,8 +2087,10 @@ async def update_economic_settings(
 
         config.updated_at = datetime.utcnow()
 
-        # Log action and commit once
-        audit_log = create_audit_log(
+        await db.commit()
+
+        # Log action
+        await record_audit_log(
             actor_id=admin["sub"],
             event_type="update_economic_settings",
             resource_type="config",
@@ -2086,8 +2098,6 @@ async def update_economic_settings(
             action="Updated economic settings",
             details={"changes": settings.dict(exclude_none=True)}
         )
-        db.add(audit_log)
-        await db.commit()
 
         # Return the full updated config
         return config.to_dict()
@@ -2095,7 +2105,7 @@ async def update_economic_settings(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error updating economic settings: {e}")
+        logger.error("Error updating economic settings: %s", e)
         await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -2201,15 +2211,15 @@ async def update_world_settings(
         config.biome_snow_percent = new_dist["snow"]
 
     config.updated_at = datetime.utcnow()
-    db.add(create_audit_log(
+    await db.commit()
+    await record_audit_log(
         actor_id=admin["sub"],
         event_type="update_world_settings",
         resource_type="config",
         resource_id=str(config.config_id),
         action="Updated world settings",
         details=updates
-    ))
-    await db.commit()
+    )
 
     return {
         "message": "World settings updated successfully",
@@ -2270,15 +2280,15 @@ async def update_cache_settings(
         config.chunk_cache_invalidation_max_age_minutes = settings.chunk_cache_invalidation_max_age_minutes
 
     config.updated_at = datetime.utcnow()
-    db.add(create_audit_log(
+    await db.commit()
+    await record_audit_log(
         actor_id=admin["sub"],
         event_type="update_cache_settings",
         resource_type="config",
         resource_id=str(config.config_id),
         action="Updated cache settings",
         details=updates,
-    ))
-    await db.commit()
+    )
 
     return {
         "message": "Cache settings updated successfully",
@@ -2368,15 +2378,15 @@ async def update_testing_debug_settings(
         config.perf_test_requests_per_second = settings.perf_test_requests_per_second
 
     config.updated_at = datetime.utcnow()
-    db.add(create_audit_log(
+    await db.commit()
+    await record_audit_log(
         actor_id=admin["sub"],
         event_type="update_testing_debug_settings",
         resource_type="config",
         resource_id=str(config.config_id),
         action="Updated testing and debugging settings",
         details=updates,
-    ))
-    await db.commit()
+    )
 
     return {
         "message": "Testing and debugging settings updated successfully",
@@ -2439,7 +2449,7 @@ async def get_land_analytics(
         }
 
     except Exception as e:
-        logger.error(f"Error getting land analytics: {e}")
+        logger.error("Error getting land analytics: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to fetch land analytics"
@@ -2469,8 +2479,10 @@ async def transfer_land_ownership(
         land.for_sale = False
         land.updated_at = datetime.utcnow()
 
+        await db.commit()
+
         # Log action
-        audit_log = create_audit_log(
+        await record_audit_log(
             actor_id=admin["sub"],
             event_type="transfer_land",
             resource_type="land",
@@ -2478,9 +2490,6 @@ async def transfer_land_ownership(
             action="Transferred land ownership",
             details={"old_owner_id": str(old_owner_id) if old_owner_id else None, "new_owner_id": new_owner_id, "reason": reason}
         )
-        db.add(audit_log)
-
-        await db.commit()
 
         return {
             "message": "Land transferred successfully",
@@ -2493,7 +2502,7 @@ async def transfer_land_ownership(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error transferring land: {e}")
+        logger.error("Error transferring land: %s", e)
         await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -2519,8 +2528,10 @@ async def reclaim_land(
         land.for_sale = False
         land.updated_at = datetime.utcnow()
 
+        await db.commit()
+
         # Log action
-        audit_log = create_audit_log(
+        await record_audit_log(
             actor_id=admin["sub"],
             event_type="reclaim_land",
             resource_type="land",
@@ -2528,9 +2539,6 @@ async def reclaim_land(
             action="Reclaimed land",
             details={"previous_owner_id": str(old_owner_id) if old_owner_id else None, "reason": reason}
         )
-        db.add(audit_log)
-
-        await db.commit()
 
         return {
             "message": "Land reclaimed successfully",
@@ -2542,7 +2550,7 @@ async def reclaim_land(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error reclaiming land: {e}")
+        logger.error("Error reclaiming land: %s", e)
         await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -2595,8 +2603,10 @@ async def suspend_user(
         user.suspended_until = suspended_until
         user.updated_at = datetime.utcnow()
 
+        await db.commit()
+
         # Log action
-        audit_log = create_audit_log(
+        await record_audit_log(
             actor_id=admin["sub"],
             event_type="suspend_user",
             resource_type="user",
@@ -2604,9 +2614,6 @@ async def suspend_user(
             action="Suspended user",
             details={"reason": request.reason, "duration_days": request.duration_days or "permanent"}
         )
-        db.add(audit_log)
-
-        await db.commit()
 
         return {
             "message": "User suspended successfully",
@@ -2618,7 +2625,7 @@ async def suspend_user(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error suspending user: {e}")
+        logger.error("Error suspending user: %s", e)
         await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -2643,8 +2650,10 @@ async def unsuspend_user(
         user.suspended_until = None
         user.updated_at = datetime.utcnow()
 
+        await db.commit()
+
         # Log action
-        audit_log = create_audit_log(
+        await record_audit_log(
             actor_id=admin["sub"],
             event_type="unsuspend_user",
             resource_type="user",
@@ -2652,9 +2661,6 @@ async def unsuspend_user(
             action="Removed user suspension",
             details={}
         )
-        db.add(audit_log)
-
-        await db.commit()
 
         return {
             "message": "User suspension removed successfully",
@@ -2664,7 +2670,7 @@ async def unsuspend_user(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error unsuspending user: {e}")
+        logger.error("Error unsuspending user: %s", e)
         await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -2713,8 +2719,10 @@ async def ban_user(
             user.suspension_reason = f"Banned: {request.reason}"
             user.suspended_until = expires_at
 
+        await db.commit()
+
         # Log action
-        audit_log = create_audit_log(
+        await record_audit_log(
             actor_id=admin["sub"],
             event_type="ban_user",
             resource_type="user",
@@ -2722,9 +2730,6 @@ async def ban_user(
             action="Banned user",
             details={"ban_type": request.ban_type, "reason": request.reason}
         )
-        db.add(audit_log)
-
-        await db.commit()
 
         return {
             "message": "User banned successfully",
@@ -2737,7 +2742,7 @@ async def ban_user(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error banning user: {e}")
+        logger.error("Error banning user: %s", e)
         await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -2753,29 +2758,31 @@ async def unban_user(
 ):
     """Remove all active bans from a user"""
     try:
-        # Deactivate all active bans
+        # Deactivate all active bans with a single UPDATE ... RETURNING
         result = await db.execute(
-            select(Ban).where(
-                and_(Ban.user_id == user_id, Ban.is_active == True)
-            )
+            update(Ban)
+            .where(and_(Ban.user_id == user_id, Ban.is_active == True))
+            .values(is_active=False)
+            .returning(Ban.ban_id)
+            .execution_options(synchronize_session="fetch")
         )
         bans = result.scalars().all()
 
         if not bans:
             raise HTTPException(status_code=404, detail="No active bans found for this user")
 
-        for ban in bans:
-            ban.is_active = False
-
         # Also remove suspension if exists
-        user = await db.get(User, user_id)
-        if user:
-            user.is_suspended = False
-            user.suspension_reason = None
-            user.suspended_until = None
+        await db.execute(
+            update(User)
+            .where(User.user_id == user_id)
+            .values(is_suspended=False, suspension_reason=None, suspended_until=None)
+            .execution_options(synchronize_session="fetch")
+        )
+
+        await db.commit()
 
         # Log action
-        audit_log = create_audit_log(
+        await record_audit_log(
             actor_id=admin["sub"],
             event_type="unban_user",
             resource_type="user",
@@ -2783,9 +2790,6 @@ async def unban_user(
             action="Unbanned user",
             details={"bans_removed": len(bans)}
         )
-        db.add(audit_log)
-
-        await db.commit()
 
         return {
             "message": "User unbanned successfully",
@@ -2796,7 +2800,7 @@ async def unban_user(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error unbanning user: {e}")
+        logger.error("Error unbanning user: %s", e)
         await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -2887,7 +2891,7 @@ async def get_user_activity(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error getting user activity: {e}")
+        logger.error("Error getting user activity: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to fetch user activity"
@@ -3047,7 +3051,7 @@ async def get_feature_toggles(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error getting feature toggles: {e}")
+        logger.error("Error getting feature toggles: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to fetch feature toggles"
@@ -3087,8 +3091,10 @@ async def update_feature_toggles(
         config.updated_at = datetime.utcnow()
         await db.commit()
 
+        await db.commit()
+
         # Log action
-        audit_log = create_audit_log(
+        await record_audit_log(
             actor_id=admin["sub"],
             event_type="update_feature_toggles",
             resource_type="config",
@@ -3096,8 +3102,6 @@ async def update_feature_toggles(
             action="Updated feature toggles",
             details={"changes": settings.dict(exclude_none=True)}
         )
-        db.add(audit_log)
-        await db.commit()
 
         return {
             "message": "Feature toggles updated successfully",
@@ -3107,7 +3111,7 @@ async def update_feature_toggles(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error updating feature toggles: {e}")
+        logger.error("Error updating feature toggles: %s", e)
         await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -3145,7 +3149,7 @@ async def get_system_limits(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error getting system limits: {e}")
+        logger.error("Error getting system limits: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to fetch system limits"
@@ -3203,8 +3207,10 @@ async def update_system_limits(
         config.updated_at = datetime.utcnow()
         await db.commit()
 
+        await db.commit()
+
         # Log action
-        audit_log = create_audit_log(
+        await record_audit_log(
             actor_id=admin["sub"],
             event_type="update_system_limits",
             resource_type="config",
@@ -3212,8 +3218,6 @@ async def update_system_limits(
             action="Updated system limits",
             details={"changes": settings.dict(exclude_none=True)}
         )
-        db.add(audit_log)
-        await db.commit()
 
         return {
             "message": "System limits updated successfully",
@@ -3223,7 +3227,7 @@ async def update_system_limits(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error updating system limits: {e}")
+        logger.error("Error updating system limits: %s", e)
         await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -3480,7 +3484,8 @@ async def update_security_settings(
     config.updated_at = datetime.utcnow()
     await db.commit()
 
-    audit_log = create_audit_log(
+    await db.commit()
+    await record_audit_log(
         actor_id=admin["sub"],
         event_type="update_security_settings",
         resource_type="config",
@@ -3488,8 +3493,6 @@ async def update_security_settings(
         action="Updated security settings",
         details={"changes": settings.dict(exclude_none=True)}
     )
-    db.add(audit_log)
-    await db.commit()
 
     return {
         "message": "Security settings updated successfully",
@@ -3574,7 +3577,8 @@ async def update_payment_settings(
     config.updated_at = datetime.utcnow()
     await db.commit()
 
-    audit_log = create_audit_log(
+    await db.commit()
+    await record_audit_log(
         actor_id=admin["sub"],
         event_type="update_payment_settings",
         resource_type="config",
@@ -3582,8 +3586,6 @@ async def update_payment_settings(
         action="Updated payment settings",
         details={"changes": settings.dict(exclude_none=True)}
     )
-    db.add(audit_log)
-    await db.commit()
 
     return {
         "message": "Payment settings updated successfully",
@@ -3641,7 +3643,8 @@ async def update_email_settings(
     config.updated_at = datetime.utcnow()
     await db.commit()
 
-    audit_log = create_audit_log(
+    await db.commit()
+    await record_audit_log(
         actor_id=admin["sub"],
         event_type="update_email_settings",
         resource_type="config",
@@ -3649,8 +3652,6 @@ async def update_email_settings(
         action="Updated email settings",
         details={"changes": settings.dict(exclude_none=True, exclude={"smtp_password"}), "password_updated": settings.smtp_password is not None}
     )
-    db.add(audit_log)
-    await db.commit()
 
     return {
         "message": "Email settings updated successfully",
@@ -3663,7 +3664,7 @@ def _set_global_log_level(level: str) -> None:
     try:
         logging.getLogger().setLevel(level.upper())
     except Exception as e:
-        logger.error(f"Failed to set global log level to {level}: {e}")
+        logger.error("Failed to set global log level to %s: %s", level, e)
 
 
 @router.patch("/config/logging")
@@ -3696,7 +3697,8 @@ async def update_logging_settings(
     config.updated_at = datetime.utcnow()
     await db.commit()
 
-    audit_log = create_audit_log(
+    await db.commit()
+    await record_audit_log(
         actor_id=admin["sub"],
         event_type="update_logging_settings",
         resource_type="config",
@@ -3704,8 +3706,6 @@ async def update_logging_settings(
         action="Updated logging settings",
         details={"changes": settings.dict(exclude_none=True)}
     )
-    db.add(audit_log)
-    await db.commit()
 
     return {
         "message": "Logging settings updated successfully",
@@ -3756,7 +3756,8 @@ async def update_notification_settings(
     config.updated_at = datetime.utcnow()
     await db.commit()
 
-    audit_log = create_audit_log(
+    await db.commit()
+    await record_audit_log(
         actor_id=admin["sub"],
         event_type="update_notification_settings",
         resource_type="config",
@@ -3764,8 +3765,6 @@ async def update_notification_settings(
         action="Updated notification settings",
         details={"changes": settings.dict(exclude_none=True)}
     )
-    db.add(audit_log)
-    await db.commit()
 
     return {
         "message": "Notification settings updated successfully",
@@ -3813,7 +3812,8 @@ async def update_chat_settings(
     config.updated_at = datetime.utcnow()
     await db.commit()
 
-    audit_log = create_audit_log(
+    await db.commit()
+    await record_audit_log(
         actor_id=admin["sub"],
         event_type="update_chat_settings",
         resource_type="config",
@@ -3821,8 +3821,6 @@ async def update_chat_settings(
         action="Updated chat settings",
         details={"changes": settings.dict(exclude_none=True)}
     )
-    db.add(audit_log)
-    await db.commit()
 
     return {
         "message": "Chat settings updated successfully",
@@ -3859,7 +3857,8 @@ async def update_announcement_settings(
     config.updated_at = datetime.utcnow()
     await db.commit()
 
-    audit_log = create_audit_log(
+    await db.commit()
+    await record_audit_log(
         actor_id=admin["sub"],
         event_type="update_announcement_settings",
         resource_type="config",
@@ -3867,8 +3866,6 @@ async def update_announcement_settings(
         action="Updated announcement settings",
         details={"changes": settings.dict(exclude_none=True)}
     )
-    db.add(audit_log)
-    await db.commit()
 
     return {
         "message": "Announcement settings updated successfully",
@@ -3884,14 +3881,14 @@ async def run_migrations_upgrade(
 ):
     """Run Alembic upgrade to the specified revision (default head)."""
     success, stdout, stderr = _run_alembic(["upgrade", revision])
-    db.add(create_audit_log(
+    await db.commit()
+    await record_audit_log(
         actor_id=admin["sub"],
         event_type="migration",
         resource_type="database",
         action="upgrade",
         details={"revision": revision, "success": success, "stderr": stderr[:500] if stderr else ""}
-    ))
-    await db.commit()
+    )
     if not success:
         raise HTTPException(status_code=500, detail=f"Alembic upgrade failed: {stderr.strip()}")
     return {"status": "ok", "revision": revision, "stdout": stdout}
@@ -3906,14 +3903,14 @@ async def run_migrations_downgrade(
     """Downgrade Alembic by a number of steps (default 1)."""
     target = f"-{steps}"
     success, stdout, stderr = _run_alembic(["downgrade", target])
-    db.add(create_audit_log(
+    await db.commit()
+    await record_audit_log(
         actor_id=admin["sub"],
         event_type="migration",
         resource_type="database",
         action="downgrade",
         details={"steps": steps, "success": success, "stderr": stderr[:500] if stderr else ""}
-    ))
-    await db.commit()
+    )
     if not success:
         raise HTTPException(status_code=500, detail=f"Alembic downgrade failed: {stderr.strip()}")
     return {"status": "ok", "steps": steps, "stdout": stdout}
@@ -3957,14 +3954,14 @@ async def backup_database(
 
     success, stdout, stderr = _run_pg_command(cmd, params["password"])
 
-    db.add(create_audit_log(
+    await db.commit()
+    await record_audit_log(
         actor_id=admin["sub"],
         event_type="db_backup",
         resource_type="database",
         action="backup",
         details={"file": str(target), "success": success, "stderr": stderr[:500] if stderr else ""}
-    ))
-    await db.commit()
+    )
 
     if not success:
         raise HTTPException(status_code=500, detail=f"Backup failed: {stderr.strip()}")
@@ -4000,14 +3997,14 @@ async def restore_database(
 
     success, stdout, stderr = _run_pg_command(cmd, params["password"])
 
-    db.add(create_audit_log(
+    await db.commit()
+    await record_audit_log(
         actor_id=admin["sub"],
         event_type="db_restore",
         resource_type="database",
         action="restore",
         details={"file": str(source), "success": success, "stderr": stderr[:500] if stderr else ""}
-    ))
-    await db.commit()
+    )
 
     if not success:
         raise HTTPException(status_code=500, detail=f"Restore failed: {stderr.strip()}")
@@ -4025,7 +4022,7 @@ async def maintenance_health(
     try:
         await db.execute(text("SELECT 1"))
     except Exception as e:
-        logger.error(f"DB health check failed: {e}")
+        logger.error("DB health check failed: %s", e)
         db_ok = False
 
     cache_ok = await cache_service.is_healthy()
@@ -4053,7 +4050,7 @@ async def get_db_pool_stats(
     try:
         await db.execute(text("SELECT 1"))
     except Exception as e:
-        logger.error(f"DB pool check failed: {e}")
+        logger.error("DB pool check failed: %s", e)
         db_ok = False
 
     return {"database_ok": db_ok, "pool": _get_pool_stats()}
@@ -4072,17 +4069,17 @@ async def vacuum_database(
     """Run VACUUM to reclaim storage (PostgreSQL)."""
     try:
         await _run_maintenance(db, "VACUUM")
-        db.add(create_audit_log(
+        await db.commit()
+        await record_audit_log(
             actor_id=admin["sub"],
             event_type="db_maintenance",
             resource_type="database",
             action="vacuum",
             details={"sql": "VACUUM"}
-        ))
-        await db.commit()
+        )
         return {"status": "ok", "action": "vacuum"}
     except Exception as e:
-        logger.error(f"VACUUM failed: {e}")
+        logger.error("VACUUM failed: %s", e)
         await db.rollback()
         raise HTTPException(status_code=500, detail="VACUUM failed")
 
@@ -4095,17 +4092,17 @@ async def analyze_database(
     """Run ANALYZE to update planner statistics."""
     try:
         await _run_maintenance(db, "ANALYZE")
-        db.add(create_audit_log(
+        await db.commit()
+        await record_audit_log(
             actor_id=admin["sub"],
             event_type="db_maintenance",
             resource_type="database",
             action="analyze",
             details={"sql": "ANALYZE"}
-        ))
-        await db.commit()
+        )
         return {"status": "ok", "action": "analyze"}
     except Exception as e:
-        logger.error(f"ANALYZE failed: {e}")
+        logger.error("ANALYZE failed: %s", e)
         await db.rollback()
         raise HTTPException(status_code=500, detail="ANALYZE failed")
 
@@ -4128,17 +4125,17 @@ async def reindex_database(
 
     try:
         await _run_maintenance(db, sql)
-        db.add(create_audit_log(
+        await db.commit()
+        await record_audit_log(
             actor_id=admin["sub"],
             event_type="db_maintenance",
             resource_type="database",
             action="reindex",
             details={"target": target}
-        ))
-        await db.commit()
+        )
         return {"status": "ok", "action": "reindex", "target": target}
     except Exception as e:
-        logger.error(f"REINDEX failed: {e}")
+        logger.error("REINDEX failed: %s", e)
         await db.rollback()
         raise HTTPException(status_code=500, detail="REINDEX failed")
 
@@ -4241,14 +4238,14 @@ async def clear_chunk_cache(
 
     deleted = await cache_service.delete_by_prefix(prefix)
 
-    db.add(create_audit_log(
+    await db.commit()
+    await record_audit_log(
         actor_id=admin["sub"],
         event_type="cache_clear",
         resource_type="cache",
         action="clear_chunk_cache",
         details={"prefix": prefix, "deleted": deleted},
-    ))
-    await db.commit()
+    )
 
     return {
         "message": "Chunk cache cleared",
@@ -4436,7 +4433,8 @@ async def add_ip_blacklist_entry(
     )
     db.add(record)
 
-    audit_log = create_audit_log(
+    await db.commit()
+    await record_audit_log(
         actor_id=admin["sub"],
         event_type="ip_blacklist_add",
         resource_type="ip_access",
@@ -4444,9 +4442,6 @@ async def add_ip_blacklist_entry(
         action="Blacklisted IP",
         details=record.reason and {"reason": record.reason}
     )
-    db.add(audit_log)
-
-    await db.commit()
     await db.refresh(record)
     ip_access_service.invalidate_cache()
 
@@ -4469,7 +4464,8 @@ async def remove_ip_blacklist_entry(
 
     await db.delete(record)
 
-    audit_log = create_audit_log(
+    await db.commit()
+    await record_audit_log(
         actor_id=admin["sub"],
         event_type="ip_blacklist_remove",
         resource_type="ip_access",
@@ -4477,9 +4473,6 @@ async def remove_ip_blacklist_entry(
         action="Removed blacklisted IP",
         details={"ip": record.ip}
     )
-    db.add(audit_log)
-
-    await db.commit()
     ip_access_service.invalidate_cache()
 
     return {"message": "IP removed from blacklist", "entry_id": str(entry_id)}
@@ -4506,7 +4499,8 @@ async def add_ip_whitelist_entry(
     )
     db.add(record)
 
-    audit_log = create_audit_log(
+    await db.commit()
+    await record_audit_log(
         actor_id=admin["sub"],
         event_type="ip_whitelist_add",
         resource_type="ip_access",
@@ -4514,9 +4508,6 @@ async def add_ip_whitelist_entry(
         action="Whitelisted IP",
         details=record.reason and {"reason": record.reason}
     )
-    db.add(audit_log)
-
-    await db.commit()
     await db.refresh(record)
     ip_access_service.invalidate_cache()
 
@@ -4539,7 +4530,8 @@ async def remove_ip_whitelist_entry(
 
     await db.delete(record)
 
-    audit_log = create_audit_log(
+    await db.commit()
+    await record_audit_log(
         actor_id=admin["sub"],
         event_type="ip_whitelist_remove",
         resource_type="ip_access",
@@ -4547,9 +4539,6 @@ async def remove_ip_whitelist_entry(
         action="Removed whitelisted IP",
         details={"ip": record.ip}
     )
-    db.add(audit_log)
-
-    await db.commit()
     ip_access_service.invalidate_cache()
 
     return {"message": "IP removed from whitelist", "entry_id": str(entry_id)}
@@ -4609,7 +4598,7 @@ async def get_chat_messages(
         }
 
     except Exception as e:
-        logger.error(f"Error getting chat messages: {e}")
+        logger.error("Error getting chat messages: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to fetch chat messages"
@@ -4634,8 +4623,10 @@ async def delete_message(
         # Delete the message
         await db.delete(message)
 
+        await db.commit()
+
         # Log action
-        audit_log = create_audit_log(
+        await record_audit_log(
             actor_id=admin["sub"],
             event_type="delete_message",
             resource_type="message",
@@ -4643,9 +4634,6 @@ async def delete_message(
             action="Deleted message",
             details={"sender_id": str(sender_id), "reason": reason}
         )
-        db.add(audit_log)
-
-        await db.commit()
 
         return {
             "message": "Message deleted successfully",
@@ -4656,7 +4644,7 @@ async def delete_message(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error deleting message: {e}")
+        logger.error("Error deleting message: %s", e)
         await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -4696,8 +4684,10 @@ async def mute_user(
         )
         db.add(ban)
 
+        await db.commit()
+
         # Log action
-        audit_log = create_audit_log(
+        await record_audit_log(
             actor_id=admin["sub"],
             event_type="mute_user",
             resource_type="user",
@@ -4705,9 +4695,6 @@ async def mute_user(
             action="Muted user",
             details={"duration_minutes": request.duration_minutes, "reason": reason}
         )
-        db.add(audit_log)
-
-        await db.commit()
 
         return {
             "message": "User muted successfully",
@@ -4720,7 +4707,7 @@ async def mute_user(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error muting user: {e}")
+        logger.error("Error muting user: %s", e)
         await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -4784,7 +4771,7 @@ async def get_reports(
         }
 
     except Exception as e:
-        logger.error(f"Error getting reports: {e}")
+        logger.error("Error getting reports: %s", e)
         from fastapi import status as http_status
         raise HTTPException(
             status_code=http_status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -4816,8 +4803,10 @@ async def resolve_report(
         report.resolution_notes = request.notes
         report.resolved_at = datetime.utcnow()
 
+        await db.commit()
+
         # Log action
-        audit_log = create_audit_log(
+        await record_audit_log(
             actor_id=admin["sub"],
             event_type="resolve_report",
             resource_type="report",
@@ -4825,9 +4814,6 @@ async def resolve_report(
             action=f"Report {request.action}",
             details={"resolution": request.action, "notes": request.notes}
         )
-        db.add(audit_log)
-
-        await db.commit()
 
         return {
             "message": f"Report {request.action} successfully",
@@ -4839,7 +4825,7 @@ async def resolve_report(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error resolving report: {e}")
+        logger.error("Error resolving report: %s", e)
         await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -4919,7 +4905,7 @@ async def get_announcements(
         }
 
     except Exception as e:
-        logger.error(f"Error getting announcements: {e}")
+        logger.error("Error getting announcements: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to fetch announcements"
@@ -4946,8 +4932,10 @@ async def create_announcement(
         )
         db.add(announcement)
 
+        await db.commit()
+
         # Log action
-        audit_log = create_audit_log(
+        await record_audit_log(
             actor_id=admin["sub"],
             event_type="create_announcement",
             resource_type="announcement",
@@ -4955,9 +4943,6 @@ async def create_announcement(
             action="Created announcement",
             details={"title": request.title}
         )
-        db.add(audit_log)
-
-        await db.commit()
         await db.refresh(announcement)
 
         return {
@@ -4967,7 +4952,7 @@ async def create_announcement(
         }
 
     except Exception as e:
-        logger.error(f"Error creating announcement: {e}")
+        logger.error("Error creating announcement: %s", e)
         await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -4997,8 +4982,10 @@ async def update_announcement(
         announcement.start_date = request.start_date
         announcement.end_date = request.end_date
 
+        await db.commit()
+
         # Log action
-        audit_log = create_audit_log(
+        await record_audit_log(
             actor_id=admin["sub"],
             event_type="update_announcement",
             resource_type="announcement",
@@ -5006,9 +4993,6 @@ async def update_announcement(
             action="Updated announcement",
             details={"title": request.title}
         )
-        db.add(audit_log)
-
-        await db.commit()
 
         return {
             "message": "Announcement updated successfully",
@@ -5018,7 +5002,7 @@ async def update_announcement(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error updating announcement: {e}")
+        logger.error("Error updating announcement: %s", e)
         await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -5041,8 +5025,10 @@ async def delete_announcement(
         title = announcement.title
         await db.delete(announcement)
 
+        await db.commit()
+
         # Log action
-        audit_log = create_audit_log(
+        await record_audit_log(
             actor_id=admin["sub"],
             event_type="delete_announcement",
             resource_type="announcement",
@@ -5050,9 +5036,6 @@ async def delete_announcement(
             action="Deleted announcement",
             details={"title": title}
         )
-        db.add(audit_log)
-
-        await db.commit()
 
         return {
             "message": "Announcement deleted successfully",
@@ -5062,7 +5045,7 @@ async def delete_announcement(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error deleting announcement: {e}")
+        logger.error("Error deleting announcement: %s", e)
         await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -5144,8 +5127,10 @@ async def send_broadcast(
             if success:
                 sent_count += 1
 
+        await db.commit()
+
         # Log action
-        audit_log = create_audit_log(
+        await record_audit_log(
             actor_id=admin["sub"],
             event_type="send_broadcast",
             resource_type="broadcast",
@@ -5157,11 +5142,8 @@ async def send_broadcast(
                 "recipients_count": sent_count
             }
         )
-        db.add(audit_log)
-
-        await db.commit()
 
-        logger.info(f"Broadcast sent to {sent_count} users (target: {request.target})")
+        logger.info("Broadcast sent to %s users (target: %s)", sent_count, request.target)
 
         return {
             "message": "Broadcast message sent successfully",
@@ -5171,7 +5153,7 @@ async def send_broadcast(
         }
 
     except Exception as e:
-        logger.error(f"Error sending broadcast: {e}")
+        logger.error("Error sending broadcast: %s", e)
         await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -5237,7 +5219,7 @@ async def get_all_bans(
         }
 
     except Exception as e:
-        logger.error(f"Error getting bans: {e}")
+        logger.error("Error getting bans: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to fetch bans"
@@ -5298,7 +5280,7 @@ async def get_security_logs(
         }
 
     except Exception as e:
-        logger.error(f"Error getting security logs: {e}")
+        logger.error("Error getting security logs: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to fetch security logs"
@@ -7,9 +7,10 @@ from fastapi import APIRouter, Depends, HTTPException, status, Response, Request
 from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from sqlalchemy.orm import undefer
 import logging
 import secrets
-from datetime import datetime
+from datetime import datetime, timezone
 import re
 
 from app.db.session import get_db
@@ -20,7 +21,7 @@ from app.services.auth_service import auth_service
 from app.services.cache_service import cache_service
 from app.services.land_allocation_service import land_allocation_service
 from app.config import settings, CACHE_TTLS
-from app.dependencies import get_current_user
+from app.dependencies import get_current_user, invalidate_user_state
 from app.services.websocket_service import connection_manager
 
 logger = logging.getLogger(__name__)
@@ -181,9 +182,11 @@ async def login(
     """
     access_minutes, refresh_days, _, login_policy = await _get_security_settings(db)
 
-    # Find user by email
+    # Find user by email (password_hash is deferred on the model)
     result = await db.execute(
-        select(User).where(User.email == user_data.email)
+        select(User)
+        .options(undefer(User.password_hash))
+        .where(User.email == user_data.email)
     )
     user = result.scalar_one_or_none()
 
@@ -195,7 +198,8 @@ async def login(
         )
 
     # Check if account is locked
-    if user.is_locked():
+    now = datetime.now(timezone.utc)
+    if user.is_locked(now):
         logger.warning(f"Login attempt on locked account: {user.username}")
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -207,8 +211,10 @@ async def login(
         user.add_failed_login(
             max_attempts=login_policy["max_attempts"],
             lockout_minutes=login_policy["lockout_duration_minutes"],
+            now=now,
         )
         await db.commit()
+        await invalidate_user_state(user.user_id)
         logger.warning(f"Failed login attempt for user: {user.username}")
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -218,6 +224,7 @@ async def login(
     # Reset failed login attempts on successful login
     user.reset_login_attempts()
     await db.commit()
+    await invalidate_user_state(user.user_id)
 
     # Check for existing session to enforce single-device rule
     previous_session = await cache_service.get(f"session:{user.user_id}")
@@ -244,14 +251,13 @@ async def login(
 
     # Generate tokens with session binding
     session_id = secrets.token_urlsafe(32)
-    access_token = auth_service.create_access_token(
+    access_token, refresh_token = auth_service.create_token_pair(
         user_id=str(user.user_id),
         email=user.email,
         role=user.role.value,
         additional_claims={"session_id": session_id},
         expires_minutes=access_minutes,
     )
-    refresh_token = auth_service.create_refresh_token()
 
     # Store refresh token in Redis with user_id as key
     await cache_service.set(
@@ -280,7 +286,7 @@ async def login(
         access_token=access_token,
         token_type="Bearer",
         expires_in=access_expires_seconds,
-        user=UserResponse.model_validate(user.to_dict()),
+        user=UserResponse.model_validate(user),
         previous_session_terminated=previous_session_terminated
     )
 
@@ -333,7 +339,7 @@ async def refresh_token(
         async for key in cache_service.client.scan_iter("refresh_token:*"):
             stored_token = await cache_service.get(key)
             if stored_token == refresh_token:
-                user_id = key.split(":")[1]
+                user_id = key.decode().split(":")[1]
                 break
 
     if not user_id:
@@ -369,14 +375,13 @@ async def refresh_token(
     refresh_ttl_seconds = refresh_days * 24 * 60 * 60
 
     # Generate new tokens bound to existing session
-    new_access_token = auth_service.create_access_token(
+    new_access_token, new_refresh_token = auth_service.create_token_pair(
         user_id=str(user.user_id),
         email=user.email,
         role=user.role.value,
         additional_claims={"session_id": session_data["session_id"]},
         expires_minutes=access_minutes,
     )
-    new_refresh_token = auth_service.create_refresh_token()
 
     # Store new refresh token
     await cache_service.set(
@@ -398,7 +403,7 @@ async def refresh_token(
         access_token=new_access_token,
         token_type="Bearer",
         expires_in=access_expires_seconds,
-        user=UserResponse.model_validate(user.to_dict())
+        user=UserResponse.model_validate(user)
     )
 
     json_response = JSONResponse(
@@ -467,4 +472,4 @@ async def get_current_user_info(
             detail="User not found"
         )
 
-    return UserResponse.model_validate(user.to_dict())
+    return UserResponse.model_validate(user)
@@ -3,16 +3,15 @@ Biome Market Endpoints
 API routes for biome trading, portfolio, and market data
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
 from typing import Optional
 import logging
 import uuid
 
 from app.db.session import get_db
 from app.models.land import Biome
-from app.models.admin_config import AdminConfig
+from app.models.transaction import Transaction
 from app.schemas.biome_trading_schema import (
     BiomeMarketResponse,
     AllBiomeMarketsResponse,
@@ -24,9 +23,14 @@ from app.schemas.biome_trading_schema import (
     BiomePriceHistoryResponse,
     TrackAttentionRequest,
     MarketStatisticsResponse,
-    BiomeStatistics
+    BiomeStatistics,
+    BIOME_MARKET_LIST_ADAPTER,
+    ALL_BIOME_MARKETS_ADAPTER,
+    BIOME_TRANSACTION_LIST_ADAPTER,
+    PRICE_HISTORY_LIST_ADAPTER
 )
 from app.dependencies import get_current_user
+from app.services.admin_config_service import admin_config_cache
 from app.services.biome_market_service import biome_market_service
 from app.services.biome_trading_service import biome_trading_service
 from app.services.attention_tracking_service import attention_tracking_service
@@ -47,8 +51,7 @@ def _rate_limit_identifier(request: Optional[Request], current_user: Optional[di
 
 
 async def _enforce_biome_trade_rate_limit(db: AsyncSession, request: Request, current_user: Optional[dict]):
-    cfg_res = await db.execute(select(AdminConfig).limit(1))
-    config = cfg_res.scalar_one_or_none()
+    config = await admin_config_cache.get()
     limit = config.biome_trades_per_minute if config else None
     if not limit:
         return
@@ -84,16 +87,25 @@ async def get_all_markets(db: AsyncSession = Depends(get_db)):
     
     Returns current prices, market cash, and attention scores for all biomes.
     """
+    # Concurrent requests between market updates share one serialized payload
+    seq, cached = biome_market_service.get_markets_snapshot()
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
     try:
-        markets = await biome_market_service.get_all_markets(db)
+        market_rows = list((await biome_market_service.get_market_rows(db)).values())
         
-        total_cash = sum(market.market_cash_bdt for market in markets)
+        total_cash = sum(row["market_cash_bdt"] for row in market_rows)
         
-        return AllBiomeMarketsResponse(
-            markets=[BiomeMarketResponse(**market.to_dict()) for market in markets],
+        payload = AllBiomeMarketsResponse(
+            markets=BIOME_MARKET_LIST_ADAPTER.validate_python(market_rows),
             total_market_cash=total_cash,
             timestamp=datetime.utcnow().isoformat()
         )
+        # Serialize once in pydantic-core instead of re-validating via response_model
+        content = ALL_BIOME_MARKETS_ADAPTER.dump_json(payload)
+        biome_market_service.store_markets_snapshot(seq, content)
+        return Response(content=content, media_type="application/json")
     except Exception as e:
         logger.error(f"Failed to get markets: {e}")
         raise HTTPException(
@@ -121,8 +133,10 @@ async def get_market(
         )
 
     try:
-        market = await biome_market_service.get_market(db, biome_enum)
-        return BiomeMarketResponse(**market.to_dict())
+        market_row = (await biome_market_service.get_market_rows(db)).get(biome_enum.value)
+        if market_row is None:
+            raise ValueError(f"Market not found for biome: {biome_enum.value}")
+        return BiomeMarketResponse(**market_row)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -162,7 +176,7 @@ async def get_price_history(
     try:
         history = await biome_market_service.get_price_history(db, biome_enum, hours)
         
-        history_points = [
+        history_points = PRICE_HISTORY_LIST_ADAPTER.validate_python([
             {
                 "timestamp": record.timestamp.isoformat(),
                 "price_bdt": record.price_bdt,
@@ -170,18 +184,19 @@ async def get_price_history(
                 "attention_score": record.attention_score
             }
             for record in history
-        ]
+        ])
         
         start_time = history[0].timestamp.isoformat() if history else datetime.utcnow().isoformat()
         end_time = history[-1].timestamp.isoformat() if history else datetime.utcnow().isoformat()
         
-        return BiomePriceHistoryResponse(
+        payload = BiomePriceHistoryResponse.model_construct(
             biome=biome,
             history=history_points,
             start_time=start_time,
             end_time=end_time,
             data_points=len(history_points)
         )
+        return Response(content=payload.model_dump_json(), media_type="application/json")
     except Exception as e:
         logger.error(f"Failed to get price history for {biome}: {e}")
         raise HTTPException(
@@ -194,6 +209,39 @@ async def get_price_history(
 # Trading Endpoints
 # =============================================================================
 
+def _trade_fields(data: dict) -> dict:
+    """
+    Map ``Transaction.to_dict()`` output onto the trade response fields.
+
+    Ledger column names differ from the API (buyer_id -> user_id,
+    amount_bdt -> total_amount_bdt, ...), so they are mapped explicitly;
+    from_trusted does not validate and would otherwise drop them silently.
+    """
+    return {
+        "transaction_id": data["transaction_id"],
+        "user_id": data["buyer_id"],
+        "biome": data["biome"],
+        "type": data["transaction_type"],
+        "shares": data["shares"],
+        "price_per_share_bdt": data["price_per_share_bdt"],
+        "total_amount_bdt": data["amount_bdt"],
+        "executed_at": data["created_at"]
+    }
+
+
+def _trade_response(
+    transaction: Transaction,
+    message: str,
+    realized_gain_bdt: Optional[float] = None
+) -> TradeResponse:
+    """Build a trade response from the ledger row returned by the trading service."""
+    return TradeResponse.from_trusted(
+        _trade_fields(transaction.to_dict()),
+        realized_gain_bdt=realized_gain_bdt,
+        message=message
+    )
+
+
 @router.post("/buy", response_model=TradeResponse, status_code=status.HTTP_201_CREATED)
 async def buy_shares(
     buy_request: BuySharesRequest,
@@ -226,8 +274,8 @@ async def buy_shares(
             amount_bdt=buy_request.amount_bdt
         )
 
-        return TradeResponse(
-            **transaction.to_dict(),
+        return _trade_response(
+            transaction,
             message=f"Successfully bought {transaction.shares:.4f} shares of {biome_enum.value}"
         )
     except ValueError as e:
@@ -282,9 +330,10 @@ async def sell_shares(
             # This is simplified - in reality you'd track the cost basis
             realized_gain = 0  # TODO: Track realized gain properly
 
-        return TradeResponse(
-            **transaction.to_dict(),
-            message=f"Successfully sold {transaction.shares:.4f} shares of {biome_enum.value}"
+        return _trade_response(
+            transaction,
+            message=f"Successfully sold {transaction.shares:.4f} shares of {biome_enum.value}",
+            realized_gain_bdt=realized_gain
         )
     except ValueError as e:
         raise HTTPException(
@@ -363,7 +412,13 @@ async def get_transaction_history(
             page=page,
             limit=limit
         )
-        return TransactionHistoryResponse(**history)
+        payload = TransactionHistoryResponse.model_construct(
+            transactions=BIOME_TRANSACTION_LIST_ADAPTER.validate_python(
+                [_trade_fields(txn) for txn in history["transactions"]]
+            ),
+            pagination=history["pagination"]
+        )
+        return Response(content=payload.model_dump_json(), media_type="application/json")
     except Exception as e:
         logger.error(f"Failed to get transaction history: {e}")
         raise HTTPException(
@@ -3,7 +3,8 @@ Chunk endpoints
 World generation and chunk retrieval
 """
 
-from fastapi import APIRouter, HTTPException, status, Query, Body, Path, Depends
+from fastapi import APIRouter, HTTPException, status, Query, Path, Depends
+from pydantic import TypeAdapter
 from typing import List, Tuple, Dict, Optional, Set
 import logging
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -14,11 +15,14 @@ from app.services.world_service import world_service
 from app.db.session import get_db
 from app.models.land import Land
 from app.models.land_chat_access import LandChatAccess
-from app.dependencies import get_optional_user
+from app.dependencies import get_optional_user, parsed_body
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/chunks", tags=["chunks"])
 
+# Validates a whole /batch body straight from the request bytes in one call
+CHUNK_BATCH_ADAPTER = TypeAdapter(List[Tuple[int, int]])
+
 
 async def enrich_chunk_with_ownership(
     chunk_data: Dict,
@@ -157,13 +161,25 @@ async def get_chunk(
         )
 
 
-@router.post("/batch")
+@router.post(
+    "/batch",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": {
+                        **CHUNK_BATCH_ADAPTER.json_schema(),
+                        "description": "List of [chunk_x, chunk_y] coordinate pairs",
+                        "example": [[0, 0], [0, 1], [1, 0], [1, 1]]
+                    }
+                }
+            }
+        }
+    }
+)
 async def get_chunks_batch(
-    chunks: List[Tuple[int, int]] = Body(
-        ...,
-        description="List of [chunk_x, chunk_y] coordinate pairs",
-        example=[[0, 0], [0, 1], [1, 0], [1, 1]]
-    ),
+    chunks: List[Tuple[int, int]] = Depends(parsed_body(CHUNK_BATCH_ADAPTER)),
     chunk_size: int = Query(32, ge=8, le=64),
     db: AsyncSession = Depends(get_db),
     current_user: Optional[dict] = Depends(get_optional_user),
@@ -195,9 +211,7 @@ async def get_chunks_batch(
         )
 
     try:
-        # Convert list of lists to list of tuples
-        chunk_tuples = [tuple(c) for c in chunks]
-        chunks_data = await world_service.generate_chunks_batch(chunk_tuples, chunk_size, db)
+        chunks_data = await world_service.generate_chunks_batch(chunks, chunk_size, db)
         user_uuid = None
         if current_user:
             try:
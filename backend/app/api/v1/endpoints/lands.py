@@ -914,8 +914,14 @@ async def claim_land(
         fenced=False
     )
 
-    # Deduct cost from user balance
-    user.balance_bdt -= claim_data.price_base_bdt
+    # Deduct cost from user balance (re-checked atomically in the UPDATE)
+    try:
+        await User.deduct_balance(db, user_id, claim_data.price_base_bdt)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Insufficient balance. Need {claim_data.price_base_bdt} BDT"
+        )
 
     db.add(new_land)
     await db.commit()
@@ -938,7 +944,6 @@ async def claim_land(
     )
     db.add(purchase_txn)
     await db.commit()
-    await db.refresh(purchase_txn)
 
     # Invalidate caches
     await cache_service.delete(f"user_lands:{user_id}")
@@ -3,7 +3,7 @@ Marketplace Endpoints
 Listing creation, bidding, and purchase operations
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_, or_, func
 from typing import Optional
@@ -23,18 +23,29 @@ from app.schemas.listing_schema import (
     ListingResponse,
     BidCreate,
     BidResponse,
-    BuyNowRequest
+    BuyNowRequest,
+    ListingSortKey
 )
-from app.dependencies import get_current_user
+from app.dependencies import get_current_user, parsed_body
 from app.services.marketplace_service import marketplace_service
 from app.services.parcel_service import parcel_service
 from app.services.cache_service import cache_service
 from app.services.rate_limit_service import rate_limit_service
 from app.config import CACHE_TTLS
+from app.api.responses import ORJSONResponse
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/marketplace", tags=["marketplace"])
 
+# ORDER BY clause per listing sort key
+_SORT_ORDER = {
+    "price_asc": Listing.price_bdt.asc(),
+    "price_desc": Listing.price_bdt.desc(),
+    "created_at_asc": Listing.created_at.asc(),
+    "created_at_desc": Listing.created_at.desc(),
+    "ending_soon": Listing.auction_end_time.asc(),
+}
+
 
 def _rate_limit_identifier(request: Request, current_user: Optional[dict]) -> str:
     if current_user and current_user.get("sub"):
@@ -74,9 +85,13 @@ async def _enforce_marketplace_rate_limit(
         )
 
 
-@router.post("/listings", response_model=ListingResponse, status_code=status.HTTP_201_CREATED)
+@router.post(
+    "/listings",
+    status_code=status.HTTP_201_CREATED,
+    responses={status.HTTP_201_CREATED: {"model": ListingResponse}}
+)
 async def create_listing(
-    listing_data: ListingCreate,
+    listing_data: ListingCreate = Depends(parsed_body(ListingCreate)),
     current_user: dict = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
     request: Request = None
@@ -146,7 +161,10 @@ async def create_listing(
         )
         listing_dict["biomes"] = list(set(land.biome.value for land in lands))
 
-        return ListingResponse(**listing_dict)
+        return ORJSONResponse(
+            content=dict(ListingResponse.from_trusted(listing_dict)),
+            status_code=status.HTTP_201_CREATED
+        )
 
     except ValueError as e:
         raise HTTPException(
@@ -161,7 +179,7 @@ async def create_listing(
         )
 
 
-@router.get("/listings", response_model=dict)
+@router.get("/listings")
 async def search_listings(
     status_filter: Optional[str] = Query(None, alias="status"),
     listing_type: Optional[str] = Query(None),
@@ -169,7 +187,7 @@ async def search_listings(
     max_price_bdt: Optional[int] = Query(None, ge=0),
     biome: Optional[str] = Query(None),
     seller_id: Optional[str] = Query(None),
-    sort_by: str = Query("created_at_desc"),
+    sort_by: ListingSortKey = Query("created_at_desc"),
     page: int = Query(1, ge=1),
     limit: int = Query(20, ge=1, le=100),
     db: AsyncSession = Depends(get_db)
@@ -241,17 +259,9 @@ async def search_listings(
             )
 
     # Apply sorting
-    if sort_by == "price_asc":
-        query = query.order_by(Listing.price_bdt.asc())
-    elif sort_by == "price_desc":
-        query = query.order_by(Listing.price_bdt.desc())
-    elif sort_by == "created_at_asc":
-        query = query.order_by(Listing.created_at.asc())
-    elif sort_by == "ending_soon":
+    if sort_by == "ending_soon":
         query = query.where(Listing.auction_end_time.isnot(None))
-        query = query.order_by(Listing.auction_end_time.asc())
-    else:  # created_at_desc
-        query = query.order_by(Listing.created_at.desc())
+    query = query.order_by(_SORT_ORDER[sort_by])
 
     # Get total count
     count_query = select(func.count(Listing.listing_id.distinct())).select_from(Listing)
@@ -297,7 +307,7 @@ async def search_listings(
         listing_dict["biomes"] = list(set(land.biome.value for land in lands))
         listings_data.append(listing_dict)
 
-    return {
+    return ORJSONResponse({
         "data": listings_data,
         "pagination": {
             "page": page,
@@ -307,10 +317,10 @@ async def search_listings(
             "has_next": page * limit < total,
             "has_prev": page > 1
         }
-    }
+    })
 
 
-@router.get("/listings/{listing_id}", response_model=ListingResponse)
+@router.get("/listings/{listing_id}", responses={200: {"model": ListingResponse}})
 async def get_listing(
     listing_id: str,
     db: AsyncSession = Depends(get_db)
@@ -322,10 +332,11 @@ async def get_listing(
     """
     # Check cache
     cache_key = f"listing:{listing_id}"
-    cached_listing = await cache_service.get(cache_key)
+    cached_listing = await cache_service.get_raw(cache_key)
 
     if cached_listing:
-        return ListingResponse(**cached_listing)
+        # Cached value is the response body itself; pass it through unparsed
+        return Response(content=cached_listing, media_type="application/json")
 
     try:
         listing_uuid = uuid.UUID(listing_id)
@@ -380,16 +391,20 @@ async def get_listing(
     )
     listing_dict["biomes"] = list(set(land.biome.value for land in lands))
 
-    # Cache the result
-    await cache_service.set(cache_key, listing_dict, ttl=CACHE_TTLS["listing"])
+    payload = dict(ListingResponse.from_trusted(listing_dict))
+
+    # Render once and cache those exact bytes, so hits and misses return an
+    # identical body (same datetime format and orjson options)
+    response = ORJSONResponse(payload)
+    await cache_service.set_raw(cache_key, response.body, ttl=CACHE_TTLS["listing"])
 
-    return ListingResponse(**listing_dict)
+    return response
 
 
 @router.post("/listings/{listing_id}/bids", response_model=BidResponse, status_code=status.HTTP_201_CREATED)
 async def place_bid(
     listing_id: str,
-    bid_data: BidCreate,
+    bid_data: BidCreate = Depends(parsed_body(BidCreate)),
     current_user: dict = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
     request: Request = None
@@ -52,10 +52,7 @@ async def get_user(
             detail="Invalid user ID format"
         )
 
-    result = await db.execute(
-        select(User).where(User.user_id == user_uuid)
-    )
-    user = result.scalar_one_or_none()
+    user = await db.get(User, user_uuid)
 
     if not user:
         raise HTTPException(
@@ -67,7 +64,7 @@ async def get_user(
     user_dict = user.to_dict()
     await cache_service.set(cache_key, user_dict, ttl=CACHE_TTLS["user_profile"])
 
-    return UserResponse.model_validate(user.to_dict())
+    return UserResponse.model_validate(user)
 
 
 @router.put("/{user_id}", response_model=UserResponse)
@@ -97,10 +94,7 @@ async def update_user(
             detail="Invalid user ID format"
         )
 
-    result = await db.execute(
-        select(User).where(User.user_id == user_uuid)
-    )
-    user = result.scalar_one_or_none()
+    user = await db.get(User, user_uuid)
 
     if not user:
         raise HTTPException(
@@ -122,7 +116,7 @@ async def update_user(
 
     logger.info(f"User profile updated: {user_id}")
 
-    return UserResponse.model_validate(user.to_dict())
+    return UserResponse.model_validate(user)
 
 
 @router.get("/{user_id}/balance")
@@ -151,10 +145,7 @@ async def get_balance(
             detail="Invalid user ID format"
         )
 
-    result = await db.execute(
-        select(User).where(User.user_id == user_uuid)
-    )
-    user = result.scalar_one_or_none()
+    user = await db.get(User, user_uuid)
 
     if not user:
         raise HTTPException(
@@ -203,10 +194,7 @@ async def initiate_topup(
             detail="Invalid user ID format"
         )
 
-    result = await db.execute(
-        select(User).where(User.user_id == user_uuid)
-    )
-    user = result.scalar_one_or_none()
+    user = await db.get(User, user_uuid)
 
     if not user:
         raise HTTPException(
@@ -251,10 +239,7 @@ async def get_user_lands(
         )
 
     # Verify user exists
-    result = await db.execute(
-        select(User).where(User.user_id == user_uuid)
-    )
-    user = result.scalar_one_or_none()
+    user = await db.get(User, user_uuid)
 
     if not user:
         raise HTTPException(
@@ -315,10 +300,7 @@ async def get_user_stats(
         )
 
     # Verify user exists
-    result = await db.execute(
-        select(User).where(User.user_id == user_uuid)
-    )
-    user = result.scalar_one_or_none()
+    user = await db.get(User, user_uuid)
 
     if not user:
         raise HTTPException(
@@ -394,10 +376,7 @@ async def update_profile(
             detail="Invalid user ID format"
         )
 
-    result = await db.execute(
-        select(User).where(User.user_id == user_uuid)
-    )
-    user = result.scalar_one_or_none()
+    user = await db.get(User, user_uuid)
 
     if not user:
         raise HTTPException(
@@ -420,7 +399,7 @@ async def update_profile(
 
     logger.info(f"User profile updated: {user_id}")
 
-    return UserResponse.model_validate(user.to_dict())
+    return UserResponse.model_validate(user)
 
 
 @router.post("/{user_id}/avatar")
@@ -453,10 +432,7 @@ async def upload_avatar(
             detail="Invalid user ID format"
         )
 
-    result = await db.execute(
-        select(User).where(User.user_id == user_uuid)
-    )
-    user = result.scalar_one_or_none()
+    user = await db.get(User, user_uuid)
 
     if not user:
         raise HTTPException(
@@ -482,7 +458,7 @@ async def upload_avatar(
 
         logger.info(f"Avatar uploaded for user {user_id}: {avatar_url}")
 
-        return {"avatar_url": avatar_url, "user": UserResponse.model_validate(user.to_dict())}
+        return {"avatar_url": avatar_url, "user": UserResponse.model_validate(user)}
 
     except ValueError as e:
         raise HTTPException(
@@ -531,10 +507,7 @@ async def get_user_transactions(
         )
 
     # Verify user exists
-    result = await db.execute(
-        select(User).where(User.user_id == user_uuid)
-    )
-    user = result.scalar_one_or_none()
+    user = await db.get(User, user_uuid)
 
     if not user:
         raise HTTPException(
@@ -256,12 +256,13 @@ async def handle_subscribe_biome_market(websocket: WebSocket, user_id: str, mess
     await connection_manager.join_room(user_id, room_id)
 
     # Send snapshot
+    market_rows = await biome_market_service.get_market_rows(db)
     if biome_enum:
-        market = await biome_market_service.get_market(db, biome_enum)
-        markets_payload = [market.to_dict()]
+        if biome_enum.value not in market_rows:
+            raise ValueError(f"Market not found for biome: {biome_enum.value}")
+        markets_payload = [market_rows[biome_enum.value]]
     else:
-        markets = await biome_market_service.get_all_markets(db)
-        markets_payload = [m.to_dict() for m in markets]
+        markets_payload = list(market_rows.values())
 
     await websocket.send_json({
         "type": "subscribed_biome_market",
@@ -18,6 +18,8 @@ class Settings(BaseSettings):
     app_version: str = Field(default="1.0.0", env="APP_VERSION")
     environment: str = Field(default="development", env="ENVIRONMENT")
     debug: bool = Field(default=False, env="DEBUG")
+    # Re-validate trusted DB/cache payloads on the response path (staging)
+    debug_validate: bool = Field(default=False, env="DEBUG_VALIDATE")
 
     # Server
     host: str = Field(default="0.0.0.0", env="HOST")
@@ -40,6 +42,7 @@ class Settings(BaseSettings):
     db_pool_size: int = Field(default=20, env="DB_POOL_SIZE")
     db_max_overflow: int = Field(default=0, env="DB_MAX_OVERFLOW")
     db_pool_recycle: int = Field(default=3600, env="DB_POOL_RECYCLE")
+    db_pool_pre_ping: bool = Field(default=False, env="DB_POOL_PRE_PING")
     db_echo: bool = Field(default=False, env="DB_ECHO")
 
     # Redis
@@ -119,6 +122,8 @@ class Settings(BaseSettings):
     # Default to WARNING to avoid noisy output; can be overridden via LOG_LEVEL.
     log_level: str = Field(default="WARNING", env="LOG_LEVEL")
     log_file: Optional[str] = Field(default=None, env="LOG_FILE")
+    # Batched ledger rows that cannot be inserted are appended here for replay
+    dead_letter_dir: str = Field(default="dead_letter", env="DEAD_LETTER_DIR")
 
     # World Generation
     # Seed: "Topu" encoded as integer (84, 111, 112, 117 -> 1416589429)
@@ -5,7 +5,8 @@ Provides base model class with common timestamp fields
 
 from sqlalchemy import Column, DateTime, func
 from sqlalchemy.ext.declarative import declarative_base
-from datetime import datetime
+from datetime import datetime, timezone
+from typing import Callable, Tuple
 
 
 # Base class for all ORM models
@@ -34,7 +35,7 @@ class TimestampMixin:
 
     def soft_delete(self):
         """Soft delete the record by setting deleted_at timestamp."""
-        self.deleted_at = datetime.utcnow()
+        self.deleted_at = datetime.now(timezone.utc)
 
     @property
     def is_deleted(self) -> bool:
@@ -42,11 +43,91 @@ class TimestampMixin:
         return self.deleted_at is not None
 
 
+# Conversions available to generated to_dict serializers
+_DICT_CONVERTERS = {
+    "value": "{v}",
+    "str": "str({v})",
+    "enum": "{values}[{v}]",
+    "isoformat": "{v}.isoformat()",
+}
+
+
+def _compile_columns_to_dict(cls, fields: Tuple[Tuple[str, str], ...]) -> Callable:
+    """
+    Generate a specialized ``_columns_to_dict`` method for a model.
+
+    The source is built once per class from ``__dict_fields__`` and the
+    column definitions: NOT NULL columns are converted unconditionally and
+    only nullable ones (plus timestamps) get a ``None`` check, so the per-row
+    serializer has no branches beyond what the schema requires.
+
+    Args:
+        cls: Model class being created
+        fields: ``(attribute, conversion)`` pairs in output order, where
+            conversion is a key of ``_DICT_CONVERTERS``
+
+    Returns:
+        Callable: Function taking the instance and returning a dict
+    """
+    namespace = {"_fields": frozenset(name for name, _ in fields)}
+    lines = ["def _columns_to_dict(self):", "    get = self._loaded_values(_fields).get"]
+    items = []
+    for index, (name, conversion) in enumerate(fields):
+        column = getattr(cls, name, None)
+        nullable = getattr(column, "nullable", True)
+        var = f"v{index}"
+        values = f"_enum_values_{index}"
+        if conversion == "enum":
+            # Precomputed member -> value map: a dict lookup instead of the
+            # Enum .value descriptor on every row
+            namespace[values] = {member: member.value for member in column.type.enum_class}
+        lines.append(f"    {var} = get({name!r})")
+        expr = _DICT_CONVERTERS[conversion].format(v=var, values=values)
+        # Timestamps filled by SQL defaults may be unset before a refresh
+        if conversion == "isoformat" or (nullable and conversion != "value"):
+            expr = f"None if {var} is None else {expr}"
+        items.append(f"        {name!r}: {expr},")
+    lines.append("    return {")
+    lines.extend(items)
+    lines.append("    }")
+
+    exec("\n".join(lines), namespace)
+    return namespace["_columns_to_dict"]
+
+
 class BaseModel(Base):
     """Abstract base model with timestamp fields."""
 
     __abstract__ = True
 
+    def __init_subclass__(cls, **kwargs):
+        """Compile ``_columns_to_dict`` for models declaring ``__dict_fields__``."""
+        super().__init_subclass__(**kwargs)
+        fields = cls.__dict__.get("__dict_fields__")
+        if fields:
+            cls._columns_to_dict = _compile_columns_to_dict(cls, fields)
+
+    def _loaded_values(self, fields: frozenset) -> dict:
+        """
+        Get the instance's attribute dict with all of ``fields`` loaded.
+
+        Serializers read from the returned dict with plain key lookups
+        instead of going through the instrumented attribute descriptors.
+        Fields that are expired or not yet loaded are fetched normally first;
+        fields never set on a transient instance stay absent, so read with
+        ``.get()``.
+
+        Args:
+            fields: Attribute names the caller is about to read
+
+        Returns:
+            dict: The instance ``__dict__`` (do not mutate)
+        """
+        values = self.__dict__
+        for name in fields.difference(values):
+            getattr(self, name)
+        return values
+
     created_at = Column(
         DateTime(timezone=True),
         default=func.now(),
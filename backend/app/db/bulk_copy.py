@@ -0,0 +1,125 @@
+"""
+Bulk COPY helpers
+Binary COPY import/export for large tables via the asyncpg driver
+"""
+
+from typing import Any, Awaitable, Callable, Iterable, Sequence, Tuple
+import gzip
+import logging
+
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+logger = logging.getLogger(__name__)
+
+
+async def _driver_connection(conn: AsyncConnection):
+    """Get the underlying asyncpg connection from a SQLAlchemy connection."""
+    raw = await conn.get_raw_connection()
+    return raw.driver_connection
+
+
+async def copy_records_in(
+    conn: AsyncConnection,
+    table: str,
+    columns: Sequence[str],
+    records: Iterable[Tuple[Any, ...]]
+) -> int:
+    """
+    Insert rows with a single binary ``COPY ... FROM STDIN``.
+
+    Bypasses ORM unit-of-work and per-row INSERT parsing; UUIDs and
+    timestamps are sent in binary form. Reserve for bulk loads — use the
+    ORM for single-row inserts so defaults and events still apply.
+
+    Args:
+        conn: SQLAlchemy async connection (asyncpg driver)
+        table: Target table name
+        columns: Column names, in the order of each record tuple
+        records: Row tuples; every column value must be supplied
+
+    Returns:
+        int: Number of rows copied
+    """
+    driver = await _driver_connection(conn)
+    status = await driver.copy_records_to_table(
+        table,
+        records=records,
+        columns=list(columns)
+    )
+    # asyncpg returns the command tag, e.g. "COPY 1000"
+    copied = int(status.split()[-1])
+    logger.info(f"Copied {copied} rows into {table}")
+    return copied
+
+
+async def copy_table_out(
+    conn: AsyncConnection,
+    table: str,
+    output: Callable[[bytes], Awaitable[None]],
+    columns: Sequence[str] = None
+) -> None:
+    """
+    Stream a table out with binary ``COPY ... TO STDOUT``.
+
+    Args:
+        conn: SQLAlchemy async connection (asyncpg driver)
+        table: Source table name
+        output: Coroutine function receiving each chunk of COPY data
+        columns: Optional column subset (defaults to all columns)
+    """
+    driver = await _driver_connection(conn)
+    await driver.copy_from_table(
+        table,
+        output=output,
+        columns=list(columns) if columns else None,
+        format="binary"
+    )
+
+
+async def copy_query_out(
+    conn: AsyncConnection,
+    query: str,
+    output: Callable[[bytes], Awaitable[None]]
+) -> None:
+    """
+    Stream a query's rows out with binary ``COPY (query) TO STDOUT``.
+
+    Needed for partitioned parent tables, which Postgres rejects as the
+    source of a plain ``COPY table TO``.
+
+    Args:
+        conn: SQLAlchemy async connection (asyncpg driver)
+        query: SELECT statement (trusted SQL, not user input)
+        output: Coroutine function receiving each chunk of COPY data
+    """
+    driver = await _driver_connection(conn)
+    await driver.copy_from_query(query, output=output, format="binary")
+
+
+async def copy_table_to_gzip(
+    conn: AsyncConnection,
+    table: str,
+    path: str,
+    columns: Sequence[str] = None,
+    partitioned: bool = False
+) -> None:
+    """
+    Archive a table to a gzip-compressed binary COPY file.
+
+    Args:
+        conn: SQLAlchemy async connection (asyncpg driver)
+        table: Source table name
+        path: Destination file path (e.g. ``transactions_2025_01.copy.gz``)
+        columns: Optional column subset (defaults to all columns)
+        partitioned: ``table`` is a partitioned parent; copy via a SELECT
+    """
+    with gzip.open(path, "wb") as archive:
+        async def _write(chunk: bytes) -> None:
+            archive.write(chunk)
+
+        if partitioned:
+            column_list = ", ".join(columns) if columns else "*"
+            await copy_query_out(conn, f"SELECT {column_list} FROM {table}", _write)
+        else:
+            await copy_table_out(conn, table, _write, columns)
+    logger.info(f"Exported {table} to {path}")
@@ -0,0 +1,105 @@
+"""
+Table partition maintenance
+Creates monthly range partitions for append-only, time-scoped tables
+"""
+
+from datetime import date, datetime, timezone
+from typing import List, Tuple
+import logging
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+# Parent tables declared with postgresql_partition_by="RANGE (created_at)"
+MONTHLY_PARTITIONED_TABLES = ("transactions",)
+
+
+def month_bounds(year: int, month: int) -> Tuple[date, date]:
+    """
+    Get the [start, end) dates of a calendar month.
+
+    Args:
+        year: Calendar year
+        month: Calendar month (1-12)
+
+    Returns:
+        Tuple[date, date]: First day of the month and first day of the next
+    """
+    start = date(year, month, 1)
+    end = date(year + 1, 1, 1) if month == 12 else date(year, month + 1, 1)
+    return start, end
+
+
+def monthly_partition_ddl(table: str, year: int, month: int) -> str:
+    """
+    Build the CREATE TABLE statement for one monthly partition.
+
+    Args:
+        table: Partitioned parent table name
+        year: Calendar year
+        month: Calendar month (1-12)
+
+    Returns:
+        str: Idempotent DDL, e.g. for transactions_2026_01
+    """
+    start, end = month_bounds(year, month)
+    return (
+        f"CREATE TABLE IF NOT EXISTS {table}_{year:04d}_{month:02d} "
+        f"PARTITION OF {table} "
+        f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+    )
+
+
+def upcoming_months(months_ahead: int, today: date = None) -> List[Tuple[int, int]]:
+    """
+    List (year, month) pairs from the current month through months_ahead.
+
+    Args:
+        months_ahead: Number of future months to include
+        today: Reference date (defaults to today in UTC)
+
+    Returns:
+        List[Tuple[int, int]]: Calendar months in ascending order
+    """
+    today = today or datetime.now(timezone.utc).date()
+    months = []
+    year, month = today.year, today.month
+    for _ in range(months_ahead + 1):
+        months.append((year, month))
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return months
+
+
+async def ensure_monthly_partitions(engine: AsyncEngine, months_ahead: int = 2) -> None:
+    """
+    Pre-create the current and upcoming monthly partitions.
+
+    A DEFAULT partition is also created so inserts never fail if this job
+    falls behind. Run at startup; partitions are created ahead of time so
+    the DEFAULT partition normally stays empty.
+
+    Args:
+        engine: Async database engine
+        months_ahead: Number of future months to pre-create
+    """
+    if engine.dialect.name != "postgresql":
+        return
+
+    for table in MONTHLY_PARTITIONED_TABLES:
+        async with engine.begin() as conn:
+            await conn.execute(text(
+                f"CREATE TABLE IF NOT EXISTS {table}_default PARTITION OF {table} DEFAULT"
+            ))
+
+        for year, month in upcoming_months(months_ahead):
+            try:
+                async with engine.begin() as conn:
+                    await conn.execute(text(monthly_partition_ddl(table, year, month)))
+            except Exception as e:
+                # Usually means the DEFAULT partition already holds rows for
+                # this month; those must be moved before the partition can exist.
+                logger.error(f"Failed to create partition {table}_{year:04d}_{month:02d}: {e}")
+
+    logger.info("Monthly table partitions ensured")
@@ -9,7 +9,7 @@ from sqlalchemy.ext.asyncio import (
     async_sessionmaker,
     AsyncEngine
 )
-from sqlalchemy.pool import NullPool, QueuePool
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from typing import AsyncGenerator
 import logging
 
@@ -22,10 +22,14 @@ logger = logging.getLogger(__name__)
 engine: AsyncEngine = create_async_engine(
     settings.database_url,
     echo=settings.db_echo,
+    poolclass=AsyncAdaptedQueuePool,
     pool_size=settings.db_pool_size,
     max_overflow=settings.db_max_overflow,
     pool_recycle=settings.db_pool_recycle,
-    pool_pre_ping=True,  # Verify connections before using
+    # Off by default: a SELECT 1 per checkout costs a round trip on every
+    # request. pool_recycle already retires connections before idle timeouts;
+    # enable when a proxy may drop connections early.
+    pool_pre_ping=settings.db_pool_pre_ping,
     future=True
 )
 
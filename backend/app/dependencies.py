@@ -3,11 +3,17 @@ FastAPI Dependencies
 Dependency injection for authentication, database, etc.
 """
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
+from fastapi.exceptions import RequestValidationError
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from pydantic import BaseModel, TypeAdapter, ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import Optional
+from sqlalchemy import select
+from typing import Any, Dict, Optional, Tuple, Type, TypeVar, Union
+from datetime import datetime, timezone
+import asyncio
 import logging
+import time
 
 from app.db.session import get_db
 from app.services.auth_service import auth_service, InvalidTokenException
@@ -19,6 +25,76 @@ logger = logging.getLogger(__name__)
 # HTTP Bearer token scheme
 security = HTTPBearer()
 
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+# Per-process cache of the user existence/lock lookup done on every
+# authenticated request: user_id -> (expires_at monotonic, locked_until).
+# Lock state only changes at login, which calls invalidate_user_state; that
+# drops the entry locally and publishes it on USER_STATE_CHANNEL so every
+# other worker drops it too. If Redis pub/sub is unavailable, other workers
+# may keep serving the old state for up to USER_STATE_TTL_SECONDS.
+USER_STATE_TTL_SECONDS = 30.0
+USER_STATE_MAX_ENTRIES = 10000
+USER_STATE_CHANNEL = "user_state:invalidate"
+_user_state_cache: Dict[str, Tuple[float, Optional[datetime]]] = {}
+
+
+async def invalidate_user_state(user_id: str) -> None:
+    """Drop the cached lock state for a user in this and every other worker."""
+    _user_state_cache.pop(str(user_id), None)
+    await cache_service.publish(USER_STATE_CHANNEL, str(user_id))
+
+
+async def listen_for_user_state_invalidations() -> None:
+    """
+    Apply invalidations published by other workers; runs until cancelled.
+
+    Reconnects after Redis errors. Messages published while disconnected are
+    lost, so the whole cache is dropped on each reconnect.
+    """
+    while True:
+        pubsub = cache_service.client.pubsub()
+        try:
+            await pubsub.subscribe(USER_STATE_CHANNEL)
+            _user_state_cache.clear()
+            async for message in pubsub.listen():
+                if message["type"] == "message":
+                    _user_state_cache.pop(message["data"].decode(), None)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"User state invalidation listener error: {e}")
+            await asyncio.sleep(1)
+        finally:
+            await pubsub.aclose()
+
+
+async def _get_locked_until(db: AsyncSession, user_id: str) -> Tuple[bool, Optional[datetime]]:
+    """
+    Look up whether a user exists and until when it is locked.
+
+    Served from the per-process cache when fresh; otherwise an index-only
+    scan on idx_users_lock_state.
+
+    Returns:
+        Tuple of (exists, locked_until)
+    """
+    cached = _user_state_cache.get(user_id)
+    if cached and cached[0] > time.monotonic():
+        return True, cached[1]
+
+    result = await db.execute(
+        select(User.locked_until).where(User.user_id == user_id)
+    )
+    row = result.first()
+    if row is None:
+        return False, None
+
+    if len(_user_state_cache) >= USER_STATE_MAX_ENTRIES:
+        _user_state_cache.clear()
+    _user_state_cache[user_id] = (time.monotonic() + USER_STATE_TTL_SECONDS, row.locked_until)
+    return True, row.locked_until
+
 
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
@@ -57,20 +133,16 @@ async def get_current_user(
                 detail="Invalid token: missing user ID"
             )
 
-        # Verify user still exists in database
-        from sqlalchemy import select
-        result = await db.execute(
-            select(User).where(User.user_id == user_id)
-        )
-        user = result.scalar_one_or_none()
+        # Verify user still exists and is not locked
+        exists, locked_until = await _get_locked_until(db, str(user_id))
 
-        if not user:
+        if not exists:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="User not found"
             )
 
-        if user.is_locked():
+        if locked_until and locked_until > datetime.now(timezone.utc):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Account is locked"
@@ -146,12 +218,14 @@ def require_role(*allowed_roles: UserRole):
             pass
         ```
     """
+    allowed_values = frozenset(role.value for role in allowed_roles)
+
     async def check_role(
         current_user: dict = Depends(get_current_user)
     ) -> dict:
         user_role = current_user.get("role")
 
-        if user_role not in [role.value for role in allowed_roles]:
+        if user_role not in allowed_values:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail=f"Insufficient permissions. Required role: {[r.value for r in allowed_roles]}"
@@ -195,3 +269,42 @@ async def get_optional_user(
         return await get_current_user(credentials, db)
     except HTTPException:
         return None
+
+
+def parsed_body(model: Union[Type[ModelT], TypeAdapter]):
+    """
+    Dependency factory that parses and validates a JSON body in one pass.
+
+    ``model_validate_json`` parses the raw bytes directly into the model, so
+    no intermediate ``json.loads`` dict is built. A ``TypeAdapter`` may be
+    passed instead of a model to validate a whole batch (e.g. a list body)
+    in a single call. Errors are re-raised as ``RequestValidationError`` so
+    clients see the usual 422 response.
+
+    Args:
+        model: Pydantic model class or TypeAdapter for the request body
+
+    Returns:
+        Dependency function
+
+    Example:
+        ```python
+        @router.post("/listings")
+        async def create_listing(data: ListingCreate = Depends(parsed_body(ListingCreate))):
+            pass
+        ```
+    """
+    validate_json = (
+        model.validate_json if isinstance(model, TypeAdapter) else model.model_validate_json
+    )
+
+    async def parse(request: Request) -> Any:
+        try:
+            return validate_json(await request.body())
+        except ValidationError as e:
+            raise RequestValidationError([
+                {**error, "loc": ("body", *error["loc"])}
+                for error in e.errors(include_url=False)
+            ])
+
+    return parse
@@ -8,6 +8,7 @@ from fastapi.middleware.cors import CORSMiddleware
 # from starlette.middleware.gzip import GZIPMiddleware  # Temporarily disabled due to API change
 from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
+import asyncio
 import logging
 import time
 from contextlib import asynccontextmanager
@@ -16,9 +17,14 @@ from datetime import datetime, timedelta
 from sqlalchemy import select
 
 from app.config import settings
-from app.db.session import init_db, close_db
+from app.api.responses import ORJSONResponse
+from app.db.session import init_db, close_db, engine
+from app.db.partitions import ensure_monthly_partitions
 from app.services.cache_service import cache_service
 from app.services.biome_market_worker import biome_market_worker
+from app.services.audit_log_service import audit_log_batcher
+from app.services.biome_trading_service import transaction_batcher
+from app.dependencies import listen_for_user_state_invalidations
 from app.services.biome_market_service import biome_market_service
 from app.db.session import AsyncSessionLocal
 from app.models.admin_config import AdminConfig
@@ -70,15 +76,20 @@ async def lifespan(app: FastAPI):
 
     Startup:
     - Initialize database
+    - Pre-create monthly table partitions
     - Connect to Redis
     - Initialize biome markets
     - Start biome market worker
+    - Start audit log and trade transaction batchers
+    - Subscribe to cross-worker user state invalidations
     - Log configuration
 
     Shutdown:
     - Close database connections
     - Disconnect from Redis
     - Stop biome market worker
+    - Flush queued audit logs and trade transactions
+    - Stop the user state invalidation listener
     """
     # Startup
     logger.info(f"Starting {settings.app_name} v{settings.app_version}")
@@ -91,6 +102,11 @@ async def lifespan(app: FastAPI):
         logger.error(f"Database initialization failed: {e}")
         raise
 
+    try:
+        await ensure_monthly_partitions(engine)
+    except Exception as e:
+        logger.error(f"Partition maintenance failed: {e}")
+
     try:
         await cache_service.connect()
         logger.info("Redis connected")
@@ -114,6 +130,14 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"Biome market worker failed to start: {e}")
 
+    audit_log_batcher.start()
+    logger.info("Audit log batcher started")
+
+    transaction_batcher.start()
+    logger.info("Trade transaction batcher started")
+
+    user_state_listener = asyncio.create_task(listen_for_user_state_invalidations())
+
     logger.info("Application startup complete")
 
     yield
@@ -121,6 +145,13 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("Shutting down application...")
     await biome_market_worker.stop()
+    await audit_log_batcher.stop()
+    await transaction_batcher.stop()
+    user_state_listener.cancel()
+    try:
+        await user_state_listener
+    except asyncio.CancelledError:
+        pass
     await close_db()
     await cache_service.disconnect()
     logger.info("Application shutdown complete")
@@ -134,6 +165,7 @@ app = FastAPI(
     docs_url="/api/docs",
     redoc_url="/api/redoc",
     openapi_url="/api/openapi.json",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -17,6 +17,8 @@ from app.models.ip_access_control import IPBlacklist, IPWhitelist
 from app.models.biome_market import BiomeMarket
 from app.models.biome_holding import BiomeHolding
 from app.models.biome_price_history import BiomePriceHistory
+from app.models.biome_price_history_minute import BiomePriceHistoryMinute
+from app.models.payment_gateway_txn import PaymentGatewayTxn
 from app.models.attention_score import AttentionScore
 
 __all__ = [
@@ -37,6 +39,7 @@ __all__ = [
     # Transaction
     "Transaction",
     "TransactionStatus",
+    "PaymentGatewayTxn",
     # Chat
     "ChatSession",
     "Message",
@@ -53,5 +56,6 @@ __all__ = [
     "BiomeMarket",
     "BiomeHolding",
     "BiomePriceHistory",
+    "BiomePriceHistoryMinute",
     "AttentionScore",
 ]
@@ -32,7 +32,9 @@ class AttentionScore(BaseModel):
 
     __table_args__ = (
         Index("idx_attention_scores_user_biome", "user_id", "biome", unique=True),
-        Index("idx_attention_scores_biome", "biome"),
+        # Covers SUM(score) WHERE biome = ? (get_biome_total_attention) as an
+        # index-only scan; (user_id, biome) above serves per-user lookups.
+        Index("idx_attention_scores_biome_score", "biome", postgresql_include=["score"]),
         Index("idx_attention_scores_updated", "updated_at"),
     )
 
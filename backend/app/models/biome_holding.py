@@ -3,7 +3,7 @@ BiomeHolding model
 Represents user's biome share holdings
 """
 
-from sqlalchemy import Column, Integer, Float, ForeignKey, Index, CheckConstraint, Enum as SQLEnum
+from sqlalchemy import Column, Integer, Float, Numeric, ForeignKey, Index, CheckConstraint, Enum as SQLEnum
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 import uuid
@@ -59,8 +59,9 @@ class BiomeHolding(BaseModel):
     )
 
     # Holdings Data
+    # Fixed-point (6 dp) so SUM(shares) is exact; still read as float in Python
     shares = Column(
-        Float,
+        Numeric(18, 6, asdecimal=False),
         default=0.0,
         nullable=False
     )
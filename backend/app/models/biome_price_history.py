@@ -31,7 +31,13 @@ class BiomePriceHistory(BaseModel):
     __tablename__ = "biome_price_history"
 
     __table_args__ = (
-        Index("idx_biome_price_history_biome_time", "biome", "timestamp"),
+        # Covers get_price_history, so chart range reads are index-only scans
+        Index(
+            "idx_biome_price_history_biome_time_covering",
+            "biome",
+            "timestamp",
+            postgresql_include=["price_bdt", "market_cash_bdt", "attention_score"]
+        ),
         Index("idx_biome_price_history_timestamp", "timestamp"),
     )
 
@@ -0,0 +1,53 @@
+"""
+BiomePriceHistoryMinute model
+Per-minute rollups of raw biome price history
+"""
+
+from sqlalchemy import Column, Float, DateTime, ForeignKey, Integer, Enum as SQLEnum
+
+from app.db.base import Base
+from app.models.land import Biome
+
+
+class BiomePriceHistoryMinute(Base):
+    """
+    One-minute aggregate of BiomePriceHistory rows.
+
+    Raw ticks older than the raw retention window are rolled up into this
+    table and deleted, so long chart ranges read one row per minute.
+
+    Attributes:
+        biome: Biome type
+        bucket_start: Start of the minute this row aggregates
+        price_avg_bdt / price_min_bdt / price_max_bdt: Price over the minute
+        price_last_bdt: Last price recorded in the minute
+        market_cash_bdt: Last market cash recorded in the minute
+        attention_score: Average attention score over the minute
+        sample_count: Number of raw rows aggregated
+    """
+
+    __tablename__ = "biome_price_history_1m"
+
+    biome = Column(
+        SQLEnum(Biome),
+        ForeignKey("biome_markets.biome"),
+        primary_key=True,
+        nullable=False
+    )
+    bucket_start = Column(
+        DateTime(timezone=True),
+        primary_key=True,
+        nullable=False
+    )
+
+    price_avg_bdt = Column(Float, nullable=False)
+    price_min_bdt = Column(Float, nullable=False)
+    price_max_bdt = Column(Float, nullable=False)
+    price_last_bdt = Column(Float, nullable=False)
+    market_cash_bdt = Column(Integer, nullable=False)
+    attention_score = Column(Float, nullable=False)
+    sample_count = Column(Integer, nullable=False)
+
+    def __repr__(self) -> str:
+        """String representation of BiomePriceHistoryMinute."""
+        return f"<BiomePriceHistoryMinute {self.biome.value} @ {self.bucket_start}: {self.price_last_bdt} BDT>"
@@ -0,0 +1,39 @@
+"""
+PaymentGatewayTxn model
+Uniqueness ledger for payment gateway transaction ids
+"""
+
+from sqlalchemy import Column, String, DateTime, func
+
+from app.db.base import Base
+
+
+class PaymentGatewayTxn(Base):
+    """
+    One row per gateway transaction id that has been credited.
+
+    The partitioned transactions table cannot enforce a UNIQUE constraint on
+    gateway_transaction_id (it would have to include the partition key), so
+    webhook handlers claim the id here, in the same DB transaction as the
+    balance credit. A concurrent duplicate delivery blocks on the primary
+    key and then finds the id taken, so a payment is credited at most once.
+
+    Attributes:
+        gateway_transaction_id: External transaction ID from the gateway
+        gateway: Gateway that issued the id
+        created_at: When the id was claimed
+    """
+
+    __tablename__ = "payment_gateway_txn"
+
+    gateway_transaction_id = Column(String(255), primary_key=True)
+    gateway = Column(String(50), nullable=False)
+    created_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False
+    )
+
+    def __repr__(self) -> str:
+        """String representation of PaymentGatewayTxn."""
+        return f"<PaymentGatewayTxn {self.gateway}:{self.gateway_transaction_id}>"
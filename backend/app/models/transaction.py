@@ -3,15 +3,18 @@ Transaction model
 Immutable record of all land purchases and transfers
 """
 
-from sqlalchemy import Column, String, Integer, Float, ForeignKey, DateTime, Enum as SQLEnum, Index, CheckConstraint
+from sqlalchemy import Column, String, Integer, Numeric, ForeignKey, DateTime, Enum as SQLEnum, Index, CheckConstraint, func, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship, column_property
 from sqlalchemy.ext.hybrid import hybrid_property
 import uuid
+import numpy as np
 from enum import Enum as PyEnum
-from datetime import datetime
+from datetime import datetime, timezone
+from typing import Any, Iterable, Optional, Tuple
 
 from app.db.base import BaseModel
+from app.db.bulk_copy import copy_records_in, copy_table_to_gzip
 
 
 class TransactionStatus(str, PyEnum):
@@ -61,12 +64,47 @@ class Transaction(BaseModel):
 
     __tablename__ = "transactions"
 
+    # Fields serialized by to_dict (see BaseModel.__init_subclass__)
+    __dict_fields__ = (
+        ("transaction_id", "str"),
+        ("land_id", "str"),
+        ("seller_id", "str"),
+        ("buyer_id", "str"),
+        ("listing_id", "str"),
+        ("transaction_type", "enum"),
+        ("amount_bdt", "value"),
+        ("currency", "value"),
+        ("status", "enum"),
+        ("gateway_name", "value"),
+        ("gateway_transaction_id", "value"),
+        ("platform_fee_bdt", "value"),
+        ("gateway_fee_bdt", "value"),
+        ("biome", "value"),
+        ("shares", "value"),
+        ("price_per_share_bdt", "value"),
+        ("created_at", "isoformat"),
+        ("completed_at", "isoformat"),
+    )
+
+    # Range-partitioned by month on created_at (see app.db.partitions).
+    # Postgres requires the partition key in the primary key and in every
+    # unique constraint, so the table PK is (transaction_id, created_at)
+    # while the ORM identity stays transaction_id alone.
     __table_args__ = (
         Index("idx_transactions_seller", "seller_id", "created_at"),
         Index("idx_transactions_buyer", "buyer_id", "created_at"),
-        Index("idx_transactions_status", "status"),
+        # Partial index over the small live set of non-completed rows for
+        # admin queues; completed rows (the bulk of inserts) skip it.
+        Index(
+            "idx_tx_status_created",
+            "status",
+            "created_at",
+            postgresql_where=text("status IN ('PENDING', 'FAILED')")
+        ),
         Index("idx_transactions_created_at", "created_at"),
+        Index("idx_transactions_gateway_txn", "gateway_transaction_id"),
         CheckConstraint("amount_bdt >= 0", name="check_nonnegative_amount"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
     )
 
     # Primary Key
@@ -101,8 +139,16 @@ class Transaction(BaseModel):
     )
 
     # Transaction Details
+    # Stored as VARCHAR + CHECK rather than a native Postgres ENUM so new
+    # variants need no ALTER TYPE and reads skip the enum catalog lookup.
     transaction_type = Column(
-        SQLEnum(TransactionType),
+        SQLEnum(
+            TransactionType,
+            native_enum=False,
+            length=20,
+            create_constraint=True,
+            name="check_transaction_type"
+        ),
         nullable=False,
         index=True
     )
@@ -116,10 +162,15 @@ class Transaction(BaseModel):
         nullable=False
     )
     status = Column(
-        SQLEnum(TransactionStatus),
+        SQLEnum(
+            TransactionStatus,
+            native_enum=False,
+            length=20,
+            create_constraint=True,
+            name="check_transaction_status"
+        ),
         default=TransactionStatus.PENDING,
-        nullable=False,
-        index=True
+        nullable=False
     )
 
     # Payment Gateway Info
@@ -129,8 +180,7 @@ class Transaction(BaseModel):
     )
     gateway_transaction_id = Column(
         String(255),
-        nullable=True,
-        unique=True  # External transaction ID must be unique
+        nullable=True  # Uniqueness enforced via payment_gateway_txn
     )
 
     # Fees
@@ -152,7 +202,7 @@ class Transaction(BaseModel):
         index=True
     )
     shares = Column(
-        Float,
+        Numeric(18, 6, asdecimal=False),  # Fixed-point; exact SUM, float in Python
         nullable=True  # Number of shares traded
     )
     price_per_share_bdt = Column(
@@ -161,11 +211,21 @@ class Transaction(BaseModel):
     )
 
     # Timestamps (immutable after creation)
+    created_at = Column(
+        DateTime(timezone=True),
+        default=func.now(),
+        primary_key=True,  # Partition key
+        nullable=False
+    )
     completed_at = Column(
         DateTime(timezone=True),
         nullable=True
     )
 
+    # eager_defaults: SQL-side defaults (created_at, updated_at) come back via
+    # INSERT ... RETURNING, so callers need no refresh after commit
+    __mapper_args__ = {"primary_key": [transaction_id], "eager_defaults": True}
+
     # Relationships
     land = relationship("Land", back_populates="transactions")
     seller = relationship(
@@ -189,13 +249,17 @@ class Transaction(BaseModel):
         """
         return self.amount_bdt - self.platform_fee_bdt - self.gateway_fee_bdt
 
-    def mark_completed(self) -> None:
+    def mark_completed(self, now: Optional[datetime] = None) -> None:
         """
         Mark transaction as completed.
         Sets status and completion timestamp.
+
+        Args:
+            now: Optional timezone-aware timestamp; bulk callers compute it
+                once outside the loop and pass it in
         """
         self.status = TransactionStatus.COMPLETED
-        self.completed_at = datetime.utcnow()
+        self.completed_at = now or datetime.now(timezone.utc)
 
     def mark_failed(self) -> None:
         """Mark transaction as failed."""
@@ -217,6 +281,68 @@ class Transaction(BaseModel):
         """
         return int(self.amount_bdt * (fee_percent / 100))
 
+    @staticmethod
+    def calculate_platform_fees(
+        amounts_bdt: Iterable[int],
+        fee_percent: float = 5.0
+    ) -> np.ndarray:
+        """
+        Vectorized platform fee calculation for batch/back-office jobs.
+
+        Works in integer basis points so the whole batch is a single int64
+        multiply and floor-divide instead of a Python loop over rows.
+
+        Args:
+            amounts_bdt: Transaction amounts in BDT (e.g. the result of
+                ``await db.scalars(select(Transaction.amount_bdt))``)
+            fee_percent: Platform fee percentage (default 5%)
+
+        Returns:
+            np.ndarray: int64 array of fees, aligned with amounts_bdt
+
+        Example:
+            ```python
+            amounts = np.fromiter(result, dtype=np.int64)
+            fees = Transaction.calculate_platform_fees(amounts, 2.5)
+            ```
+        """
+        if isinstance(amounts_bdt, np.ndarray):
+            amounts = amounts_bdt.astype(np.int64, copy=False)
+        else:
+            amounts = np.fromiter(amounts_bdt, dtype=np.int64)
+        fee_bp = int(round(fee_percent * 100))
+        return (amounts * fee_bp) // 10000
+
+    @classmethod
+    async def copy_from(cls, conn, records: Iterable[Tuple[Any, ...]]) -> int:
+        """
+        Bulk-load transactions with binary COPY (imports, migrations, restores).
+
+        Args:
+            conn: SQLAlchemy async connection
+            records: Tuples ordered like ``COPY_COLUMNS``
+
+        Returns:
+            int: Number of rows copied
+        """
+        return await copy_records_in(conn, cls.__tablename__, COPY_COLUMNS, records)
+
+    @classmethod
+    async def copy_to_gzip(cls, conn, path: str, table: Optional[str] = None) -> None:
+        """
+        Archive transactions to a gzip'd binary COPY file.
+
+        Args:
+            conn: SQLAlchemy async connection
+            path: Destination file path
+            table: Optional partition to export (e.g. ``transactions_2025_01``);
+                defaults to every partition via the parent table
+        """
+        if table:
+            await copy_table_to_gzip(conn, table, path, COPY_COLUMNS)
+        else:
+            await copy_table_to_gzip(conn, cls.__tablename__, path, COPY_COLUMNS, partitioned=True)
+
     def __repr__(self) -> str:
         """String representation of Transaction."""
         return f"<Transaction {self.transaction_id} - {self.amount_bdt} BDT>"
@@ -228,24 +354,19 @@ class Transaction(BaseModel):
         Returns:
             dict: Transaction data dictionary
         """
-        return {
-            "transaction_id": str(self.transaction_id),
-            "land_id": str(self.land_id) if self.land_id else None,
-            "seller_id": str(self.seller_id) if self.seller_id else None,
-            "buyer_id": str(self.buyer_id),
-            "listing_id": str(self.listing_id) if self.listing_id else None,
-            "transaction_type": self.transaction_type.value,
-            "amount_bdt": self.amount_bdt,
-            "currency": self.currency,
-            "status": self.status.value,
-            "gateway_name": self.gateway_name,
-            "gateway_transaction_id": self.gateway_transaction_id,
-            "platform_fee_bdt": self.platform_fee_bdt,
-            "gateway_fee_bdt": self.gateway_fee_bdt,
-            "seller_receives_bdt": self.seller_receives_bdt if self.seller_id else None,
-            "biome": self.biome,
-            "shares": self.shares,
-            "price_per_share_bdt": self.price_per_share_bdt,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "completed_at": self.completed_at.isoformat() if self.completed_at else None
-        }
+        data = self._columns_to_dict()
+        data["seller_receives_bdt"] = (
+            data["amount_bdt"] - data["platform_fee_bdt"] - data["gateway_fee_bdt"]
+            if data["seller_id"] else None
+        )
+        return data
+
+
+# Column order used by Transaction.copy_from / copy_to_gzip
+COPY_COLUMNS = (
+    "transaction_id", "land_id", "seller_id", "buyer_id", "listing_id",
+    "transaction_type", "amount_bdt", "currency", "status",
+    "gateway_name", "gateway_transaction_id", "platform_fee_bdt", "gateway_fee_bdt",
+    "biome", "shares", "price_per_share_bdt",
+    "created_at", "completed_at", "updated_at",
+)
@@ -3,15 +3,24 @@ User model
 Represents user accounts with authentication and profile information
 """
 
-from sqlalchemy import Column, String, Integer, Boolean, DateTime, Enum as SQLEnum
+from sqlalchemy import Column, String, Integer, Boolean, DateTime, Enum as SQLEnum, Index, update
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, deferred
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Any, Iterable, Optional, Tuple
 import uuid
 import bcrypt
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from enum import Enum as PyEnum
 
 from app.db.base import BaseModel
+from app.db.bulk_copy import copy_records_in, copy_table_to_gzip
+from app.config import settings
+
+# Bound once at import so the auth hot paths skip module attribute lookups
+_bcrypt_gensalt = bcrypt.gensalt
+_bcrypt_hashpw = bcrypt.hashpw
+_bcrypt_checkpw = bcrypt.checkpw
 
 
 class UserRole(str, PyEnum):
@@ -41,6 +50,28 @@ class User(BaseModel):
 
     __tablename__ = "users"
 
+    # Fields serialized by to_dict (see BaseModel.__init_subclass__)
+    __dict_fields__ = (
+        ("user_id", "str"),
+        ("username", "value"),
+        ("email", "value"),
+        ("role", "enum"),
+        ("balance_bdt", "value"),
+        ("avatar_url", "value"),
+        ("bio", "value"),
+        ("is_banned", "value"),
+        ("ban_reason", "value"),
+        ("verified", "value"),
+        ("created_at", "isoformat"),
+        ("updated_at", "isoformat"),
+    )
+
+    __table_args__ = (
+        # Covering index so the per-request lock check in get_current_user
+        # is an index-only scan
+        Index("idx_users_lock_state", "user_id", postgresql_include=["locked_until"]),
+    )
+
     # Primary Key
     user_id = Column(
         UUID(as_uuid=True),
@@ -62,10 +93,12 @@ class User(BaseModel):
         nullable=False,
         index=True
     )
-    password_hash = Column(
+    # Deferred: only the login path needs the hash, so regular user
+    # queries skip it. Load it explicitly with undefer(User.password_hash).
+    password_hash = deferred(Column(
         String(255),
         nullable=False
-    )
+    ))
     role = Column(
         SQLEnum(UserRole),
         default=UserRole.USER,
@@ -187,9 +220,8 @@ class User(BaseModel):
             user.set_password("SecurePassword123!")
             ```
         """
-        from app.config import settings
-        salt = bcrypt.gensalt(rounds=settings.bcrypt_rounds)
-        self.password_hash = bcrypt.hashpw(
+        salt = _bcrypt_gensalt(rounds=settings.bcrypt_rounds)
+        self.password_hash = _bcrypt_hashpw(
             password.encode('utf-8'),
             salt
         ).decode('utf-8')
@@ -212,30 +244,38 @@ class User(BaseModel):
             ```
         """
         try:
-            return bcrypt.checkpw(
+            return _bcrypt_checkpw(
                 password.encode('utf-8'),
                 self.password_hash.encode('utf-8')
             )
         except Exception:
             return False
 
-    def is_locked(self) -> bool:
+    def is_locked(self, now: Optional[datetime] = None) -> bool:
         """
         Check if account is currently locked due to failed login attempts.
 
+        Args:
+            now: Optional timezone-aware "current time" to reuse across checks
+
         Returns:
             bool: True if account is locked, False otherwise
         """
         if self.locked_until is None:
             return False
-        return datetime.utcnow() < self.locked_until
-
-    def add_failed_login(self, max_attempts: int, lockout_minutes: int) -> None:
+        return (now or datetime.now(timezone.utc)) < self.locked_until
+
+    def add_failed_login(
+        self,
+        max_attempts: int,
+        lockout_minutes: int,
+        now: Optional[datetime] = None
+    ) -> None:
         """Increment failed login counter and lock account using provided thresholds."""
         self.failed_login_attempts += 1
 
         if self.failed_login_attempts >= max_attempts:
-            self.locked_until = datetime.utcnow() + timedelta(minutes=lockout_minutes)
+            self.locked_until = (now or datetime.now(timezone.utc)) + timedelta(minutes=lockout_minutes)
 
     def reset_login_attempts(self) -> None:
         """
@@ -245,35 +285,106 @@ class User(BaseModel):
         self.failed_login_attempts = 0
         self.locked_until = None
 
-    def add_balance(self, amount_bdt: int) -> None:
+    @classmethod
+    async def add_balance(
+        cls,
+        db: AsyncSession,
+        user_id: uuid.UUID,
+        amount_bdt: int
+    ) -> Optional[int]:
         """
-        Add funds to user balance.
+        Atomically add funds to a user's balance with a single UPDATE.
+
+        The row is never loaded into Python, so no SELECT ... FOR UPDATE
+        is needed around the read-modify-write.
 
         Args:
+            db: Database session
+            user_id: User to credit
             amount_bdt: Amount to add (must be positive)
 
+        Returns:
+            Optional[int]: New balance, or None if the user does not exist
+
         Raises:
             ValueError: If amount is negative
         """
         if amount_bdt < 0:
             raise ValueError("Amount must be positive")
-        self.balance_bdt += amount_bdt
-
-    def deduct_balance(self, amount_bdt: int) -> None:
+        result = await db.execute(
+            update(cls)
+            .where(cls.user_id == user_id)
+            .values(balance_bdt=cls.balance_bdt + amount_bdt)
+            .returning(cls.balance_bdt)
+            .execution_options(synchronize_session="fetch")
+        )
+        return result.scalar_one_or_none()
+
+    @classmethod
+    async def deduct_balance(
+        cls,
+        db: AsyncSession,
+        user_id: uuid.UUID,
+        amount_bdt: int
+    ) -> int:
         """
-        Deduct funds from user balance.
+        Atomically deduct funds from a user's balance with a single UPDATE.
+
+        The sufficiency check is part of the WHERE clause, so concurrent
+        deductions can never drive the balance negative.
 
         Args:
+            db: Database session
+            user_id: User to debit
             amount_bdt: Amount to deduct (must be positive)
 
+        Returns:
+            int: New balance
+
         Raises:
-            ValueError: If amount is negative or exceeds balance
+            ValueError: If amount is negative, the user does not exist or
+                the balance is insufficient
         """
         if amount_bdt < 0:
             raise ValueError("Amount must be positive")
-        if amount_bdt > self.balance_bdt:
+        result = await db.execute(
+            update(cls)
+            .where(cls.user_id == user_id, cls.balance_bdt >= amount_bdt)
+            .values(balance_bdt=cls.balance_bdt - amount_bdt)
+            .returning(cls.balance_bdt)
+            .execution_options(synchronize_session="fetch")
+        )
+        new_balance = result.scalar_one_or_none()
+        if new_balance is None:
             raise ValueError("Insufficient balance")
-        self.balance_bdt -= amount_bdt
+        return new_balance
+
+    @classmethod
+    async def copy_from(cls, conn, records: Iterable[Tuple[Any, ...]]) -> int:
+        """
+        Bulk-load users with binary COPY (seed loads, migrations, restores).
+
+        Records must carry an already-hashed password.
+
+        Args:
+            conn: SQLAlchemy async connection
+            records: Tuples ordered like ``COPY_COLUMNS``
+
+        Returns:
+            int: Number of rows copied
+        """
+        return await copy_records_in(conn, cls.__tablename__, COPY_COLUMNS, records)
+
+    @classmethod
+    async def copy_to_gzip(cls, conn, path: str) -> None:
+        """
+        Export users to a gzip'd binary COPY file.
+
+        Args:
+            conn: SQLAlchemy async connection
+            path: Destination file path
+        """
+        await copy_table_to_gzip(conn, cls.__tablename__, path, COPY_COLUMNS)
 
     def __repr__(self) -> str:
         """String representation of User."""
@@ -287,17 +398,14 @@ class User(BaseModel):
         Returns:
             dict: User data dictionary
         """
-        return {
-            "user_id": str(self.user_id),
-            "username": self.username,
-            "email": self.email,
-            "role": self.role.value,
-            "balance_bdt": self.balance_bdt,
-            "avatar_url": self.avatar_url,
-            "bio": self.bio,
-            "is_banned": self.is_banned,
-            "ban_reason": self.ban_reason,
-            "verified": self.verified,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None
-        }
+        return self._columns_to_dict()
+
+
+# Column order used by User.copy_from / copy_to_gzip
+COPY_COLUMNS = (
+    "user_id", "username", "email", "password_hash", "role",
+    "avatar_url", "bio", "is_banned", "ban_reason", "balance_bdt", "verified",
+    "failed_login_attempts", "locked_until",
+    "is_suspended", "suspension_reason", "suspended_until", "last_login",
+    "created_at", "updated_at",
+)
@@ -0,0 +1,47 @@
+"""
+Shared schema base classes
+"""
+
+from pydantic import BaseModel
+from typing import Any, Dict, Optional, TypeVar
+
+from app.config import settings
+
+ResponseT = TypeVar("ResponseT", bound="TrustedResponseModel")
+
+
+class TrustedResponseModel(BaseModel):
+    """Response model that can be built from server-produced data without validation."""
+
+    @classmethod
+    def from_trusted(cls: type[ResponseT], data: Dict[str, Any], **extra: Any) -> ResponseT:
+        """
+        Build a response from server-built data (model ``to_dict`` output, cache hits).
+
+        Skips validation via ``model_construct``; set ``DEBUG_VALIDATE=true`` to
+        validate anyway (e.g. in staging/CI). Never use for client input.
+
+        Args:
+            data: Field values, typically ``obj.to_dict()``
+            **extra: Additional field values merged over ``data``
+        """
+        if extra:
+            data = {**data, **extra}
+        if settings.debug_validate:
+            return cls.model_validate(data)
+        return cls.model_construct(**data)
+
+
+def schema_example(example: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    OpenAPI ``json_schema_extra`` holding ``example``, in development only.
+
+    Outside development the example dicts are dropped so they are not kept
+    on every schema or rendered into the cached OpenAPI document.
+
+    Args:
+        example: Example payload for the schema
+    """
+    if settings.environment == "development":
+        return {"example": example}
+    return None
@@ -3,11 +3,13 @@ Biome Trading Schemas
 Pydantic models for biome market API requests/responses
 """
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, validator
 from typing import Optional, List, Dict
 from datetime import datetime
 from enum import Enum
 
+from app.schemas.base import TrustedResponseModel, schema_example
+
 
 class BiomeType(str, Enum):
     """Biome type enum."""
@@ -40,8 +42,7 @@ class BiomeMarketResponse(BaseModel):
     last_redistribution: str
     updated_at: str
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, extra="forbid", frozen=True)
 
 
 class AllBiomeMarketsResponse(BaseModel):
@@ -57,33 +58,35 @@ class AllBiomeMarketsResponse(BaseModel):
 
 class BuySharesRequest(BaseModel):
     """Schema for buying biome shares."""
+    model_config = ConfigDict(
+        extra="forbid",
+        frozen=True,
+        json_schema_extra=schema_example({
+            "biome": "forest",
+            "amount_bdt": 1000
+        })
+    )
+
     biome: BiomeType = Field(..., description="Biome to buy shares in")
     amount_bdt: int = Field(..., ge=1, description="Amount in BDT to spend")
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "biome": "forest",
-                "amount_bdt": 1000
-            }
-        }
-
 
 class SellSharesRequest(BaseModel):
     """Schema for selling biome shares."""
+    model_config = ConfigDict(
+        extra="forbid",
+        frozen=True,
+        json_schema_extra=schema_example({
+            "biome": "forest",
+            "shares": 10.5
+        })
+    )
+
     biome: BiomeType = Field(..., description="Biome to sell shares from")
     shares: float = Field(..., gt=0, description="Number of shares to sell")
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "biome": "forest",
-                "shares": 10.5
-            }
-        }
-
 
-class TradeResponse(BaseModel):
+class TradeResponse(TrustedResponseModel):
     """Schema for trade execution response."""
     transaction_id: str
     user_id: str
@@ -96,8 +99,7 @@ class TradeResponse(BaseModel):
     executed_at: str
     message: str
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # =============================================================================
@@ -117,8 +119,7 @@ class BiomeHoldingResponse(BaseModel):
     unrealized_gain_percent: Optional[float] = None
     created_at: str
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class PortfolioResponse(BaseModel):
@@ -143,8 +144,7 @@ class BiomeTransactionResponse(BaseModel):
     realized_gain_bdt: Optional[float] = None
     executed_at: str
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class TransactionHistoryResponse(BaseModel):
@@ -153,12 +153,22 @@ class TransactionHistoryResponse(BaseModel):
     pagination: Dict
 
 
+# Module-level adapters: the list validators/serializers are built once at
+# import instead of per request.
+BIOME_MARKET_LIST_ADAPTER = TypeAdapter(List[BiomeMarketResponse])
+ALL_BIOME_MARKETS_ADAPTER = TypeAdapter(AllBiomeMarketsResponse)
+BIOME_TRANSACTION_LIST_ADAPTER = TypeAdapter(List[BiomeTransactionResponse])
+
+
 # =============================================================================
 # Price History Schemas
 # =============================================================================
 
 class PriceHistoryPoint(BaseModel):
     """Schema for single price history point."""
+    # Built in bulk per history request; immutable and closed to extras
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     timestamp: str
     price_bdt: float
     market_cash_bdt: int
@@ -174,6 +184,10 @@ class BiomePriceHistoryResponse(BaseModel):
     data_points: int
 
 
+# Validates a whole history window in one pydantic-core call
+PRICE_HISTORY_LIST_ADAPTER = TypeAdapter(List[PriceHistoryPoint])
+
+
 class AllBiomesPriceHistoryResponse(BaseModel):
     """Schema for all biomes price history."""
     biomes: Dict[str, List[PriceHistoryPoint]]
@@ -191,12 +205,10 @@ class TrackAttentionRequest(BaseModel):
     score: float = Field(..., ge=0, description="Attention score to add (e.g., seconds spent, clicks)")
 
     class Config:
-        json_schema_extra = {
-            "example": {
-                "biome": "plains",
-                "score": 5.0
-            }
-        }
+        json_schema_extra = schema_example({
+            "biome": "plains",
+            "score": 5.0
+        })
 
 
 class AttentionScoreResponse(BaseModel):
@@ -207,8 +219,7 @@ class AttentionScoreResponse(BaseModel):
     score: float
     last_activity: str
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # =============================================================================
@@ -2,10 +2,12 @@
 Land-related Pydantic schemas for request/response validation
 """
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from typing import Optional, List
 from datetime import datetime
 
+from app.schemas.base import schema_example
+
 
 class LandResponse(BaseModel):
     """Schema for land response."""
@@ -24,25 +26,24 @@ class LandResponse(BaseModel):
     for_sale: bool
     created_at: datetime
 
-    class Config:
-        from_attributes = True
-        json_schema_extra = {
-            "example": {
-                "land_id": "land-uuid-1234",
-                "owner_id": "user-uuid-5678",
-                "owner_username": "john_doe",
-                "coordinates": {"x": 120, "y": 340, "z": 0},
-                "biome": "forest",
-                "elevation": 0.65,
-                "color_hex": "#2d5016",
-                "fenced": False,
-                "passcode_required": False,
-                "public_message": "Welcome to my forest!",
-                "price_base_bdt": 1500,
-                "for_sale": False,
-                "created_at": "2025-01-15T10:20:30Z"
-            }
-        }
+    model_config = ConfigDict(
+        from_attributes=True,
+        json_schema_extra=schema_example({
+            "land_id": "land-uuid-1234",
+            "owner_id": "user-uuid-5678",
+            "owner_username": "john_doe",
+            "coordinates": {"x": 120, "y": 340, "z": 0},
+            "biome": "forest",
+            "elevation": 0.65,
+            "color_hex": "#2d5016",
+            "fenced": False,
+            "passcode_required": False,
+            "public_message": "Welcome to my forest!",
+            "price_base_bdt": 1500,
+            "for_sale": False,
+            "created_at": "2025-01-15T10:20:30Z"
+        })
+    )
 
 
 class LandUpdate(BaseModel):
@@ -51,11 +52,9 @@ class LandUpdate(BaseModel):
     public_message: Optional[str] = Field(None, max_length=500)
 
     class Config:
-        json_schema_extra = {
-            "example": {
-                "public_message": "Welcome to my land!"
-            }
-        }
+        json_schema_extra = schema_example({
+            "public_message": "Welcome to my land!"
+        })
 
 
 class LandFence(BaseModel):
@@ -73,12 +72,10 @@ class LandFence(BaseModel):
         return v
 
     class Config:
-        json_schema_extra = {
-            "example": {
-                "fenced": True,
-                "passcode": "1234"
-            }
-        }
+        json_schema_extra = schema_example({
+            "fenced": True,
+            "passcode": "1234"
+        })
 
 
 class LandTransfer(BaseModel):
@@ -88,12 +85,10 @@ class LandTransfer(BaseModel):
     message: Optional[str] = Field(None, max_length=200)
 
     class Config:
-        json_schema_extra = {
-            "example": {
-                "new_owner_id": "user-uuid-9012",
-                "message": "Gift for you!"
-            }
-        }
+        json_schema_extra = schema_example({
+            "new_owner_id": "user-uuid-9012",
+            "message": "Gift for you!"
+        })
 
 
 class LandSearch(BaseModel):
@@ -121,17 +116,15 @@ class LandSearch(BaseModel):
         return v
 
     class Config:
-        json_schema_extra = {
-            "example": {
-                "biome": "forest",
-                "min_price_bdt": 1000,
-                "max_price_bdt": 5000,
-                "for_sale": True,
-                "page": 1,
-                "limit": 20,
-                "sort": "price_asc"
-        }
-        }
+        json_schema_extra = schema_example({
+            "biome": "forest",
+            "min_price_bdt": 1000,
+            "max_price_bdt": 5000,
+            "for_sale": True,
+            "page": 1,
+            "limit": 20,
+            "sort": "price_asc"
+        })
 
 
 class LandChatAccessEntry(BaseModel):
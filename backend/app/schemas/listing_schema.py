@@ -3,25 +3,25 @@ Listing Schemas
 Pydantic models for marketplace listing requests/responses
 """
 
-from pydantic import BaseModel, Field, validator
-from typing import Optional, List, Dict
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator, validator
+from typing import Optional, List, Literal
+from typing_extensions import NotRequired, TypedDict
 from datetime import datetime
-from enum import Enum
+import re
 
+from app.schemas.base import TrustedResponseModel, schema_example
 
-class ListingType(str, Enum):
-    """Listing type enum."""
-    AUCTION = "auction"
-    FIXED_PRICE = "fixed_price"
-    AUCTION_WITH_BUYNOW = "auction_with_buynow"
 
+# Compiled once at import; validators below reuse it on every request
+# (\Z rather than $, which would also accept a trailing newline)
+_PAYMENT_RE = re.compile(r"^(balance|bkash|nagad|rocket|sslcommerz)\Z")
 
-class ListingStatus(str, Enum):
-    """Listing status enum."""
-    ACTIVE = "active"
-    SOLD = "sold"
-    CANCELLED = "cancelled"
-    EXPIRED = "expired"
+
+# Literal aliases validate as plain string compares in pydantic-core; code
+# that needs the members uses the enums in app.models.listing instead.
+ListingType = Literal["auction", "fixed_price", "auction_with_buynow"]
+ListingStatus = Literal["active", "sold", "cancelled", "expired"]
+ListingSortKey = Literal["price_asc", "price_desc", "created_at_asc", "created_at_desc", "ending_soon"]
 
 
 class ListingCreate(BaseModel):
@@ -65,51 +65,53 @@ class ListingCreate(BaseModel):
             raise ValueError("Maximum 1000 lands per parcel")
         return v
 
-    @validator("starting_price_bdt")
-    def validate_starting_price(cls, v, values):
-        """Validate starting price for auctions."""
-        listing_type = values.get("listing_type")
-        if listing_type in [ListingType.AUCTION, ListingType.AUCTION_WITH_BUYNOW]:
-            if v is None:
+    @model_validator(mode="after")
+    def validate_listing_type_fields(self) -> "ListingCreate":
+        """Validate price/duration fields required by the listing type."""
+        listing_type = self.listing_type
+        if listing_type in ("auction", "auction_with_buynow"):
+            if self.starting_price_bdt is None:
                 raise ValueError("starting_price_bdt required for auctions")
-        return v
-
-    @validator("buy_now_price_bdt")
-    def validate_buy_now_price(cls, v, values):
-        """Validate buy now price."""
-        listing_type = values.get("listing_type")
-        if listing_type in [ListingType.FIXED_PRICE, ListingType.AUCTION_WITH_BUYNOW]:
-            if v is None:
-                raise ValueError("buy_now_price_bdt required for this listing type")
-        return v
-
-    @validator("duration_hours")
-    def validate_duration(cls, v, values):
-        """Validate duration for auctions."""
-        listing_type = values.get("listing_type")
-        if listing_type in [ListingType.AUCTION, ListingType.AUCTION_WITH_BUYNOW]:
-            if v is None:
+            if self.duration_hours is None:
                 raise ValueError("duration_hours required for auctions")
-        return v
+        if listing_type in ("fixed_price", "auction_with_buynow"):
+            if self.buy_now_price_bdt is None:
+                raise ValueError("buy_now_price_bdt required for this listing type")
+        return self
 
     class Config:
-        json_schema_extra = {
-            "example": {
-                "land_ids": [
-                    "123e4567-e89b-12d3-a456-426614174000",
-                    "223e4567-e89b-12d3-a456-426614174000"
-                ],
-                "listing_type": "auction",
-                "starting_price_bdt": 100,
-                "reserve_price_bdt": 150,
-                "buy_now_price_bdt": 200,
-                "duration_hours": 24,
-                "auto_extend_minutes": 5
-            }
-        }
-
-
-class ListingResponse(BaseModel):
+        json_schema_extra = schema_example({
+            "land_ids": [
+                "123e4567-e89b-12d3-a456-426614174000",
+                "223e4567-e89b-12d3-a456-426614174000"
+            ],
+            "listing_type": "auction",
+            "starting_price_bdt": 100,
+            "reserve_price_bdt": 150,
+            "buy_now_price_bdt": 200,
+            "duration_hours": 24,
+            "auto_extend_minutes": 5
+        })
+
+
+class LandSummary(TypedDict):
+    """Land row inside a parcel listing."""
+    land_id: NotRequired[str]
+    x: int
+    y: int
+    biome: str
+    elevation: NotRequired[float]
+
+
+class BoundingBox(TypedDict):
+    """Parcel bounding box."""
+    min_x: int
+    max_x: int
+    min_y: int
+    max_y: int
+
+
+class ListingResponse(TrustedResponseModel):
     """Schema for listing response (parcel)."""
     listing_id: str
     land_count: int
@@ -128,12 +130,11 @@ class ListingResponse(BaseModel):
     updated_at: str
 
     # Parcel information
-    lands: Optional[List[Dict]] = None  # List of land details
-    bounding_box: Optional[Dict] = None  # min_x, max_x, min_y, max_y
+    lands: Optional[List[LandSummary]] = None  # List of land details
+    bounding_box: Optional[BoundingBox] = None
     biomes: Optional[List[str]] = None  # Unique biomes in parcel
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class BidCreate(BaseModel):
@@ -141,11 +142,9 @@ class BidCreate(BaseModel):
     amount_bdt: int = Field(..., ge=1, description="Bid amount in BDT")
 
     class Config:
-        json_schema_extra = {
-            "example": {
-                "amount_bdt": 150
-            }
-        }
+        json_schema_extra = schema_example({
+            "amount_bdt": 150
+        })
 
 
 class BidResponse(BaseModel):
@@ -158,51 +157,47 @@ class BidResponse(BaseModel):
     status: str
     created_at: str
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class BuyNowRequest(BaseModel):
     """Schema for instant buy now purchase."""
-    payment_method: str = Field(
-        ...,
-        pattern="^(balance|bkash|nagad|rocket|sslcommerz)$",
-        description="Payment method"
-    )
+    payment_method: str = Field(..., description="Payment method")
+
+    @field_validator("payment_method")
+    @classmethod
+    def validate_payment_method(cls, v: str) -> str:
+        """Validate payment method against supported gateways."""
+        if not _PAYMENT_RE.match(v):
+            raise ValueError("payment_method must be one of: balance, bkash, nagad, rocket, sslcommerz")
+        return v
 
     class Config:
-        json_schema_extra = {
-            "example": {
-                "payment_method": "balance"
-            }
-        }
+        json_schema_extra = schema_example({
+            "payment_method": "balance"
+        })
 
 
 class ListingSearch(BaseModel):
     """Schema for searching listings."""
-    status: Optional[str] = None
-    listing_type: Optional[str] = None
+    status: Optional[ListingStatus] = None
+    listing_type: Optional[ListingType] = None
     min_price_bdt: Optional[int] = Field(None, ge=0)
     max_price_bdt: Optional[int] = Field(None, ge=0)
     biome: Optional[str] = None
     seller_id: Optional[str] = None
-    sort_by: str = Field(
-        "created_at_desc",
-        pattern="^(price_asc|price_desc|created_at_asc|created_at_desc|ending_soon)$"
-    )
+    sort_by: ListingSortKey = "created_at_desc"
     page: int = Field(1, ge=1)
     limit: int = Field(20, ge=1, le=100)
 
     class Config:
-        json_schema_extra = {
-            "example": {
-                "status": "active",
-                "listing_type": "auction",
-                "min_price_bdt": 50,
-                "max_price_bdt": 500,
-                "biome": "plains",
-                "sort_by": "ending_soon",
-                "page": 1,
-                "limit": 20
-            }
-        }
+        json_schema_extra = schema_example({
+            "status": "active",
+            "listing_type": "auction",
+            "min_price_bdt": 50,
+            "max_price_bdt": 500,
+            "biome": "plains",
+            "sort_by": "ending_soon",
+            "page": 1,
+            "limit": 20
+        })
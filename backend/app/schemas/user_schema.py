@@ -2,71 +2,84 @@
 User-related Pydantic schemas for request/response validation
 """
 
-from pydantic import BaseModel, EmailStr, Field, field_validator
-from typing import Optional
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field, WithJsonSchema, field_validator
+from pydantic.networks import validate_email
+from typing import Annotated, Optional
+from functools import lru_cache
 from datetime import datetime
 from uuid import UUID
 import re
 from app.config import settings
+from app.schemas.base import schema_example
+
+# Password character-class rules; length is enforced by Field(min_length=...)
+_PASSWORD_RULES = (
+    (re.compile(r"[A-Z]"), 'Password must include at least one uppercase letter'),
+    (re.compile(r"[a-z]"), 'Password must include at least one lowercase letter'),
+    (re.compile(r"[0-9]"), 'Password must include at least one number'),
+    (re.compile(r"[^A-Za-z0-9]"), 'Password must include at least one special character'),
+)
+
+_USERNAME_PATTERN = r"^[A-Za-z0-9]+$"
+
+
+@lru_cache(maxsize=8192)
+def _normalize_email(value: str) -> str:
+    """Validate and normalize an email address (memoized; the check is pure, no DNS)."""
+    return validate_email(value)[1]
+
+
+# Same validation as EmailStr, cached for repeated submissions (login retries,
+# re-sent registrations)
+Email = Annotated[
+    str,
+    AfterValidator(_normalize_email),
+    WithJsonSchema({"type": "string", "format": "email"}),
+]
+
+
+def _check_password_policy(v: str) -> str:
+    """Raise ValueError if the password misses a required character class."""
+    for pattern, message in _PASSWORD_RULES:
+        if not pattern.search(v):
+            raise ValueError(message)
+    return v
 
 
 class UserCreate(BaseModel):
     """Schema for user registration."""
 
-    username: str = Field(..., min_length=3, max_length=32)
-    email: EmailStr
+    username: str = Field(..., min_length=3, max_length=32, pattern=_USERNAME_PATTERN)
+    email: Email
     password: str = Field(..., min_length=settings.password_min_length)
     country_code: str = Field(default="BD", max_length=2)
 
-    @field_validator('username')
-    @classmethod
-    def validate_username(cls, v: str) -> str:
-        """Validate username is alphanumeric."""
-        if not v.isalnum():
-            raise ValueError('Username must be alphanumeric (letters and numbers only)')
-        return v
-
     @field_validator('password')
     @classmethod
     def validate_password(cls, v: str) -> str:
         """Validate password meets security policy."""
-        min_len = settings.password_min_length
-        if len(v) < min_len:
-            raise ValueError(f'Password must be at least {min_len} characters')
-        if not re.search(r"[A-Z]", v):
-            raise ValueError('Password must include at least one uppercase letter')
-        if not re.search(r"[a-z]", v):
-            raise ValueError('Password must include at least one lowercase letter')
-        if not re.search(r"[0-9]", v):
-            raise ValueError('Password must include at least one number')
-        if not re.search(r"[^A-Za-z0-9]", v):
-            raise ValueError('Password must include at least one special character')
-        return v
+        return _check_password_policy(v)
 
     class Config:
-        json_schema_extra = {
-            "example": {
-                "username": "john_doe",
-                "email": "john@example.com",
-                "password": "DemoPassword123!",
-                "country_code": "BD"
-            }
-        }
+        json_schema_extra = schema_example({
+            "username": "john_doe",
+            "email": "john@example.com",
+            "password": "DemoPassword123!",
+            "country_code": "BD"
+        })
 
 
 class UserLogin(BaseModel):
     """Schema for user login."""
 
-    email: EmailStr
+    email: Email
     password: str
 
     class Config:
-        json_schema_extra = {
-            "example": {
-                "email": "john@example.com",
-                "password": "DemoPassword123!"
-            }
-        }
+        json_schema_extra = schema_example({
+            "email": "john@example.com",
+            "password": "DemoPassword123!"
+        })
 
 
 class UserResponse(BaseModel):
@@ -85,52 +98,38 @@ class UserResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
-        json_encoders = {
-            UUID: str
-        }
-        json_schema_extra = {
-            "example": {
-                "user_id": "550e8400-e29b-41d4-a716-446655440000",
-                "username": "john_doe",
-                "email": "john@example.com",
-                "role": "user",
-                "balance_bdt": 50000,
-                "avatar_url": "https://example.com/avatar.jpg",
-                "bio": "Virtual land enthusiast",
-                "is_banned": False,
-                "ban_reason": None,
-                "verified": True,
-                "created_at": "2025-01-15T10:20:30Z",
-                "updated_at": "2025-01-15T10:20:30Z"
-            }
-        }
+    model_config = ConfigDict(
+        from_attributes=True,
+        json_schema_extra=schema_example({
+            "user_id": "550e8400-e29b-41d4-a716-446655440000",
+            "username": "john_doe",
+            "email": "john@example.com",
+            "role": "user",
+            "balance_bdt": 50000,
+            "avatar_url": "https://example.com/avatar.jpg",
+            "bio": "Virtual land enthusiast",
+            "is_banned": False,
+            "ban_reason": None,
+            "verified": True,
+            "created_at": "2025-01-15T10:20:30Z",
+            "updated_at": "2025-01-15T10:20:30Z"
+        })
+    )
 
 
 class UserUpdate(BaseModel):
     """Schema for updating user profile."""
 
-    username: Optional[str] = Field(None, min_length=3, max_length=32)
+    username: Optional[str] = Field(None, min_length=3, max_length=32, pattern=_USERNAME_PATTERN)
     bio: Optional[str] = Field(None, max_length=500)
     avatar_url: Optional[str] = None
 
-    @field_validator('username')
-    @classmethod
-    def validate_username(cls, v: Optional[str]) -> Optional[str]:
-        """Validate username if provided."""
-        if v is not None and not v.isalnum():
-            raise ValueError('Username must be alphanumeric')
-        return v
-
     class Config:
-        json_schema_extra = {
-            "example": {
-                "username": "john_doe_updated",
-                "bio": "Updated bio",
-                "avatar_url": "https://example.com/new-avatar.jpg"
-            }
-        }
+        json_schema_extra = schema_example({
+            "username": "john_doe_updated",
+            "bio": "Updated bio",
+            "avatar_url": "https://example.com/new-avatar.jpg"
+        })
 
 
 class TokenResponse(BaseModel):
@@ -143,21 +142,19 @@ class TokenResponse(BaseModel):
     previous_session_terminated: bool = False
 
     class Config:
-        json_schema_extra = {
-            "example": {
-                "access_token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...",
-                "token_type": "Bearer",
-                "expires_in": 3600,
-                "previous_session_terminated": True,
-                "user": {
-                    "user_id": "550e8400-e29b-41d4-a716-446655440000",
-                    "username": "john_doe",
-                    "email": "john@example.com",
-                    "role": "user",
-                    "balance_bdt": 50000
-                }
+        json_schema_extra = schema_example({
+            "access_token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...",
+            "token_type": "Bearer",
+            "expires_in": 3600,
+            "previous_session_terminated": True,
+            "user": {
+                "user_id": "550e8400-e29b-41d4-a716-446655440000",
+                "username": "john_doe",
+                "email": "john@example.com",
+                "role": "user",
+                "balance_bdt": 50000
             }
-        }
+        })
 
 
 class PasswordChange(BaseModel):
@@ -170,15 +167,4 @@ class PasswordChange(BaseModel):
     @classmethod
     def validate_new_password(cls, v: str) -> str:
         """Validate new password meets security policy."""
-        min_len = settings.password_min_length
-        if len(v) < min_len:
-            raise ValueError(f'Password must be at least {min_len} characters')
-        if not re.search(r"[A-Z]", v):
-            raise ValueError('Password must include at least one uppercase letter')
-        if not re.search(r"[a-z]", v):
-            raise ValueError('Password must include at least one lowercase letter')
-        if not re.search(r"[0-9]", v):
-            raise ValueError('Password must include at least one number')
-        if not re.search(r"[^A-Za-z0-9]", v):
-            raise ValueError('Password must include at least one special character')
-        return v
+        return _check_password_policy(v)
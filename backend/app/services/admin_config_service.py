@@ -0,0 +1,86 @@
+"""
+Admin config snapshot cache for hot read paths (trading checks, rate limits).
+"""
+
+import time
+from typing import Optional
+
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session, object_session
+
+from app.db.session import AsyncSessionLocal
+from app.models.admin_config import AdminConfig
+
+
+class AdminConfigCache:
+    """
+    Per-process read-only snapshot of the single AdminConfig row.
+
+    Committing an insert/update of AdminConfig in this process bumps
+    ``version`` (via ORM events), which drops the snapshot immediately. The
+    TTL bounds how long other worker processes can serve a stale copy after
+    an admin change.
+    The snapshot is loaded on its own session and detached: read it, never
+    mutate it.
+    """
+
+    def __init__(self, ttl_seconds: float = 5.0):
+        self.ttl_seconds = ttl_seconds
+        self.version = 0
+        self._config: Optional[AdminConfig] = None
+        self._config_version = -1
+        self._expires_at = 0.0
+
+    def invalidate(self) -> None:
+        """Drop the cached snapshot after a config change."""
+        self.version += 1
+
+    async def get(self) -> Optional[AdminConfig]:
+        """
+        Return the admin config, reloading it when stale.
+
+        Returns:
+            Optional[AdminConfig]: Detached config snapshot, or None if no row
+        """
+        if self._config_version == self.version and time.monotonic() < self._expires_at:
+            return self._config
+
+        version = self.version
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(select(AdminConfig).limit(1))
+            config = result.scalar_one_or_none()
+
+        # An update racing with the load leaves version ahead, so the next
+        # call reloads instead of trusting this copy.
+        self._config = config
+        self._config_version = version
+        self._expires_at = time.monotonic() + self.ttl_seconds
+        return config
+
+
+# Global cache instance
+admin_config_cache = AdminConfigCache()
+
+
+@event.listens_for(AdminConfig, "after_insert")
+@event.listens_for(AdminConfig, "after_update")
+def _mark_admin_config_changed(mapper, connection, target) -> None:
+    session = object_session(target)
+    if session is not None:
+        session.info["admin_config_changed"] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_admin_config(session) -> None:
+    # Invalidate only once the change is committed, so a concurrent reload
+    # cannot cache the pre-commit row under the new version.
+    if session.info.pop("admin_config_changed", False):
+        admin_config_cache.invalidate()
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_admin_config_change(session, previous_transaction) -> None:
+    # Only an outermost rollback discards the change; a savepoint rollback
+    # leaves the enclosing transaction's changes pending.
+    if not session.in_transaction():
+        session.info.pop("admin_config_changed", None)
@@ -4,7 +4,9 @@ Tracks user attention per biome for market redistribution
 """
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, update, func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.sql import Subquery
 from datetime import datetime
 from typing import Optional
 import uuid
@@ -39,28 +41,31 @@ class AttentionTrackingService:
         Returns:
             AttentionScore record
         """
-        # Get or create attention score record
-        result = await db.execute(
-            select(AttentionScore).where(
-                AttentionScore.user_id == user_id,
-                AttentionScore.biome == biome
-            )
+        # Single atomic upsert on the (user_id, biome) unique index instead
+        # of SELECT + INSERT/UPDATE; also closes the race between the two.
+        now = datetime.utcnow()
+        stmt = insert(AttentionScore).values(
+            user_id=user_id,
+            biome=biome,
+            score=score,
+            last_activity=now
         )
-        attention_score = result.scalar_one_or_none()
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[AttentionScore.user_id, AttentionScore.biome],
+            set_={
+                "score": AttentionScore.score + stmt.excluded.score,
+                "last_activity": stmt.excluded.last_activity,
+                "updated_at": func.now(),
+            }
+        ).returning(AttentionScore)
 
-        if not attention_score:
-            attention_score = AttentionScore(
-                user_id=user_id,
-                biome=biome,
-                score=0.0
-            )
-            db.add(attention_score)
+        result = await db.execute(
+            stmt,
+            execution_options={"populate_existing": True}
+        )
+        attention_score = result.scalar_one()
 
-        # Add score
-        attention_score.add_score(score)
-        
         await db.commit()
-        await db.refresh(attention_score)
 
         logger.debug(f"Tracked attention: user={user_id}, biome={biome.value}, score={score}")
 
@@ -106,8 +111,6 @@ class AttentionTrackingService:
         Returns:
             Total attention score
         """
-        from sqlalchemy import func
-        
         result = await db.execute(
             select(func.sum(AttentionScore.score)).where(
                 AttentionScore.biome == biome
@@ -116,6 +119,23 @@ class AttentionTrackingService:
         total = result.scalar()
         return total if total else 0.0
 
+    @staticmethod
+    def biome_attention_totals() -> Subquery:
+        """
+        Grouped per-biome attention totals, for joining onto other queries.
+
+        Returns:
+            Subquery with ``biome`` and ``total`` columns
+        """
+        return (
+            select(
+                AttentionScore.biome,
+                func.sum(AttentionScore.score).label("total")
+            )
+            .group_by(AttentionScore.biome)
+            .subquery()
+        )
+
     @staticmethod
     async def reset_all_attention(db: AsyncSession) -> None:
         """
@@ -125,12 +145,14 @@ class AttentionTrackingService:
         Args:
             db: Database session
         """
-        result = await db.execute(select(AttentionScore))
-        attention_scores = result.scalars().all()
-
-        for score in attention_scores:
-            score.reset()
-
+        # Single set-based UPDATE; rows are never loaded into the session.
+        # Rows already at zero are skipped to avoid rewriting them.
+        await db.execute(
+            update(AttentionScore)
+            .where(AttentionScore.score != 0.0)
+            .values(score=0.0)
+            .execution_options(synchronize_session="evaluate")
+        )
         await db.commit()
         logger.info("Reset all attention scores")
 
@@ -0,0 +1,18 @@
+"""
+Audit Log Batcher
+Moves audit log inserts off the request path into batched background writes
+"""
+
+from app.models.audit_log import AuditLog
+from app.services.insert_batcher import InsertBatcher
+
+
+class AuditLogBatcher(InsertBatcher):
+    """Batches audit log rows; enqueue dict payloads of AuditLog columns."""
+
+    def __init__(self, **kwargs):
+        super().__init__(AuditLog, "audit log", **kwargs)
+
+
+# Global batcher instance
+audit_log_batcher = AuditLogBatcher()
@@ -4,15 +4,54 @@ Handles JWT token generation, verification, and user authentication
 """
 
 import jwt
+import orjson
+import base64
+import binascii
+import calendar
+import hmac
 import secrets
+import time
 from datetime import datetime, timedelta
-from typing import Optional, Dict
+from typing import Any, Optional, Dict, Tuple
 import logging
 
 from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Verified access-token payloads are reused for at most this long, and never
+# past the token's own exp. Revocation is enforced separately by the session
+# check in get_current_user, so caching the signature check is safe.
+TOKEN_CACHE_TTL_SECONDS = 60.0
+TOKEN_CACHE_MAX_ENTRIES = 10000
+# Tokens that failed verification are rejected from memory for this long,
+# so clients retrying a dead token do not pay for decoding it each time.
+BAD_TOKEN_TTL_SECONDS = 30.0
+
+# HMAC algorithms signed/verified directly with the stdlib hmac module
+# (OpenSSL-backed) instead of PyJWT's generic algorithm objects.
+_HMAC_DIGESTS = {
+    "HS256": "sha256",
+    "HS384": "sha384",
+    "HS512": "sha512",
+}
+
+
+def _b64encode(data: bytes) -> bytes:
+    """base64url without padding, as used by JWS."""
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+def _b64decode(data: bytes) -> bytes:
+    return base64.urlsafe_b64decode(data + b"=" * (-len(data) % 4))
+
+
+def _numeric_date(value: Any) -> Any:
+    """Encode a datetime time claim as NumericDate, matching PyJWT."""
+    if isinstance(value, datetime):
+        return calendar.timegm(value.utctimetuple())
+    return value
+
 
 class AuthService:
     """
@@ -41,6 +80,81 @@ class AuthService:
         self.algorithm = algorithm or settings.jwt_algorithm
         self.access_token_expire_minutes = settings.jwt_access_token_expire_minutes
         self.refresh_token_expire_days = settings.jwt_refresh_token_expire_days
+        # token -> (cache expiry as unix time, verified payload)
+        self._token_cache: Dict[str, Tuple[float, Dict]] = {}
+        # token -> (cache expiry as unix time, rejection message)
+        self._bad_tokens: Dict[str, Tuple[float, str]] = {}
+
+        # HS* tokens use the native HMAC codec below; anything else
+        # (e.g. RS256) goes through PyJWT.
+        self._hmac_digest = _HMAC_DIGESTS.get(self.algorithm)
+        # Keyed HMAC state built once; each signature copies it instead of
+        # re-deriving the padded inner/outer keys from the secret.
+        self._hmac_key = (
+            hmac.new(self.secret_key.encode("utf-8"), digestmod=self._hmac_digest)
+            if self._hmac_digest else None
+        )
+        self._header_segment = _b64encode(
+            orjson.dumps({"alg": self.algorithm, "typ": "JWT"})
+        )
+
+    def _hmac_sign(self, signing_input: bytes) -> bytes:
+        """HMAC signature of the JWS signing input."""
+        mac = self._hmac_key.copy()
+        mac.update(signing_input)
+        return mac.digest()
+
+    def _hmac_encode(self, payload: Dict) -> str:
+        """Sign a payload as a compact HS* JWS."""
+        claims = dict(payload)
+        for claim in ("exp", "iat", "nbf"):
+            if claim in claims:
+                claims[claim] = _numeric_date(claims[claim])
+        signing_input = (
+            self._header_segment + b"." + _b64encode(orjson.dumps(claims))
+        )
+        signature = self._hmac_sign(signing_input)
+        return (signing_input + b"." + _b64encode(signature)).decode("ascii")
+
+    def _hmac_decode(self, token: str) -> Dict:
+        """
+        Verify an HS* token and validate its registered time claims.
+
+        Raises the same PyJWT exceptions as ``jwt.decode`` so callers handle
+        both codecs identically.
+        """
+        try:
+            raw = token.encode("ascii")
+            signing_input, signature = raw.rsplit(b".", 1)
+            header_segment, payload_segment = signing_input.split(b".", 1)
+            header = orjson.loads(_b64decode(header_segment))
+            payload = orjson.loads(_b64decode(payload_segment))
+            signature = _b64decode(signature)
+        except (ValueError, binascii.Error, orjson.JSONDecodeError) as e:
+            raise jwt.DecodeError(f"Invalid token encoding: {e}") from None
+
+        if not isinstance(header, dict) or header.get("alg") != self.algorithm:
+            raise jwt.InvalidAlgorithmError("The specified alg value is not allowed")
+        expected = self._hmac_sign(signing_input)
+        if not hmac.compare_digest(expected, signature):
+            raise jwt.InvalidSignatureError("Signature verification failed")
+        if not isinstance(payload, dict):
+            raise jwt.DecodeError("Invalid payload")
+
+        now = time.time()
+        try:
+            if "iat" in payload and int(payload["iat"]) > now:
+                raise jwt.ImmatureSignatureError("The token is not yet valid (iat)")
+            if "nbf" in payload and int(payload["nbf"]) > now:
+                raise jwt.ImmatureSignatureError("The token is not yet valid (nbf)")
+            if "exp" in payload and int(payload["exp"]) <= now:
+                raise jwt.ExpiredSignatureError("Signature has expired")
+        except (TypeError, ValueError):
+            raise jwt.DecodeError("Time claims must be integers") from None
+        if "sub" in payload and not isinstance(payload["sub"], str):
+            raise jwt.InvalidSubjectError("Subject must be a string")
+
+        return payload
 
     def create_access_token(
         self,
@@ -87,11 +201,14 @@ class AuthService:
         if additional_claims:
             payload.update(additional_claims)
 
-        token = jwt.encode(
-            payload,
-            self.secret_key,
-            algorithm=self.algorithm
-        )
+        if self._hmac_digest:
+            token = self._hmac_encode(payload)
+        else:
+            token = jwt.encode(
+                payload,
+                self.secret_key,
+                algorithm=self.algorithm
+            )
 
         logger.debug(f"Access token created for user {user_id}")
         return token
@@ -111,10 +228,53 @@ class AuthService:
         """
         return secrets.token_urlsafe(32)
 
+    def create_token_pair(
+        self,
+        user_id: str,
+        email: str,
+        role: str,
+        additional_claims: Optional[Dict] = None,
+        expires_minutes: Optional[int] = None
+    ) -> Tuple[str, str]:
+        """
+        Create an access token and a refresh token together (login/refresh).
+
+        Args:
+            user_id: User UUID as string
+            email: User email address
+            role: User role (user/admin/moderator)
+            additional_claims: Optional additional JWT claims
+            expires_minutes: Optional access token lifetime override
+
+        Returns:
+            Tuple[str, str]: (access_token, refresh_token)
+
+        Example:
+            ```python
+            access_token, refresh_token = auth_service.create_token_pair(
+                user_id=str(user.user_id),
+                email=user.email,
+                role=user.role.value
+            )
+            ```
+        """
+        access_token = self.create_access_token(
+            user_id,
+            email,
+            role,
+            additional_claims=additional_claims,
+            expires_minutes=expires_minutes
+        )
+        return access_token, secrets.token_urlsafe(32)
+
     def verify_token(self, token: str) -> Dict:
         """
         Verify JWT token signature and expiration.
 
+        Successful verifications are memoized per token string (see
+        TOKEN_CACHE_TTL_SECONDS), so repeat requests with the same token
+        skip the HMAC check and JSON decode.
+
         Args:
             token: JWT token string
 
@@ -134,32 +294,66 @@ class AuthService:
                 pass
             ```
         """
+        now = time.time()
+        cached = self._token_cache.get(token)
+        if cached and cached[0] > now:
+            return dict(cached[1])
+        rejected = self._bad_tokens.get(token)
+        if rejected and rejected[0] > now:
+            raise InvalidTokenException(rejected[1])
+
         try:
-            payload = jwt.decode(
-                token,
-                self.secret_key,
-                algorithms=[self.algorithm]
-            )
+            if self._hmac_digest:
+                payload = self._hmac_decode(token)
+            else:
+                payload = jwt.decode(
+                    token,
+                    self.secret_key,
+                    algorithms=[self.algorithm]
+                )
 
             # Verify token type
             if payload.get("type") != "access":
                 logger.warning(f"Invalid token type: {payload.get('type')}")
                 raise InvalidTokenException("Invalid token type")
 
-            return payload
+            if len(self._token_cache) >= TOKEN_CACHE_MAX_ENTRIES:
+                self._token_cache.clear()
+            cache_until = min(now + TOKEN_CACHE_TTL_SECONDS, payload.get("exp", now))
+            self._token_cache[token] = (cache_until, payload)
+
+            return dict(payload)
 
         except jwt.ExpiredSignatureError:
             logger.warning("Token expired")
             raise InvalidTokenException("Token has expired")
 
+        except jwt.ImmatureSignatureError:
+            # Becomes valid once iat/nbf passes, so never negative-cache it
+            logger.warning("Token not yet valid")
+            raise InvalidTokenException("Invalid token")
+
         except jwt.InvalidTokenError as e:
             logger.warning(f"Invalid token: {e}")
-            raise InvalidTokenException("Invalid token")
+            self._reject(token, now, "Invalid token")
 
         except Exception as e:
             logger.error(f"Token verification error: {e}")
             raise InvalidTokenException("Token verification failed")
 
+    def _reject(self, token: str, now: float, message: str) -> None:
+        """
+        Remember a failed token for BAD_TOKEN_TTL_SECONDS and raise.
+
+        Only for failures that cannot change over time (bad signature,
+        malformed token, wrong algorithm); time-claim failures are raised
+        uncached by verify_token.
+        """
+        if len(self._bad_tokens) >= TOKEN_CACHE_MAX_ENTRIES:
+            self._bad_tokens.clear()
+        self._bad_tokens[token] = (now + BAD_TOKEN_TTL_SECONDS, message)
+        raise InvalidTokenException(message)
+
     def decode_token_unsafe(self, token: str) -> Dict:
         """
         Decode token without verification (for debugging/inspection).
@@ -179,10 +373,15 @@ class AuthService:
             print(f"Token expires at: {payload['exp']}")
             ```
         """
-        return jwt.decode(
-            token,
-            options={"verify_signature": False}
-        )
+        # Only the payload segment is needed: base64url + orjson, without
+        # PyJWT's stdlib json and header/claim processing.
+        try:
+            payload = orjson.loads(_b64decode(token.encode("ascii").split(b".")[1]))
+        except (IndexError, ValueError, binascii.Error, orjson.JSONDecodeError) as e:
+            raise jwt.DecodeError(f"Invalid token encoding: {e}") from None
+        if not isinstance(payload, dict):
+            raise jwt.DecodeError("Invalid payload")
+        return payload
 
     def get_token_expiration(self, token: str) -> Optional[datetime]:
         """
@@ -213,10 +412,16 @@ class AuthService:
         Returns:
             bool: True if expired, False otherwise
         """
-        expiration = self.get_token_expiration(token)
-        if not expiration:
+        # Compare NumericDate seconds directly: no datetime allocations and
+        # no local-time conversion (fromtimestamp vs utcnow) to get wrong.
+        try:
+            exp = self.decode_token_unsafe(token).get("exp")
+        except Exception:
+            return True
+        # A missing or non-numeric exp (e.g. "soon") cannot be trusted
+        if not isinstance(exp, (int, float)):
             return True
-        return datetime.utcnow() > expiration
+        return exp < time.time()
 
     def extract_user_id(self, token: str) -> Optional[str]:
         """
@@ -4,26 +4,173 @@ Handles market cash redistribution and price calculations
 """
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
-from datetime import datetime
-from typing import Dict, List
+from sqlalchemy import ARRAY, Row, bindparam, delete, select, func, insert, literal_column, text
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
 import logging
+import time
+
+import numpy as np
 
 from app.models.land import Land
 
 from app.models.biome_market import BiomeMarket
 from app.models.biome_price_history import BiomePriceHistory
+from app.models.biome_price_history_minute import BiomePriceHistoryMinute
 from app.models.attention_score import AttentionScore
 from app.models.land import Biome
-from app.models.admin_config import AdminConfig
+from app.services.admin_config_service import admin_config_cache
 from app.services.attention_tracking_service import attention_tracking_service
 
 logger = logging.getLogger(__name__)
 
 
+# Max age of the cached /markets payload; bounds staleness when another
+# worker process redistributes without invalidating this one's copy
+MARKETS_SNAPSHOT_TTL_SECONDS = 1.0
+
+# Raw price ticks are kept this long, then rolled up into per-minute rows
+RAW_PRICE_HISTORY_HOURS = 24
+
+# Reused with a bound biome so the compiled form is cached
+_MARKET_BY_BIOME = select(BiomeMarket).where(BiomeMarket.biome == bindparam("biome"))
+
+# Last to_dict output per biome, keyed on the values it is built from
+_market_dict_memo: Dict[Biome, Tuple[tuple, dict]] = {}
+
+
+def _market_dict(market: BiomeMarket) -> dict:
+    """
+    Return ``market.to_dict()``, reusing the previous dict for the biome
+    when none of its fields changed. The result is shared: do not mutate.
+    """
+    key = (
+        market.market_cash_bdt,
+        market.attention_score,
+        market.share_price_bdt,
+        market.total_shares,
+        market.last_redistribution,
+        market.updated_at
+    )
+    cached = _market_dict_memo.get(market.biome)
+    if cached and cached[0] == key:
+        return cached[1]
+    data = market.to_dict()
+    _market_dict_memo[market.biome] = (key, data)
+    return data
+
+
 class BiomeMarketService:
     """Service for biome market operations and redistribution."""
 
+    def __init__(self):
+        # Serialized all-markets payload shared by concurrent requests:
+        # (seq, created_at monotonic, json bytes)
+        self._markets_seq = 0
+        self._markets_snapshot: Optional[Tuple[int, float, bytes]] = None
+        # Market rows as to_dict() data for read-only views, keyed the same
+        # way: (seq, created_at monotonic, {biome value: market dict})
+        self._market_rows: Optional[Tuple[int, float, Dict[str, dict]]] = None
+
+    def get_markets_snapshot(self) -> Tuple[int, Optional[bytes]]:
+        """
+        Get the cached all-markets JSON payload.
+
+        Returns:
+            Tuple of (current sequence, cached bytes or None if stale/missing);
+            pass the sequence back to store_markets_snapshot
+        """
+        snapshot = self._markets_snapshot
+        if (
+            snapshot
+            and snapshot[0] == self._markets_seq
+            and time.monotonic() - snapshot[1] < MARKETS_SNAPSHOT_TTL_SECONDS
+        ):
+            return self._markets_seq, snapshot[2]
+        return self._markets_seq, None
+
+    def store_markets_snapshot(self, seq: int, payload: bytes) -> None:
+        """
+        Cache a serialized all-markets payload built at sequence ``seq``.
+
+        Dropped if the markets changed while the payload was being built.
+        """
+        if seq == self._markets_seq:
+            self._markets_snapshot = (seq, time.monotonic(), payload)
+
+    def invalidate_markets_snapshot(self) -> None:
+        """Invalidate the cached payload after market state changes."""
+        self._markets_seq += 1
+        self._markets_snapshot = None
+        self._market_rows = None
+
+    def store_market_rows(self, market_dicts: List[dict]) -> None:
+        """
+        Cache market rows (``BiomeMarket.to_dict()`` output) for the current
+        sequence.
+
+        The redistribution worker calls this right after invalidating, with
+        the markets it just committed, so read paths start the new tick
+        without a query.
+
+        Args:
+            market_dicts: One dict per market
+        """
+        rows = {row["biome"]: row for row in market_dicts}
+        self._market_rows = (self._markets_seq, time.monotonic(), rows)
+
+    async def get_market_rows(self, db: AsyncSession) -> Dict[str, dict]:
+        """
+        Get all markets as dicts for read-only views (portfolio, subscribe
+        snapshots, market endpoints), from the per-tick cache when fresh.
+
+        Mutating paths must load BiomeMarket rows instead.
+
+        Args:
+            db: Database session used on a cache miss
+
+        Returns:
+            Dict of biome value -> market dict (do not mutate)
+        """
+        cached = self._market_rows
+        if (
+            cached
+            and cached[0] == self._markets_seq
+            and time.monotonic() - cached[1] < MARKETS_SNAPSHOT_TTL_SECONDS
+        ):
+            return cached[2]
+
+        seq = self._markets_seq
+        markets = await self.get_all_markets(db)
+        rows = {market.biome.value: _market_dict(market) for market in markets}
+        # Dropped if a redistribution landed while the rows were loading
+        if seq == self._markets_seq:
+            self._market_rows = (seq, time.monotonic(), rows)
+        return rows
+
+    async def get_market_cached(self, db: AsyncSession, biome: Biome) -> dict:
+        """
+        Get one market's row for trade pricing from the per-tick cache.
+
+        Trades never write the market row (only redistribution does), so
+        pricing needs no FOR UPDATE lock.
+
+        Args:
+            db: Database session used on a cache miss
+            biome: Biome type
+
+        Returns:
+            Market dict (do not mutate)
+
+        Raises:
+            ValueError: If market not found
+        """
+        market = (await self.get_market_rows(db)).get(biome.value)
+        if market is None:
+            raise ValueError(f"Market not found for biome: {biome.value}")
+        return market
+
     @staticmethod
     async def initialize_markets(db: AsyncSession) -> List[BiomeMarket]:
         """
@@ -93,9 +240,7 @@ class BiomeMarketService:
         Raises:
             ValueError: If market not found
         """
-        result = await db.execute(
-            select(BiomeMarket).where(BiomeMarket.biome == biome)
-        )
+        result = await db.execute(_MARKET_BY_BIOME, {"biome": biome})
         market = result.scalar_one_or_none()
 
         if not market:
@@ -122,23 +267,31 @@ class BiomeMarketService:
         Returns:
             Dictionary with redistribution results
         """
-        # Get all markets
-        markets = await BiomeMarketService.get_all_markets(db)
+        # Load markets with their attention totals in one round trip
+        attention_totals = attention_tracking_service.biome_attention_totals()
+        result = await db.execute(
+            select(BiomeMarket, func.coalesce(attention_totals.c.total, 0.0))
+            .outerjoin(attention_totals, attention_totals.c.biome == BiomeMarket.biome)
+        )
+        rows = result.all()
+        markets = [market for market, _ in rows]
 
         if not markets:
             logger.warning("No markets found for redistribution")
             return {"redistributed": False, "reason": "no_markets"}
 
         # Get admin config for redistribution settings
-        config_result = await db.execute(select(AdminConfig))
-        config = config_result.scalar_one()
+        config = await admin_config_cache.get()
+        if config is None:
+            raise ValueError("Admin config not initialized")
 
         # Check if prices are frozen
         if config.biome_prices_frozen:
             logger.info("Biome prices are frozen, skipping redistribution")
             return {"redistributed": False, "reason": "prices_frozen"}
 
-        # Calculate total market cash (TMC)
+        # Calculate total market cash (TMC); the rows are already loaded for
+        # mutation, so summing them costs no extra query
         total_market_cash = sum(market.market_cash_bdt for market in markets)
 
         # Calculate redistribution pool using config percentage
@@ -146,33 +299,28 @@ class BiomeMarketService:
 
         logger.info(f"Starting redistribution - TMC: {total_market_cash}, Pool: {pool} ({config.redistribution_pool_percent}%)")
 
-        # Get total attention per biome
-        biome_attention = {}
-        total_attention = 0.0
-
-        for market in markets:
-            attention = await attention_tracking_service.get_biome_total_attention(
-                db, market.biome
-            )
-            biome_attention[market.biome] = attention
-            total_attention += attention
+        attention_values = np.fromiter(
+            (attention for _, attention in rows), dtype=np.float64, count=len(rows)
+        )
+        total_attention = float(attention_values.sum())
 
         # If no attention, skip redistribution
         if total_attention == 0:
             logger.info("No attention recorded, skipping redistribution")
             return {"redistributed": False, "reason": "no_attention"}
 
-        # Redistribute cash proportionally
+        # Redistribute cash proportionally: R_i = Pool * (A_i / SumA), in one
+        # vectorized pass (truncated like int(); zero attention gives zero)
+        amounts = (pool * (attention_values / total_attention)).astype(np.int64)
+
         redistributions = {}
+        history_rows = []
+        # One timestamp for the whole cycle: markets, history rows and the
+        # broadcast all carry the same tick time
+        now = datetime.utcnow()
 
-        for market in markets:
-            attention = biome_attention[market.biome]
-            
-            # Calculate redistribution for this biome
-            if attention > 0:
-                redistribution_amount = int(pool * (attention / total_attention))
-            else:
-                redistribution_amount = 0
+        for market, attention, amount in zip(markets, attention_values.tolist(), amounts.tolist()):
+            redistribution_amount = max(amount, 0)
 
             # Update market cash
             old_cash = market.market_cash_bdt
@@ -181,8 +329,11 @@ class BiomeMarketService:
             # Recalculate share price
             market.share_price_bdt = market.calculate_share_price()
 
-            # Update redistribution timestamp
-            market.last_redistribution = datetime.utcnow()
+            # Update redistribution timestamp; updated_at is set explicitly so
+            # it is not expired by the onupdate default and can be read back
+            # after commit without a lazy load
+            market.last_redistribution = now
+            market.updated_at = now
 
             # Store redistribution info
             redistributions[market.biome.value] = {
@@ -194,20 +345,27 @@ class BiomeMarketService:
             }
 
             # Record price history
-            price_history = BiomePriceHistory(
-                biome=market.biome,
-                price_bdt=market.share_price_bdt,
-                market_cash_bdt=market.market_cash_bdt,
-                attention_score=attention,
-                timestamp=datetime.utcnow()
-            )
-            db.add(price_history)
+            history_rows.append({
+                "biome": market.biome,
+                "price_bdt": market.share_price_bdt,
+                "market_cash_bdt": market.market_cash_bdt,
+                "attention_score": attention,
+                "timestamp": now
+            })
 
             logger.info(
                 f"Redistributed to {market.biome.value}: "
                 f"{redistribution_amount} BDT (attention: {attention})"
             )
 
+        # Redistribution runs every tick and the next tick supersedes it, so
+        # this commit skips the WAL flush wait; a crash can lose at most the
+        # last few ticks, never leave them half-applied. Trade commits keep
+        # full durability.
+        await db.execute(text("SET LOCAL synchronous_commit = off"))
+
+        # One executemany INSERT for all biomes' history rows
+        await db.execute(insert(BiomePriceHistory), history_rows)
         await db.commit()
 
         # Reset attention scores
@@ -221,8 +379,8 @@ class BiomeMarketService:
             "pool": pool,
             "total_attention": total_attention,
             "redistributions": redistributions,
-            "markets": [m.to_dict() for m in markets],
-            "timestamp": datetime.utcnow().isoformat()
+            "markets": [_market_dict(m) for m in markets],
+            "timestamp": now.isoformat()
         }
 
     @staticmethod
@@ -230,9 +388,12 @@ class BiomeMarketService:
         db: AsyncSession,
         biome: Biome,
         hours: int = 24
-    ) -> List[BiomePriceHistory]:
+    ) -> List[Row]:
         """
         Get price history for a biome.
+
+        Only the charted columns are selected, so the range read is served
+        by the covering (biome, timestamp) index alone.
         
         Args:
             db: Database session
@@ -240,23 +401,103 @@ class BiomeMarketService:
             hours: Number of hours to look back
             
         Returns:
-            List of BiomePriceHistory records
+            List of rows with timestamp, price_bdt, market_cash_bdt and
+            attention_score
         """
-        from datetime import timedelta
-
         cutoff_time = datetime.utcnow() - timedelta(hours=hours)
 
-        result = await db.execute(
-            select(BiomePriceHistory).where(
-                BiomePriceHistory.biome == biome,
-                BiomePriceHistory.timestamp >= cutoff_time
-            ).order_by(BiomePriceHistory.timestamp.asc())
+        query = select(
+            BiomePriceHistory.timestamp,
+            BiomePriceHistory.price_bdt,
+            BiomePriceHistory.market_cash_bdt,
+            BiomePriceHistory.attention_score
+        ).where(
+            BiomePriceHistory.biome == biome,
+            BiomePriceHistory.timestamp >= cutoff_time
         )
 
-        return result.scalars().all()
+        if hours > RAW_PRICE_HISTORY_HOURS:
+            # Older ranges live in the per-minute rollups (one closing point
+            # per minute); raw rows only cover the recent window
+            rollups = select(
+                BiomePriceHistoryMinute.bucket_start.label("timestamp"),
+                BiomePriceHistoryMinute.price_last_bdt.label("price_bdt"),
+                BiomePriceHistoryMinute.market_cash_bdt,
+                BiomePriceHistoryMinute.attention_score
+            ).where(
+                BiomePriceHistoryMinute.biome == biome,
+                BiomePriceHistoryMinute.bucket_start >= cutoff_time
+            )
+            query = rollups.union_all(query)
+
+        result = await db.execute(query.order_by(literal_column("timestamp").asc()))
+
+        return result.all()
 
     @staticmethod
+    async def downsample_price_history(db: AsyncSession) -> int:
+        """
+        Roll raw price ticks older than the raw window into per-minute rows
+        and delete them, bounding the raw table to RAW_PRICE_HISTORY_HOURS.
+
+        The cutoff is aligned to a minute, so every rolled-up bucket is
+        complete and is written exactly once.
+
+        Args:
+            db: Database session
+
+        Returns:
+            Number of raw rows rolled up
+        """
+        cutoff_time = (
+            datetime.utcnow() - timedelta(hours=RAW_PRICE_HISTORY_HOURS)
+        ).replace(second=0, microsecond=0)
+
+        def last(column):
+            return func.array_agg(
+                aggregate_order_by(column, BiomePriceHistory.timestamp.desc()),
+                type_=ARRAY(column.type)
+            )[1]
+
+        # Literal unit so the select list and GROUP BY render identically
+        bucket = func.date_trunc(literal_column("'minute'"), BiomePriceHistory.timestamp)
+        rollup = (
+            select(
+                BiomePriceHistory.biome,
+                bucket,
+                func.avg(BiomePriceHistory.price_bdt),
+                func.min(BiomePriceHistory.price_bdt),
+                func.max(BiomePriceHistory.price_bdt),
+                last(BiomePriceHistory.price_bdt),
+                last(BiomePriceHistory.market_cash_bdt),
+                func.avg(BiomePriceHistory.attention_score),
+                func.count()
+            )
+            .where(BiomePriceHistory.timestamp < cutoff_time)
+            .group_by(BiomePriceHistory.biome, bucket)
+        )
+
+        await db.execute(
+            insert(BiomePriceHistoryMinute).from_select(
+                [
+                    "biome", "bucket_start",
+                    "price_avg_bdt", "price_min_bdt", "price_max_bdt", "price_last_bdt",
+                    "market_cash_bdt", "attention_score", "sample_count"
+                ],
+                rollup
+            )
+        )
+        result = await db.execute(
+            delete(BiomePriceHistory).where(BiomePriceHistory.timestamp < cutoff_time)
+        )
+        await db.commit()
+
+        if result.rowcount:
+            logger.info(f"Rolled up {result.rowcount} price history rows older than {cutoff_time}")
+        return result.rowcount
+
     async def validate_transaction_size(
+        self,
         db: AsyncSession,
         biome: Biome,
         amount_bdt: int
@@ -273,11 +514,12 @@ class BiomeMarketService:
             Dict with validation result and warnings
         """
         # Get admin config for transaction limits
-        config_result = await db.execute(select(AdminConfig))
-        config = config_result.scalar_one()
+        config = await admin_config_cache.get()
+        if config is None:
+            raise ValueError("Admin config not initialized")
 
-        market = await BiomeMarketService.get_market(db, biome)
-        market_cap = market.market_cash_bdt
+        market = await self.get_market_cached(db, biome)
+        market_cap = market["market_cash_bdt"]
         max_transaction = int(market_cap * (config.max_transaction_percent / 100))
         
         result = {
@@ -328,8 +570,9 @@ class BiomeMarketService:
             Dict with validation result and warnings
         """
         # Get admin config for price movement limits
-        config_result = await db.execute(select(AdminConfig))
-        config = config_result.scalar_one()
+        config = await admin_config_cache.get()
+        if config is None:
+            raise ValueError("Admin config not initialized")
 
         price_change_ratio = (new_price - old_price) / old_price if old_price > 0 else 0
         price_change_percent = abs(price_change_ratio) * 100
@@ -402,26 +645,34 @@ class BiomeMarketService:
         Returns:
             Dict with owner IDs and their land counts in that biome
         """
-        lands = await BiomeMarketService.get_lands_by_biome(db, biome)
-        
+        # One row per owner, grouped in SQL; unowned lands form the NULL
+        # group, which only contributes to the total
+        result = await db.execute(
+            select(
+                Land.owner_id,
+                func.count(),
+                func.array_agg(Land.land_id).filter(Land.owner_id.isnot(None))
+            )
+            .where(Land.biome == biome)
+            .group_by(Land.owner_id)
+        )
+
+        total_lands = 0
         owner_analysis = {}
-        for land in lands:
-            owner_id = str(land.owner_id) if land.owner_id else None
+        for owner_id, land_count, land_ids in result.all():
+            total_lands += land_count
             if owner_id:
-                if owner_id not in owner_analysis:
-                    owner_analysis[owner_id] = {
-                        "land_count": 0,
-                        "lands": []
-                    }
-                owner_analysis[owner_id]["land_count"] += 1
-                owner_analysis[owner_id]["lands"].append({
-                    "land_id": str(land.land_id),
-                    "biome": land.biome.value
-                })
-        
+                owner_analysis[str(owner_id)] = {
+                    "land_count": land_count,
+                    "lands": [
+                        {"land_id": str(land_id), "biome": biome.value}
+                        for land_id in land_ids
+                    ]
+                }
+
         return {
             "biome": biome.value,
-            "total_lands_with_biome": len(lands),
+            "total_lands_with_biome": total_lands,
             "affected_owners": len(owner_analysis),
             "owner_analysis": owner_analysis
         }
@@ -1,17 +1,17 @@
 """
 Biome Market Background Worker
-Handles periodic attention-based redistribution
+Handles periodic attention-based redistribution and price history rollups
 """
 
 import asyncio
 import logging
-from datetime import datetime
+import time
 from contextlib import asynccontextmanager
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.db.session import AsyncSessionLocal
 from app.services.biome_market_service import biome_market_service
-from app.services.websocket_service import connection_manager
+from app.services.websocket_service import connection_manager, encode_message
 
 logger = logging.getLogger(__name__)
 
@@ -19,16 +19,20 @@ logger = logging.getLogger(__name__)
 class BiomeMarketWorker:
     """Background worker for periodic market redistribution."""
 
-    def __init__(self, interval_seconds: float = 0.5):
+    def __init__(self, interval_seconds: float = 0.5, downsample_interval_seconds: float = 600.0):
         """
         Initialize worker.
         
         Args:
             interval_seconds: Time between redistribution cycles (default 0.5s)
+            downsample_interval_seconds: Time between price history rollups
+                (default 10 minutes)
         """
         self.interval_seconds = interval_seconds
+        self.downsample_interval_seconds = downsample_interval_seconds
         self.running = False
         self.task = None
+        self._next_downsample = 0.0
 
     async def redistribution_cycle(self):
         """Execute single redistribution cycle."""
@@ -37,6 +41,8 @@ class BiomeMarketWorker:
                 result = await biome_market_service.execute_redistribution(db)
                 
                 if result["redistributed"]:
+                    biome_market_service.invalidate_markets_snapshot()
+                    biome_market_service.store_market_rows(result.get("markets", []))
                     logger.info(
                         f"Redistribution cycle complete: "
                         f"TMC={result['total_market_cash']}, "
@@ -47,7 +53,7 @@ class BiomeMarketWorker:
                     # Broadcast market update to subscribers
                     message = {
                         "type": "biome_market_update",
-                        "timestamp": datetime.utcnow().isoformat(),
+                        "timestamp": result["timestamp"],
                         "markets": result.get("markets", []),
                         "redistributions": result.get("redistributions", {}),
                         "total_market_cash": result.get("total_market_cash"),
@@ -55,21 +61,43 @@ class BiomeMarketWorker:
                         "total_attention": result.get("total_attention")
                     }
 
-                    await connection_manager.broadcast_to_room(message, "biome_market_all")
-
-                    # Broadcast per-biome rooms
-                    for biome_key, data in result.get("redistributions", {}).items():
-                        await connection_manager.broadcast_to_room({
-                            **message,
-                            "biome": biome_key,
-                            "redistribution": data
-                        }, f"biome_market:{biome_key}")
+                    await self.broadcast_update(message)
                 else:
                     logger.debug(f"Redistribution skipped: {result.get('reason', 'unknown')}")
                     
             except Exception as e:
                 logger.error(f"Error in redistribution cycle: {e}", exc_info=True)
 
+    async def broadcast_update(self, message: dict) -> None:
+        """
+        Send a market update once to every market subscriber.
+
+        Members of ``biome_market_all`` and of any ``biome_market:{biome}``
+        room get the same encoded message, one copy per user; it carries
+        every biome's delta under ``redistributions``, so per-biome clients
+        read their own entry from it.
+
+        Args:
+            message: Market update message
+        """
+        room_ids = ["biome_market_all"] + [
+            f"biome_market:{biome_key}" for biome_key in message["redistributions"]
+        ]
+        await connection_manager.broadcast_text_to_rooms(encode_message(message), room_ids)
+
+    async def downsample_cycle(self):
+        """Roll up raw price history once the downsample interval has passed."""
+        now = time.monotonic()
+        if now < self._next_downsample:
+            return
+        self._next_downsample = now + self.downsample_interval_seconds
+
+        async with AsyncSessionLocal() as db:
+            try:
+                await biome_market_service.downsample_price_history(db)
+            except Exception as e:
+                logger.error(f"Error downsampling price history: {e}", exc_info=True)
+
     async def run(self):
         """Main worker loop."""
         logger.info(f"Starting biome market worker (interval={self.interval_seconds}s)")
@@ -78,6 +106,7 @@ class BiomeMarketWorker:
         while self.running:
             try:
                 await self.redistribution_cycle()
+                await self.downsample_cycle()
                 await asyncio.sleep(self.interval_seconds)
             except asyncio.CancelledError:
                 logger.info("Biome market worker cancelled")
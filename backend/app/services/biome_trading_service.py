@@ -4,22 +4,97 @@ Handles buy/sell operations for biome shares
 """
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
-from datetime import datetime, timedelta
+from sqlalchemy import bindparam, select, func, true
+from sqlalchemy.orm import aliased
+from datetime import datetime, timedelta, timezone
 from typing import Optional, List
 import uuid
 import logging
+import os
 
+from app.config import settings
 from app.models.biome_market import BiomeMarket
 from app.models.biome_holding import BiomeHolding
 from app.models.transaction import Transaction, TransactionType, TransactionStatus
 from app.models.user import User
 from app.models.land import Biome
-from app.models.admin_config import AdminConfig
+from app.services.admin_config_service import admin_config_cache
 from app.services.biome_market_service import biome_market_service
+from app.services.insert_batcher import InsertBatcher
 
 logger = logging.getLogger(__name__)
 
+# Trade-path lookup built once at import and reused with bound values, so
+# each call hits SQLAlchemy's compiled cache without rebuilding the statement.
+# The user row and the user's holding in the biome are locked in one round
+# trip: the holding is locked inside a LATERAL subquery because FOR UPDATE
+# cannot target the nullable side of an outer join, and a missing holding
+# comes back as None.
+_holding_for_update = (
+    select(BiomeHolding)
+    .where(
+        BiomeHolding.user_id == User.user_id,
+        BiomeHolding.biome == bindparam("biome")
+    )
+    .with_for_update()
+    .lateral()
+)
+_USER_AND_HOLDING_FOR_UPDATE = (
+    select(User, aliased(BiomeHolding, _holding_for_update))
+    .outerjoin(_holding_for_update, true())
+    .where(User.user_id == bindparam("user_id"))
+    .with_for_update(of=User)
+)
+
+# Write-behind queue for trade ledger rows; balances and holdings still
+# commit synchronously on the request path, so rows that cannot be written
+# are dead-lettered for replay rather than dropped
+transaction_batcher = InsertBatcher(
+    Transaction,
+    "trade transaction",
+    dead_letter_path=os.path.join(settings.dead_letter_dir, "transactions.jsonl")
+)
+
+
+async def _record_trade(
+    user_id: uuid.UUID,
+    transaction_type: TransactionType,
+    biome: Biome,
+    amount_bdt: int,
+    platform_fee: int,
+    shares: float,
+    share_price: int
+) -> Transaction:
+    """
+    Queue a committed trade's ledger row and return it as a transient record.
+
+    Ids and timestamps are set here rather than by column defaults, so the
+    returned record is complete without waiting for the batched INSERT.
+    Every trade row carries the same keys, as the batch is one executemany.
+    """
+    now = datetime.now(timezone.utc)
+    row = {
+        "transaction_id": uuid.uuid4(),
+        "buyer_id": user_id,
+        "seller_id": None,  # No seller in biome trading
+        "land_id": None,  # Not a land trade
+        "listing_id": None,
+        "transaction_type": transaction_type,
+        "amount_bdt": amount_bdt,
+        "currency": "BDT",
+        "status": TransactionStatus.COMPLETED,
+        "platform_fee_bdt": platform_fee,
+        "gateway_fee_bdt": 0,
+        "biome": biome.value,
+        "shares": shares,
+        "price_per_share_bdt": share_price,
+        "created_at": now,
+        "completed_at": now,
+        "updated_at": now
+    }
+    await transaction_batcher.enqueue(row)
+    return Transaction(**row)
+
 
 class BiomeTradingService:
     """Service for biome share trading operations."""
@@ -46,22 +121,13 @@ class BiomeTradingService:
         Raises:
             ValueError: If validation fails
         """
-        # Get user
-        result = await db.execute(
-            select(User).where(User.user_id == user_id).with_for_update()
-        )
-        user = result.scalar_one_or_none()
-
-        if not user:
-            raise ValueError("User not found")
-
-        # Check balance
-        if user.balance_bdt < amount_bdt:
-            raise ValueError(f"Insufficient balance: {user.balance_bdt} < {amount_bdt}")
+        # Validation and pricing need no row locks, so they run before the
+        # locked section to keep it short
 
         # Get admin config for fee percentage
-        config_result = await db.execute(select(AdminConfig))
-        config = config_result.scalar_one()
+        config = await admin_config_cache.get()
+        if config is None:
+            raise ValueError("Admin config not initialized")
 
         # Validate transaction size against market safeguards
         validation = await biome_market_service.validate_transaction_size(db, biome, amount_bdt)
@@ -72,29 +138,36 @@ class BiomeTradingService:
         if config.biome_trading_paused:
             raise ValueError("Biome trading is currently paused")
 
-        # Get market
-        market = await biome_market_service.get_market(db, biome)
+        # Get current price from the per-tick market cache
+        market = await biome_market_service.get_market_cached(db, biome)
+        share_price = market["share_price_bdt"]
 
         # Calculate shares to buy
-        shares = amount_bdt / market.share_price_bdt
+        shares = amount_bdt / share_price
 
         # Calculate platform fee using config
         platform_fee = int(amount_bdt * (config.biome_trade_fee_percent / 100))
         total_deduction = amount_bdt + platform_fee
 
+        # Lock user and existing holding together
+        result = await db.execute(
+            _USER_AND_HOLDING_FOR_UPDATE, {"user_id": user_id, "biome": biome}
+        )
+        row = result.first()
+
+        if not row:
+            raise ValueError("User not found")
+        user, holding = row
+
+        # Check balance
+        if user.balance_bdt < amount_bdt:
+            raise ValueError(f"Insufficient balance: {user.balance_bdt} < {amount_bdt}")
+
         # Check balance including fee
         if user.balance_bdt < total_deduction:
             raise ValueError(f"Insufficient balance for purchase and fees: {user.balance_bdt} < {total_deduction}")
 
-        # Get or create holding
-        result = await db.execute(
-            select(BiomeHolding).where(
-                BiomeHolding.user_id == user_id,
-                BiomeHolding.biome == biome
-            ).with_for_update()
-        )
-        holding = result.scalar_one_or_none()
-
+        # Create holding on first buy
         if not holding:
             holding = BiomeHolding(
                 user_id=user_id,
@@ -109,33 +182,19 @@ class BiomeTradingService:
         user.balance_bdt -= total_deduction
 
         # Update holding
-        holding.add_shares(shares, market.share_price_bdt)
-
-        # Create transaction record in unified table
-        transaction = Transaction(
-            buyer_id=user_id,
-            seller_id=None,  # No seller in biome trading
-            land_id=None,  # Not a land trade
-            listing_id=None,
-            transaction_type=TransactionType.BIOME_BUY,
-            amount_bdt=amount_bdt,
-            status=TransactionStatus.COMPLETED,
-            platform_fee_bdt=platform_fee,  # Tracked fee
-            gateway_fee_bdt=0,
-            completed_at=datetime.utcnow(),
-            # Biome trading specific fields
-            biome=biome.value,
-            shares=shares,
-            price_per_share_bdt=market.share_price_bdt
-        )
-        db.add(transaction)
+        holding.add_shares(shares, share_price)
 
         await db.commit()
-        await db.refresh(transaction)
+
+        # Record transaction in unified table (batched write-behind)
+        transaction = await _record_trade(
+            user_id, TransactionType.BIOME_BUY, biome, amount_bdt,
+            platform_fee, shares, share_price
+        )
 
         logger.info(
             f"Buy executed: user={user_id}, biome={biome.value}, "
-            f"shares={shares:.4f}, price={market.share_price_bdt}, fee={platform_fee}"
+            f"shares={shares:.4f}, price={share_price}, fee={platform_fee}"
         )
 
         return transaction
@@ -162,77 +221,60 @@ class BiomeTradingService:
         Raises:
             ValueError: If validation fails
         """
-        # Get holding
-        result = await db.execute(
-            select(BiomeHolding).where(
-                BiomeHolding.user_id == user_id,
-                BiomeHolding.biome == biome
-            ).with_for_update()
-        )
-        holding = result.scalar_one_or_none()
-
-        if not holding or holding.shares < shares:
-            raise ValueError(f"Insufficient shares: {holding.shares if holding else 0} < {shares}")
+        # Validation and pricing need no row locks, so they run before the
+        # locked section to keep it short
 
         # Get admin config for fee percentage
-        config_result = await db.execute(select(AdminConfig))
-        config = config_result.scalar_one()
+        config = await admin_config_cache.get()
+        if config is None:
+            raise ValueError("Admin config not initialized")
 
         # Check if biome trading is paused
         if config.biome_trading_paused:
             raise ValueError("Biome trading is currently paused")
 
-        # Get market
-        market = await biome_market_service.get_market(db, biome)
+        # Get current price from the per-tick market cache
+        market = await biome_market_service.get_market_cached(db, biome)
+        share_price = market["share_price_bdt"]
 
         # Calculate sale amount
-        total_amount = int(shares * market.share_price_bdt)
+        total_amount = int(shares * share_price)
 
         # Calculate platform fee on proceeds using config
         platform_fee = int(total_amount * (config.biome_trade_fee_percent / 100))
         net_proceeds = total_amount - platform_fee
 
-        # Calculate realized gain
-        avg_buy_price = holding.remove_shares(shares)
-        realized_gain = int((market.share_price_bdt - avg_buy_price) * shares)
-
-        # Get user
+        # Lock user and holding together
         result = await db.execute(
-            select(User).where(User.user_id == user_id).with_for_update()
+            _USER_AND_HOLDING_FOR_UPDATE, {"user_id": user_id, "biome": biome}
         )
-        user = result.scalar_one_or_none()
+        row = result.first()
 
-        if not user:
+        if not row:
             raise ValueError("User not found")
+        user, holding = row
+
+        if not holding or holding.shares < shares:
+            raise ValueError(f"Insufficient shares: {holding.shares if holding else 0} < {shares}")
+
+        # Calculate realized gain
+        avg_buy_price = holding.remove_shares(shares)
+        realized_gain = int((share_price - avg_buy_price) * shares)
 
         # Update user balance (add net proceeds after fee)
         user.balance_bdt += net_proceeds
 
-        # Create transaction record in unified table
-        transaction = Transaction(
-            buyer_id=user_id,
-            seller_id=None,  # No specific seller
-            land_id=None,  # Not a land trade
-            listing_id=None,
-            transaction_type=TransactionType.BIOME_SELL,
-            amount_bdt=total_amount,
-            status=TransactionStatus.COMPLETED,
-            platform_fee_bdt=platform_fee,  # Fee deducted from proceeds
-            gateway_fee_bdt=0,
-            completed_at=datetime.utcnow(),
-            # Biome trading specific fields
-            biome=biome.value,
-            shares=shares,
-            price_per_share_bdt=market.share_price_bdt
-        )
-        db.add(transaction)
-
         await db.commit()
-        await db.refresh(transaction)
+
+        # Record transaction in unified table (batched write-behind)
+        transaction = await _record_trade(
+            user_id, TransactionType.BIOME_SELL, biome, total_amount,
+            platform_fee, shares, share_price
+        )
 
         logger.info(
             f"Sell executed: user={user_id}, biome={biome.value}, "
-            f"shares={shares:.4f}, price={market.share_price_bdt}, gain={realized_gain}, fee={platform_fee}"
+            f"shares={shares:.4f}, price={share_price}, gain={realized_gain}, fee={platform_fee}"
         )
 
         return transaction
@@ -252,24 +294,24 @@ class BiomeTradingService:
         Returns:
             Dictionary with holdings and totals
         """
-        # Get all holdings
+        # Holdings with their market's current price in one round trip.
+        # (The session cannot run queries concurrently, so fewer queries is
+        # how independent lookups get cheaper here.)
         result = await db.execute(
-            select(BiomeHolding).where(BiomeHolding.user_id == user_id)
+            select(BiomeHolding, BiomeMarket.share_price_bdt)
+            .outerjoin(BiomeMarket, BiomeMarket.biome == BiomeHolding.biome)
+            .where(BiomeHolding.user_id == user_id)
         )
-        holdings = result.scalars().all()
-
-        # Get current market prices
-        markets = await biome_market_service.get_all_markets(db)
-        price_map = {market.biome: market.share_price_bdt for market in markets}
+        rows = result.all()
 
         # Calculate totals
         total_invested = 0
         total_current_value = 0.0
         holdings_data = []
 
-        for holding in holdings:
+        for holding, share_price in rows:
             if holding.shares > 0:
-                current_price = price_map.get(holding.biome, 0.0)
+                current_price = share_price or 0.0
                 holding_dict = holding.to_dict(current_price=current_price)
                 holdings_data.append(holding_dict)
                 
@@ -282,11 +324,9 @@ class BiomeTradingService:
         )
 
         # Get user cash balance
-        result = await db.execute(
-            select(User).where(User.user_id == user_id)
-        )
-        user = result.scalar_one_or_none()
-        cash_balance = user.balance_bdt if user else 0
+        cash_balance = await db.scalar(
+            select(User.balance_bdt).where(User.user_id == user_id)
+        ) or 0
 
         return {
             "holdings": holdings_data,
@@ -318,36 +358,38 @@ class BiomeTradingService:
         Returns:
             Dictionary with transactions and pagination
         """
-        base_query = select(Transaction).where(
+        filters = [
             Transaction.buyer_id == user_id,
             Transaction.transaction_type.in_([
                 TransactionType.BIOME_BUY,
                 TransactionType.BIOME_SELL,
             ])
-        )
-
+        ]
         if biome:
-            base_query = base_query.where(Transaction.biome == biome.value)
-
-        # Get total count
-        count_result = await db.execute(
-            select(func.count(Transaction.transaction_id)).select_from(Transaction).where(
-                Transaction.buyer_id == user_id,
-                Transaction.transaction_type.in_([
-                    TransactionType.BIOME_BUY,
-                    TransactionType.BIOME_SELL,
-                ]),
-                *( [Transaction.biome == biome.value] if biome else [] )
-            )
-        )
-        total = count_result.scalar() or 0
+            filters.append(Transaction.biome == biome.value)
 
-        # Apply pagination
+        # Page and total in one round trip: COUNT(*) OVER () is evaluated
+        # before LIMIT/OFFSET, so every row carries the full match count
         offset = (page - 1) * limit
-        query = base_query.order_by(Transaction.created_at.desc()).offset(offset).limit(limit)
-
-        result = await db.execute(query)
-        transactions = result.scalars().all()
+        result = await db.execute(
+            select(Transaction, func.count().over().label("total"))
+            .where(*filters)
+            .order_by(Transaction.created_at.desc())
+            .offset(offset)
+            .limit(limit)
+        )
+        rows = result.all()
+        transactions = [txn for txn, _ in rows]
+
+        if rows:
+            total = rows[0].total
+        elif offset:
+            # Past the last page there is no row to carry the total
+            total = await db.scalar(
+                select(func.count()).select_from(Transaction).where(*filters)
+            ) or 0
+        else:
+            total = 0
 
         return {
             "transactions": [txn.to_dict() for txn in transactions],
@@ -3,17 +3,99 @@ Cache Service
 Redis-based caching with async support
 """
 
+import asyncio
+
 import redis.asyncio as redis
-from typing import Optional, Any, Set
-import json
+from typing import Any, Dict, List, Optional, Set, Tuple
 import logging
-import hashlib
+import secrets
 import time
 
+import orjson
+import zstandard
+
 from app.config import settings, CACHE_TTLS
 
 logger = logging.getLogger(__name__)
 
+# INCRBY and first-use EXPIRE in one atomic round trip. Keys left without a
+# TTL (TTL == -1) also get one, so a counter can never become permanent.
+_INCREMENT_SCRIPT = """
+local value = redis.call('INCRBY', KEYS[1], ARGV[1])
+if redis.call('TTL', KEYS[1]) == -1 then
+    redis.call('EXPIRE', KEYS[1], ARGV[2])
+end
+return value
+"""
+
+# Delete the lock only while it still holds the caller's token, so a holder
+# whose TTL lapsed cannot release a lock someone else has since acquired
+_RELEASE_LOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+# In-process L1 in front of Redis for read-mostly keys (opt-in per call).
+# Entries are short-lived since other workers' writes are not seen here.
+L1_MAX_SIZE = 10_000
+L1_TTL_SECONDS = 5.0
+
+# Keys under these prefixes are tracked by Redis (CLIENT TRACKING BCAST), which
+# pushes an invalidation whenever one changes, so their L1 entries can live
+# longer. The TTL remains as a backstop for invalidations lost in flight.
+L1_TRACKED_PREFIXES = ("chunk:",)
+L1_TRACKED_TTL_SECONDS = 60.0
+_INVALIDATE_CHANNEL = "__redis__:invalidate"
+
+# INFO is comparatively expensive for Redis to build; polled stats reuse it
+MEMORY_INFO_TTL_SECONDS = 1.0
+
+# Cached values larger than this (e.g. full world chunks) are decoded in a
+# worker thread so parsing them does not stall the event loop
+LARGE_PAYLOAD_BYTES = 64 * 1024
+
+# JSON above this size is stored zstd-compressed behind a marker byte. JSON
+# never starts with 0x01, so plain values (and those written before
+# compression was added) are read back unchanged.
+COMPRESS_MIN_BYTES = 1024
+_COMPRESSED_MARKER = b"\x01"
+_compressor = zstandard.ZstdCompressor(level=3)
+_decompressor = zstandard.ZstdDecompressor()
+
+
+def _dumps(value: Any) -> bytes:
+    """
+    Serialize a cache value with orjson.
+
+    datetime/UUID/enum values are encoded natively; anything else orjson
+    cannot handle falls back to ``str`` as json.dumps(default=str) did.
+    """
+    return orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS)
+
+
+def _compress(payload: bytes) -> bytes:
+    """Compress serialized JSON for storage if it is large enough to pay off."""
+    if len(payload) > COMPRESS_MIN_BYTES:
+        return _COMPRESSED_MARKER + _compressor.compress(payload)
+    return payload
+
+
+def _decompress(value: bytes) -> bytes:
+    """Return the JSON bytes for a stored value."""
+    if value[:1] == _COMPRESSED_MARKER:
+        return _decompressor.decompress(value[1:])
+    return value
+
+
+async def _loads(value: bytes) -> Any:
+    """Deserialize a cache value, off the event loop when it is large."""
+    if len(value) > LARGE_PAYLOAD_BYTES:
+        return await asyncio.to_thread(orjson.loads, value)
+    return orjson.loads(value)
+
 
 class CacheService:
     """
@@ -21,9 +103,11 @@ class CacheService:
 
     Features:
     - Async Redis operations
-    - Automatic JSON serialization
+    - Automatic JSON serialization, zstd-compressed when large
     - TTL management
     - Hit/miss tracking
+    - Optional in-process L1 for read-mostly keys, kept coherent through
+      Redis server-assisted invalidation where available
     - Distributed locking
     - Set operations for presence tracking
     - Pub/Sub support
@@ -39,6 +123,18 @@ class CacheService:
         self.redis_url = redis_url
         self.client: Optional[redis.Redis] = None
         self.stats = {"hits": 0, "misses": 0}
+        self._increment_script = None
+        self._release_lock_script = None
+        # key -> (expires_at, JSON bytes); insertion order doubles as LRU order.
+        # Bytes rather than objects, so callers can mutate what get() returns.
+        self._l1: Dict[str, Tuple[float, bytes]] = {}
+        # key -> [GETs in flight, invalidations seen meanwhile]; a GET whose
+        # key was invalidated while it awaited Redis must not populate L1
+        self._l1_inflight: Dict[str, List[int]] = {}
+        self._memory_info: Tuple[float, dict] = (0.0, {})
+        self._tracking = False
+        self._tracking_connections: List[Any] = []
+        self._invalidation_task: Optional[asyncio.Task] = None
 
     async def connect(self) -> None:
         """
@@ -48,30 +144,156 @@ class CacheService:
             Exception: If connection fails
         """
         try:
+            # Responses stay bytes: cached JSON goes straight to orjson or
+            # the HTTP body without a UTF-8 decode/encode round trip
             self.client = await redis.from_url(
                 self.redis_url,
-                encoding="utf8",
-                decode_responses=True,
                 max_connections=settings.redis_max_connections
             )
             await self.client.ping()
+            # Runs via EVALSHA, falling back to EVAL if the script is evicted
+            self._increment_script = self.client.register_script(_INCREMENT_SCRIPT)
+            self._release_lock_script = self.client.register_script(_RELEASE_LOCK_SCRIPT)
             logger.info("Redis connected successfully")
         except Exception as e:
             logger.error(f"Redis connection failed: {e}")
             raise
 
+        await self._start_tracking()
+
+    async def _start_tracking(self) -> None:
+        """
+        Subscribe to server-assisted invalidations for L1_TRACKED_PREFIXES.
+
+        Uses two dedicated connections outside the pool: one subscribed to
+        the invalidation channel and one holding the tracking registration
+        that redirects to it. Without support (Redis < 6) the L1 simply
+        falls back to its short TTL.
+        """
+        listener = tracker = None
+        try:
+            pool = self.client.connection_pool
+            listener = pool.make_connection()
+            tracker = pool.make_connection()
+            await listener.connect()
+            await tracker.connect()
+
+            await listener.send_command("CLIENT", "ID")
+            listener_id = await listener.read_response()
+            await listener.send_command("SUBSCRIBE", _INVALIDATE_CHANNEL)
+            await listener.read_response()
+
+            prefix_args = [arg for prefix in L1_TRACKED_PREFIXES for arg in ("PREFIX", prefix)]
+            await tracker.send_command(
+                "CLIENT", "TRACKING", "ON", "REDIRECT", listener_id, "BCAST", *prefix_args
+            )
+            await tracker.read_response()
+        except Exception as e:
+            logger.warning(f"Redis client tracking unavailable, L1 uses TTL only: {e}")
+            for connection in (listener, tracker):
+                if connection is not None:
+                    await connection.disconnect()
+            return
+
+        self._tracking_connections = [listener, tracker]
+        self._tracking = True
+        self._invalidation_task = asyncio.create_task(self._invalidation_listener(listener))
+        logger.info(f"Redis client tracking enabled for {L1_TRACKED_PREFIXES}")
+
+    async def _invalidation_listener(self, connection: Any) -> None:
+        """Evict L1 entries as Redis reports tracked keys changing."""
+        try:
+            while True:
+                message = await connection.read_response()
+                if message and message[0] == b"message":
+                    self._invalidate_l1(message[2])
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Redis invalidation listener stopped: {e}")
+        finally:
+            # Without invalidations, tracked entries could go stale for their
+            # full TTL; drop them and fall back to the short TTL
+            self._tracking = False
+            self._invalidate_l1(None)
+
+    def _invalidate_l1(self, keys: Optional[List[bytes]]) -> None:
+        """Evict the given keys from L1, or everything for None (FLUSHALL)."""
+        if keys is None:
+            self._l1.clear()
+            for entry in self._l1_inflight.values():
+                entry[1] += 1
+            return
+        for key in keys:
+            self._l1_discard(key.decode() if isinstance(key, bytes) else key)
+
+    async def _stop_tracking(self) -> None:
+        if self._invalidation_task:
+            self._invalidation_task.cancel()
+            try:
+                await self._invalidation_task
+            except asyncio.CancelledError:
+                pass
+            self._invalidation_task = None
+        for connection in self._tracking_connections:
+            await connection.disconnect()
+        self._tracking_connections = []
+
     async def disconnect(self) -> None:
         """Close Redis connection."""
+        await self._stop_tracking()
         if self.client:
             await self.client.close()
         logger.info("Redis disconnected")
 
-    async def get(self, key: str) -> Optional[Any]:
+    def _l1_discard(self, key: str) -> None:
+        """Evict a key and mark any in-flight GET for it as stale."""
+        self._l1.pop(key, None)
+        entry = self._l1_inflight.get(key)
+        if entry is not None:
+            entry[1] += 1
+
+    def _l1_begin(self, key: str) -> int:
+        """Register a GET about to go to Redis; returns its invalidation marker."""
+        entry = self._l1_inflight.setdefault(key, [0, 0])
+        entry[0] += 1
+        return entry[1]
+
+    def _l1_end(self, key: str, marker: int) -> bool:
+        """Finish a GET; True if its key was not invalidated in the meantime."""
+        entry = self._l1_inflight[key]
+        entry[0] -= 1
+        if entry[0] == 0:
+            del self._l1_inflight[key]
+        return entry[1] == marker
+
+    def _l1_get(self, key: str) -> Optional[bytes]:
+        entry = self._l1.pop(key, None)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            return None
+        self._l1[key] = entry
+        return value
+
+    def _l1_put(self, key: str, value: bytes) -> None:
+        self._l1.pop(key, None)
+        if len(self._l1) >= L1_MAX_SIZE:
+            del self._l1[next(iter(self._l1))]
+        ttl = L1_TTL_SECONDS
+        if self._tracking and key.startswith(L1_TRACKED_PREFIXES):
+            ttl = L1_TRACKED_TTL_SECONDS
+        self._l1[key] = (time.monotonic() + ttl, value)
+
+    async def get(self, key: str, l1: bool = False) -> Optional[Any]:
         """
         Get value from cache with hit/miss tracking.
 
         Args:
             key: Cache key
+            l1: Serve from / populate the in-process L1. Only for read-mostly
+                keys that tolerate a few seconds of staleness across workers
 
         Returns:
             Optional[Any]: Cached value or None if not found
@@ -84,6 +306,48 @@ class CacheService:
                 pass
             ```
         """
+        if l1:
+            value = self._l1_get(key)
+            if value is not None:
+                self.stats["hits"] += 1
+                return await _loads(value)
+
+        if not self.client:
+            return None
+
+        marker = self._l1_begin(key) if l1 else 0
+        try:
+            try:
+                value = await self.client.get(key)
+            finally:
+                fresh = l1 and self._l1_end(key, marker)
+            if value:
+                self.stats["hits"] += 1
+                logger.debug(f"Cache hit: {key}")
+                value = _decompress(value)
+                if fresh:
+                    self._l1_put(key, value)
+                return await _loads(value)
+            self.stats["misses"] += 1
+            logger.debug(f"Cache miss: {key}")
+            return None
+        except Exception as e:
+            logger.error(f"Cache get error for key '{key}': {e}")
+            return None
+
+    async def get_raw(self, key: str) -> Optional[bytes]:
+        """
+        Get the stored JSON bytes without deserializing it.
+
+        For values returned to clients unchanged, so the cached JSON can be
+        written straight to the response body.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Optional[bytes]: Cached JSON bytes or None if not found
+        """
         if not self.client:
             return None
 
@@ -92,7 +356,7 @@ class CacheService:
             if value:
                 self.stats["hits"] += 1
                 logger.debug(f"Cache hit: {key}")
-                return json.loads(value)
+                return _decompress(value)
             self.stats["misses"] += 1
             logger.debug(f"Cache miss: {key}")
             return None
@@ -104,7 +368,8 @@ class CacheService:
         self,
         key: str,
         value: Any,
-        ttl: Optional[int] = None
+        ttl: Optional[int] = None,
+        l1: bool = False
     ) -> bool:
         """
         Set value in cache with TTL.
@@ -113,6 +378,7 @@ class CacheService:
             key: Cache key
             value: Value to cache (will be JSON serialized)
             ttl: Time-to-live in seconds (default from CACHE_TTLS)
+            l1: Also populate the in-process L1 (see ``get``)
 
         Returns:
             bool: True if successful, False otherwise
@@ -128,18 +394,125 @@ class CacheService:
         if ttl is None:
             ttl = CACHE_TTLS.get("session", 3600)
 
+        self._l1_discard(key)
         try:
-            await self.client.setex(
-                key,
-                ttl,
-                json.dumps(value, default=str)
-            )
+            payload = _dumps(value)
+            await self.client.setex(key, ttl, _compress(payload))
+            if l1:
+                self._l1_put(key, payload)
+            logger.debug(f"Cache set: {key} (TTL: {ttl}s)")
+            return True
+        except Exception as e:
+            logger.error(f"Cache set error for key '{key}': {e}")
+            return False
+
+    async def set_raw(self, key: str, payload: bytes, ttl: Optional[int] = None) -> bool:
+        """
+        Store already-encoded JSON bytes, e.g. a rendered response body.
+
+        Counterpart to ``get_raw``: the bytes are returned exactly as given.
+
+        Args:
+            key: Cache key
+            payload: JSON bytes
+            ttl: Time-to-live in seconds (default from CACHE_TTLS)
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        if not self.client:
+            return False
+
+        if ttl is None:
+            ttl = CACHE_TTLS.get("session", 3600)
+
+        self._l1_discard(key)
+        try:
+            await self.client.setex(key, ttl, _compress(payload))
             logger.debug(f"Cache set: {key} (TTL: {ttl}s)")
             return True
         except Exception as e:
             logger.error(f"Cache set error for key '{key}': {e}")
             return False
 
+    async def mget(self, keys: List[str]) -> List[Optional[Any]]:
+        """
+        Get several values in one round trip.
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            List[Optional[Any]]: Values aligned with ``keys``, None for misses
+        """
+        if not self.client or not keys:
+            return [None] * len(keys)
+
+        try:
+            raw_values = await self.client.mget(keys)
+        except Exception as e:
+            logger.error(f"Cache mget error for {len(keys)} keys: {e}")
+            return [None] * len(keys)
+
+        values = []
+        for raw in raw_values:
+            if raw:
+                self.stats["hits"] += 1
+                values.append(await _loads(_decompress(raw)))
+            else:
+                self.stats["misses"] += 1
+                values.append(None)
+        return values
+
+    async def mset(self, mapping: Dict[str, Any], ttl: Optional[int] = None) -> bool:
+        """
+        Set several values with the same TTL in one round trip.
+
+        Args:
+            mapping: Cache key -> value (JSON serialized)
+            ttl: Time-to-live in seconds (default from CACHE_TTLS)
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        if not self.client:
+            return False
+        if not mapping:
+            return True
+
+        if ttl is None:
+            ttl = CACHE_TTLS.get("session", 3600)
+
+        try:
+            async with self.pipeline() as pipe:
+                for key, value in mapping.items():
+                    pipe.setex(key, ttl, _compress(_dumps(value)))
+                await pipe.execute()
+            return True
+        except Exception as e:
+            logger.error(f"Cache mset error for {len(mapping)} keys: {e}")
+            return False
+
+    def pipeline(self) -> "redis.client.Pipeline":
+        """
+        Start a non-transactional pipeline for batching raw commands.
+
+        Commands queue locally and go to Redis in one round trip on
+        ``execute()``. Values are not serialized for you.
+
+        Returns:
+            Pipeline: Async pipeline (usable as ``async with``)
+
+        Example:
+            ```python
+            async with cache_service.pipeline() as pipe:
+                pipe.sadd("presence:land:1", "user:2")
+                pipe.expire("presence:land:1", 60)
+                await pipe.execute()
+            ```
+        """
+        return self.client.pipeline(transaction=False)
+
     async def delete(self, key: str) -> bool:
         """
         Delete key from cache.
@@ -150,6 +523,7 @@ class CacheService:
         Returns:
             bool: True if key was deleted, False otherwise
         """
+        self._l1_discard(key)
         if not self.client:
             return False
 
@@ -161,6 +535,27 @@ class CacheService:
             logger.error(f"Cache delete error for key '{key}': {e}")
             return False
 
+    async def delete_many(self, *keys: str) -> int:
+        """
+        Delete several keys in one round trip.
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            int: Number of keys deleted
+        """
+        for key in keys:
+            self._l1_discard(key)
+        if not self.client or not keys:
+            return 0
+
+        try:
+            return await self.client.delete(*keys)
+        except Exception as e:
+            logger.error(f"Cache delete error for {len(keys)} keys: {e}")
+            return 0
+
     async def delete_by_prefix(self, prefix: str, batch_size: int = 500) -> int:
         """
         Delete all keys matching a prefix.
@@ -172,6 +567,8 @@ class CacheService:
         Returns:
             int: Number of keys deleted
         """
+        for key in [k for k in (*self._l1, *self._l1_inflight) if k.startswith(prefix)]:
+            self._l1_discard(key)
         if not self.client:
             return 0
 
@@ -183,7 +580,8 @@ class CacheService:
             while True:
                 cursor, keys = await self.client.scan(cursor=cursor, match=pattern, count=batch_size)
                 if keys:
-                    deleted += await self.client.delete(*keys)
+                    # UNLINK frees memory off the main thread, unlike DEL
+                    deleted += await self.client.unlink(*keys)
                 if cursor == 0 or cursor == "0":
                     break
             logger.info(f"Cache delete_by_prefix prefix={prefix} deleted={deleted}")
@@ -240,11 +638,7 @@ class CacheService:
             return 0
 
         try:
-            value = await self.client.incr(key, amount)
-            # Set TTL on first increment
-            if value == amount:
-                await self.client.expire(key, ttl)
-            return value
+            return int(await self._increment_script(keys=[key], args=[amount, ttl]))
         except Exception as e:
             logger.error(f"Cache increment error for key '{key}': {e}")
             return 0
@@ -316,7 +710,7 @@ class CacheService:
             return set()
 
         try:
-            return await self.client.smembers(key)
+            return {member.decode() for member in await self.client.smembers(key)}
         except Exception as e:
             logger.error(f"Cache smembers error for key '{key}': {e}")
             return set()
@@ -352,7 +746,7 @@ class CacheService:
         key: str,
         ttl: int = 10,
         wait_timeout: int = 5
-    ) -> bool:
+    ) -> Optional[str]:
         """
         Acquire distributed lock.
 
@@ -362,45 +756,56 @@ class CacheService:
             wait_timeout: Max time to wait for lock
 
         Returns:
-            bool: True if lock acquired, False otherwise
+            Optional[str]: Ownership token to pass to ``release_lock``,
+                or None if the lock is held elsewhere
 
         Example:
             ```python
-            if await cache_service.acquire_lock("lock:purchase:land:123"):
+            token = await cache_service.acquire_lock("lock:purchase:land:123")
+            if token:
                 try:
                     # Process purchase
                     pass
                 finally:
-                    await cache_service.release_lock("lock:purchase:land:123")
+                    await cache_service.release_lock("lock:purchase:land:123", token)
             ```
         """
         if not self.client:
-            return False
+            return None
 
         try:
-            token = hashlib.sha256(str(time.time()).encode()).hexdigest()
+            # Random per-acquirer token: unique even for same-instant acquirers
+            token = secrets.token_hex(16)
             result = await self.client.set(
                 key,
                 token,
                 ex=ttl,
                 nx=True  # Only set if doesn't exist
             )
-            return result is not None
+            return token if result else None
         except Exception as e:
             logger.error(f"Lock acquire error for key '{key}': {e}")
-            return False
+            return None
 
-    async def release_lock(self, key: str) -> bool:
+    async def release_lock(self, key: str, token: str) -> bool:
         """
-        Release distributed lock.
+        Release distributed lock if it is still owned by ``token``.
 
         Args:
             key: Lock key
+            token: Token returned by ``acquire_lock``
 
         Returns:
-            bool: True if released, False otherwise
+            bool: True if released, False if not held or owned by another holder
         """
-        return await self.delete(key)
+        if not self.client:
+            return False
+
+        try:
+            return await self._release_lock_script(keys=[key], args=[token]) == 1
+        except Exception as e:
+            logger.error(f"Lock release error for key '{key}': {e}")
+            return False
 
     async def is_healthy(self) -> bool:
         """
@@ -441,8 +846,9 @@ class CacheService:
         total = self.stats["hits"] + self.stats["misses"]
         hit_rate = (self.stats["hits"] / total * 100) if total > 0 else 0
 
-        memory = {}
-        if self.client:
+        fetched_at, memory = self._memory_info
+        now = time.monotonic()
+        if self.client and now - fetched_at >= MEMORY_INFO_TTL_SECONDS:
             try:
                 info = await self.client.info("memory")
                 memory = {
@@ -451,6 +857,7 @@ class CacheService:
                     "maxmemory": info.get("maxmemory"),
                     "evicted_keys": info.get("evicted_keys")
                 }
+                self._memory_info = (now, memory)
             except Exception as e:
                 logger.error(f"Failed to get Redis memory info: {e}")
 
@@ -468,6 +875,7 @@ class CacheService:
         Returns:
             bool: True if successful
         """
+        self._invalidate_l1(None)
         if not self.client:
             return False
 
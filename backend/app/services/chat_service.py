@@ -151,10 +151,7 @@ class ChatService:
             return chat_session
 
         # Verify land exists
-        land_result = await db.execute(
-            select(Land).where(Land.land_id == land_id)
-        )
-        land = land_result.scalar_one_or_none()
+        land = await db.get(Land, land_id)
 
         if not land:
             raise ValueError("Land not found")
@@ -196,10 +193,7 @@ class ChatService:
 
         # Verify all users exist
         for user_id in participants:
-            result = await db.execute(
-                select(User).where(User.user_id == user_id)
-            )
-            if not result.scalar_one_or_none():
+            if not await db.get(User, user_id):
                 raise ValueError(f"User {user_id} not found")
 
         # Create chat session
@@ -244,29 +238,20 @@ class ChatService:
             PermissionError: If sender lacks chat access permissions
         """
         # Verify chat session exists
-        result = await db.execute(
-            select(ChatSession).where(ChatSession.session_id == session_id)
-        )
-        chat_session = result.scalar_one_or_none()
+        chat_session = await db.get(ChatSession, session_id)
 
         if not chat_session:
             raise ValueError("Chat session not found")
 
         # Verify sender exists
-        result = await db.execute(
-            select(User).where(User.user_id == sender_id)
-        )
-        sender = result.scalar_one_or_none()
+        sender = await db.get(User, sender_id)
 
         if not sender:
             raise ValueError("Sender not found")
 
         # Check fencing restrictions for land-based chats
         if chat_session.land_id:
-            result = await db.execute(
-                select(Land).where(Land.land_id == chat_session.land_id)
-            )
-            land = result.scalar_one_or_none()
+            land = await db.get(Land, chat_session.land_id)
 
             if land:
                 await self.enforce_land_chat_access(
@@ -508,18 +493,12 @@ class ChatService:
             int: Number of messages marked as read
         """
         # Verify the owner owns the land for this session
-        result = await db.execute(
-            select(ChatSession).where(ChatSession.session_id == session_id)
-        )
-        session = result.scalar_one_or_none()
+        session = await db.get(ChatSession, session_id)
 
         if not session or not session.land_id:
             return 0
 
-        result = await db.execute(
-            select(Land).where(Land.land_id == session.land_id)
-        )
-        land = result.scalar_one_or_none()
+        land = await db.get(Land, session.land_id)
 
         if not land or land.owner_id != owner_id:
             return 0
@@ -566,10 +545,7 @@ class ChatService:
             List of user dicts with distance info
         """
         # Get the center land
-        result = await db.execute(
-            select(Land).where(Land.land_id == land_id)
-        )
-        center_land = result.scalar_one_or_none()
+        center_land = await db.get(Land, land_id)
 
         if not center_land:
             raise ValueError("Land not found")
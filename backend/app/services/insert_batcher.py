@@ -0,0 +1,223 @@
+"""
+Insert Batcher
+Moves row inserts off the request path into batched background writes
+"""
+
+import asyncio
+import logging
+import os
+import time
+from typing import Any, Dict, List, Optional, Type
+
+import orjson
+from sqlalchemy import insert
+
+from app.db.base import Base
+from app.db.session import AsyncSessionLocal
+
+logger = logging.getLogger(__name__)
+
+
+class InsertBatcher:
+    """
+    Single-consumer queue that batch-inserts rows of one model.
+
+    Request handlers enqueue plain dict payloads (no session coupling); the
+    consumer bulk-inserts up to ``batch_size`` of them with one INSERT +
+    commit on a dedicated session, waiting at most ``max_wait_seconds`` for
+    a batch to fill. The queue is bounded: when it is full, ``enqueue``
+    waits (backpressure on producers) rather than dropping rows.
+
+    A failed batch is retried with exponential backoff. If it keeps failing,
+    rows are inserted one at a time so a single bad row cannot sink the
+    rest, and rows that still fail are appended to ``dead_letter_path`` as
+    JSON lines for replay (or logged in full when no path is set).
+    """
+
+    def __init__(
+        self,
+        model: Type[Base],
+        name: str,
+        batch_size: int = 100,
+        max_wait_seconds: float = 0.05,
+        max_queue_size: int = 5000,
+        max_retries: int = 3,
+        retry_delay_seconds: float = 0.5,
+        dead_letter_path: Optional[str] = None
+    ):
+        """
+        Initialize batcher.
+
+        Args:
+            model: Model whose table the rows are inserted into
+            name: Label used in log messages
+            batch_size: Maximum rows written per commit (default 100)
+            max_wait_seconds: Time to wait for a batch to fill (default 50ms)
+            max_queue_size: Queue bound; producers wait when it is full
+            max_retries: Batch retries before falling back to single rows
+            retry_delay_seconds: First retry delay, doubled per attempt
+            dead_letter_path: JSON-lines file for rows that cannot be written
+        """
+        self.model = model
+        self.name = name
+        self.batch_size = batch_size
+        self.max_wait_seconds = max_wait_seconds
+        self.max_queue_size = max_queue_size
+        self.max_retries = max_retries
+        self.retry_delay_seconds = retry_delay_seconds
+        self.dead_letter_path = dead_letter_path
+        self.running = False
+        self.task: Optional[asyncio.Task] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._pending: List[Dict[str, Any]] = []
+        self._inflight: Optional[asyncio.Future] = None
+
+    @property
+    def queue(self) -> asyncio.Queue:
+        """Queue created lazily so it binds to the running event loop."""
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        return self._queue
+
+    async def enqueue(self, payload: Dict[str, Any]) -> None:
+        """
+        Queue a row payload for the next batch.
+
+        Payloads in one batcher must all carry the same keys, since a batch
+        is written as a single executemany INSERT.
+
+        Args:
+            payload: Column values
+        """
+        await self.queue.put(payload)
+
+    async def _fill_batch(self) -> None:
+        """
+        Block for the first payload, then collect into ``_pending`` until the
+        batch is full or the wait window closes.
+        """
+        self._pending.append(await self.queue.get())
+        deadline = time.monotonic() + self.max_wait_seconds
+
+        while len(self._pending) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                self._pending.append(await asyncio.wait_for(self.queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+
+    def _take_pending(self) -> List[Dict[str, Any]]:
+        """Hand off the collected batch plus anything still queued."""
+        batch, self._pending = self._pending, []
+        if self._queue is not None:
+            while not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+        return batch
+
+    async def _insert(self, rows: List[Dict[str, Any]]) -> None:
+        """Insert rows in a single transaction; raises on failure."""
+        async with AsyncSessionLocal() as db:
+            try:
+                # One executemany INSERT; no ORM instances or identity map
+                await db.execute(insert(self.model), rows)
+                await db.commit()
+            except Exception:
+                await db.rollback()
+                raise
+
+    async def write_batch(self, batch: List[Dict[str, Any]]) -> None:
+        """Insert a batch, retrying and dead-lettering rows rather than dropping them."""
+        if not batch:
+            return
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                await self._insert(batch)
+                return
+            except Exception as e:
+                logger.warning(
+                    f"Failed to write {len(batch)} {self.name} rows "
+                    f"(attempt {attempt + 1}/{self.max_retries + 1}): {e}"
+                )
+            if attempt < self.max_retries:
+                await asyncio.sleep(self.retry_delay_seconds * 2 ** attempt)
+
+        failed = batch
+        if len(batch) > 1:
+            failed = []
+            for row in batch:
+                try:
+                    await self._insert([row])
+                except Exception:
+                    failed.append(row)
+        await self._dead_letter(failed)
+
+    async def _dead_letter(self, rows: List[Dict[str, Any]]) -> None:
+        """Persist rows that could not be inserted so they can be replayed."""
+        if not rows:
+            return
+        lines = b"".join(orjson.dumps(row, default=str) + b"\n" for row in rows)
+        if self.dead_letter_path:
+            try:
+                await asyncio.to_thread(self._append_dead_letter, lines)
+                logger.error(
+                    f"Dead-lettered {len(rows)} {self.name} rows to {self.dead_letter_path}"
+                )
+                return
+            except OSError as e:
+                logger.error(f"Failed to write {self.name} dead-letter file: {e}")
+        logger.error(f"Dropped {len(rows)} {self.name} rows: {lines.decode()}")
+
+    def _append_dead_letter(self, lines: bytes) -> None:
+        directory = os.path.dirname(self.dead_letter_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.dead_letter_path, "ab") as dead_letter:
+            dead_letter.write(lines)
+
+    async def run(self):
+        """Main consumer loop."""
+        logger.info(
+            f"Starting {self.name} batcher "
+            f"(batch_size={self.batch_size}, max_wait={self.max_wait_seconds}s)"
+        )
+        self.running = True
+
+        while self.running:
+            try:
+                await self._fill_batch()
+                batch, self._pending = self._pending, []
+                # Kept as a task and shielded: cancelling the consumer mid-write
+                # leaves the write running, and stop() waits for it
+                self._inflight = asyncio.ensure_future(self.write_batch(batch))
+                await asyncio.shield(self._inflight)
+                self._inflight = None
+            except asyncio.CancelledError:
+                break
+
+    def start(self):
+        """Start the background consumer."""
+        if not self.running:
+            self.task = asyncio.create_task(self.run())
+
+    async def stop(self):
+        """Stop the consumer and flush anything still queued."""
+        if self.running:
+            logger.info(f"Stopping {self.name} batcher...")
+            self.running = False
+
+            if self.task:
+                self.task.cancel()
+                try:
+                    await self.task
+                except asyncio.CancelledError:
+                    pass
+
+        if self._inflight is not None:
+            await self._inflight
+            self._inflight = None
+
+        await self.write_batch(self._take_pending())
+        logger.info(f"{self.name.capitalize()} batcher stopped")
@@ -16,7 +16,7 @@ from app.models.bid import Bid, BidStatus
 from app.models.land import Land
 from app.models.user import User
 from app.models.transaction import Transaction, TransactionType, TransactionStatus
-from app.models.admin_config import AdminConfig
+from app.services.admin_config_service import admin_config_cache
 from app.services.cache_service import cache_service
 from app.services.parcel_service import parcel_service
 from app.config import CACHE_TTLS
@@ -89,8 +89,7 @@ class MarketplaceService:
             raise ValueError("Lands must be connected (edge-adjacent, no diagonal-only connections)")
 
         # Load admin config for listing constraints
-        cfg_res = await db.execute(select(AdminConfig).limit(1))
-        config = cfg_res.scalar_one_or_none()
+        config = await admin_config_cache.get()
 
         max_lands_per_listing = config.max_lands_per_listing if config else 50
         listing_cooldown_minutes = config.listing_cooldown_minutes if config else 5
@@ -171,9 +170,9 @@ class MarketplaceService:
         await db.refresh(listing)
 
         # Invalidate caches
-        for land in lands:
-            await cache_service.delete(f"land:{land.land_id}")
-        await cache_service.delete(f"active_listings")
+        await cache_service.delete_many(
+            *(f"land:{land.land_id}" for land in lands), "active_listings"
+        )
 
         logger.info(f"Parcel listing created: {listing.listing_id} with {len(lands)} lands")
 
@@ -202,10 +201,7 @@ class MarketplaceService:
             ValueError: If validation fails
         """
         # Get listing
-        result = await db.execute(
-            select(Listing).where(Listing.listing_id == listing_id)
-        )
-        listing = result.scalar_one_or_none()
+        listing = await db.get(Listing, listing_id)
 
         if not listing:
             raise ValueError("Listing not found")
@@ -217,8 +213,7 @@ class MarketplaceService:
             raise ValueError("Cannot bid on fixed price listings")
 
         # Fetch AdminConfig for bid increment and limits
-        cfg_res = await db.execute(select(AdminConfig).limit(1))
-        config = cfg_res.scalar_one_or_none()
+        config = await admin_config_cache.get()
 
         # Check if auction has ended
         if listing.auction_end_time and listing.auction_end_time < datetime.now(timezone.utc):
@@ -306,10 +301,7 @@ class MarketplaceService:
             ValueError: If validation fails
         """
         # Get listing
-        result = await db.execute(
-            select(Listing).where(Listing.listing_id == listing_id)
-        )
-        listing = result.scalar_one_or_none()
+        listing = await db.get(Listing, listing_id)
 
         if not listing:
             raise ValueError("Listing not found")
@@ -356,8 +348,7 @@ class MarketplaceService:
         amount = listing.buy_now_price_bdt
 
         # Fetch admin config for fee tiers
-        cfg_res = await db.execute(select(AdminConfig).limit(1))
-        config = cfg_res.scalar_one_or_none()
+        config = await admin_config_cache.get()
 
         def get_fee_percent(amount_bdt: int) -> float:
             if not config:
@@ -404,14 +395,14 @@ class MarketplaceService:
         listing.status = ListingStatus.SOLD
 
         await db.commit()
-        await db.refresh(transaction)
 
         # Invalidate caches
-        await cache_service.delete(f"listing:{listing_id}")
-        for land in lands:
-            await cache_service.delete(f"land:{land.land_id}")
-        await cache_service.delete(f"user:{buyer_id}")
-        await cache_service.delete(f"user:{seller.user_id}")
+        await cache_service.delete_many(
+            f"listing:{listing_id}",
+            *(f"land:{land.land_id}" for land in lands),
+            f"user:{buyer_id}",
+            f"user:{seller.user_id}",
+        )
 
         logger.info(
             f"Buy now completed: listing {listing_id}, "
@@ -439,10 +430,7 @@ class MarketplaceService:
             ValueError: If validation fails
         """
         # Get listing
-        result = await db.execute(
-            select(Listing).where(Listing.listing_id == listing_id)
-        )
-        listing = result.scalar_one_or_none()
+        listing = await db.get(Listing, listing_id)
 
         if not listing:
             raise ValueError("Listing not found")
@@ -524,8 +512,7 @@ class MarketplaceService:
 
         # Transfer funds (apply tiered platform fee)
         # Fetch admin config for fee tiers
-        cfg_res = await db.execute(select(AdminConfig).limit(1))
-        config = cfg_res.scalar_one_or_none()
+        config = await admin_config_cache.get()
 
         def get_fee_percent(amount_bdt: int) -> float:
             if not config:
@@ -570,12 +557,11 @@ class MarketplaceService:
         listing.status = ListingStatus.SOLD
 
         await db.commit()
-        await db.refresh(transaction)
 
         # Invalidate caches
-        await cache_service.delete(f"listing:{listing_id}")
-        for land in lands:
-            await cache_service.delete(f"land:{land.land_id}")
+        await cache_service.delete_many(
+            f"listing:{listing_id}", *(f"land:{land.land_id}" for land in lands)
+        )
 
         logger.info(
             f"Auction finalized: listing {listing_id}, "
@@ -604,10 +590,7 @@ class MarketplaceService:
         Raises:
             ValueError: If validation fails
         """
-        result = await db.execute(
-            select(Listing).where(Listing.listing_id == listing_id)
-        )
-        listing = result.scalar_one_or_none()
+        listing = await db.get(Listing, listing_id)
 
         if not listing:
             raise ValueError("Listing not found")
@@ -637,9 +620,9 @@ class MarketplaceService:
         await db.commit()
         await db.refresh(listing)
 
-        await cache_service.delete(f"listing:{listing_id}")
-        for land in lands:
-            await cache_service.delete(f"land:{land.land_id}")
+        await cache_service.delete_many(
+            f"listing:{listing_id}", *(f"land:{land.land_id}" for land in lands)
+        )
 
         logger.info(f"Parcel listing cancelled: {listing_id} with {len(lands)} lands")
 
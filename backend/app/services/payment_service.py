@@ -14,10 +14,12 @@ from enum import Enum
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
 from app.models.user import User
 from app.models.transaction import Transaction
 from app.models.admin_config import AdminConfig
 from app.models.payment_event import PaymentEvent
+from app.models.payment_gateway_txn import PaymentGatewayTxn
 from app.config import settings
 import logging
 
@@ -230,13 +232,17 @@ class PaymentService:
             config = config_res.scalar_one_or_none()
             net_amount, fee = self._apply_gateway_fee(amount, config)
 
-            # Update user balance
-            stmt = select(User).where(User.user_id == user_id).with_for_update()
-            result = await db.execute(stmt)
-            user = result.scalar_one_or_none()
+            if not await self._claim_gateway_transaction(db, PaymentGateway.BKASH, payment_id):
+                logger.info(f"bKash payment {payment_id} already processed")
+                return True
 
-            if not user:
+            # Update user balance atomically (no row lock needed)
+            new_balance = await User.add_balance(db, user_id, net_amount)
+
+            if new_balance is None:
                 logger.error(f"User not found for bKash payment: {user_id}")
+                # Release the claim so a redelivery can still credit the payment
+                await db.rollback()
                 db.add(PaymentEvent(
                     gateway=PaymentGateway.BKASH,
                     event_type="webhook",
@@ -247,8 +253,6 @@ class PaymentService:
                 await db.commit()
                 return False
 
-            user.balance_bdt += net_amount
-
             # Log transaction
             transaction = Transaction(
                 transaction_id=str(uuid4()),
@@ -457,17 +461,18 @@ class PaymentService:
             config = config_res.scalar_one_or_none()
             net_amount, fee = self._apply_gateway_fee(amount, config)
 
-            # Update user balance
-            stmt = select(User).where(User.user_id == user_id).with_for_update()
-            result = await db.execute(stmt)
-            user = result.scalar_one_or_none()
+            if not await self._claim_gateway_transaction(db, gateway, payment_id):
+                logger.info(f"{gateway} payment {payment_id} already processed")
+                return True
+
+            # Update user balance atomically (no row lock needed)
+            new_balance = await User.add_balance(db, user_id, net_amount)
 
-            if not user:
+            if new_balance is None:
                 logger.error(f"User not found for {gateway} payment: {user_id}")
+                await db.rollback()
                 return False
 
-            user.balance_bdt += net_amount
-
             # Log transaction
             transaction = Transaction(
                 transaction_id=str(uuid4()),
@@ -513,6 +518,26 @@ class PaymentService:
             await db.commit()
             return False
 
+    @staticmethod
+    async def _claim_gateway_transaction(db: AsyncSession, gateway: str, payment_id: str) -> bool:
+        """
+        Claim a gateway transaction id before crediting it.
+
+        Runs in the caller's DB transaction. A concurrent delivery of the same
+        id blocks on the primary key until this transaction ends, then gets
+        nothing back, so each payment is credited at most once.
+
+        Returns:
+            True if this call claimed the id, False if it was already claimed
+        """
+        result = await db.execute(
+            insert(PaymentGatewayTxn)
+            .values(gateway_transaction_id=payment_id, gateway=gateway)
+            .on_conflict_do_nothing(index_elements=[PaymentGatewayTxn.gateway_transaction_id])
+            .returning(PaymentGatewayTxn.gateway_transaction_id)
+        )
+        return result.scalar() is not None
+
     @staticmethod
     def _apply_gateway_fee(amount: int, config: Optional[AdminConfig]) -> tuple[int, int]:
         if not config:
@@ -1,5 +1,5 @@
 """
-Rate limiting service backed by Redis (via cache_service.client).
+Rate limiting service backed by Redis (via cache_service).
 Uses fixed window counters per bucket/user.
 """
 
@@ -30,8 +30,7 @@ class RateLimitService:
         if limit is None or limit <= 0:
             return None
 
-        client = cache_service.client
-        if client is None:
+        if cache_service.client is None:
             return None
 
         now = int(time.time())
@@ -39,9 +38,10 @@ class RateLimitService:
         key = f"rl:{bucket}:{identifier}:{window_start}"
 
         try:
-            count = await client.incr(key)
-            if count == 1:
-                await client.expire(key, window_seconds)
+            # INCR + EXPIRE in one scripted round trip; 0 means Redis failed
+            count = await cache_service.increment(key, 1, window_seconds)
+            if count == 0:
+                return None
 
             allowed = count <= limit
             remaining = max(limit - count, 0)
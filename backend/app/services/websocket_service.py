@@ -6,14 +6,20 @@ Manages WebSocket connections, rooms, and message broadcasting
 from fastapi import WebSocket, WebSocketDisconnect
 from typing import Dict, Set, List, Optional
 import asyncio
-import json
 import logging
 from datetime import datetime
 import uuid
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
 
+def encode_message(message: dict) -> str:
+    """Encode a message once for fan-out to every socket (orjson, C-level)."""
+    return orjson.dumps(message, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 class ConnectionManager:
     """
     Manages WebSocket connections and rooms.
@@ -125,7 +131,7 @@ class ConnectionManager:
         if user_id not in self.active_connections:
             return False
 
-        message_json = json.dumps(message)
+        message_json = encode_message(message)
 
         # Send to all user's connections
         disconnected = set()
@@ -157,10 +163,32 @@ class ConnectionManager:
         if room_id not in self.rooms:
             return 0
 
-        message_json = json.dumps(message)
+        return await self.broadcast_text_to_room(encode_message(message), room_id, exclude_user)
+
+    async def broadcast_text_to_room(
+        self,
+        message_json: str,
+        room_id: str,
+        exclude_user: Optional[str] = None
+    ) -> int:
+        """
+        Broadcast an already-encoded message to all users in a room.
+
+        Args:
+            message_json: Encoded message text
+            room_id: Room ID to broadcast to
+            exclude_user: Optional user ID to exclude from broadcast
+
+        Returns:
+            int: Number of users message was sent to
+        """
+        if room_id not in self.rooms:
+            return 0
+
         sent_count = 0
 
-        for user_id in self.rooms[room_id]:
+        # Copy: membership may change while sends are suspended
+        for user_id in list(self.rooms[room_id]):
             # Skip excluded user
             if exclude_user and user_id == exclude_user:
                 continue
@@ -179,6 +207,45 @@ class ConnectionManager:
 
         return sent_count
 
+    async def broadcast_text_to_rooms(self, message_json: str, room_ids: List[str]) -> int:
+        """
+        Send an already-encoded message once to every member of any of the rooms.
+
+        Users in several of the rooms still get a single copy, and all sends
+        run concurrently.
+
+        Args:
+            message_json: Encoded message text
+            room_ids: Rooms whose members receive the message
+
+        Returns:
+            int: Number of websocket sends that succeeded
+        """
+        recipients: Set[str] = set()
+        for room_id in room_ids:
+            recipients.update(self.rooms.get(room_id, ()))
+
+        sockets = [
+            websocket
+            for user_id in recipients
+            for websocket in self.active_connections.get(user_id, ())
+        ]
+        if not sockets:
+            return 0
+
+        results = await asyncio.gather(
+            *(websocket.send_text(message_json) for websocket in sockets),
+            return_exceptions=True
+        )
+
+        sent_count = 0
+        for websocket, result in zip(sockets, results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to broadcast to user {self.websocket_to_user.get(websocket)}: {result}")
+            else:
+                sent_count += 1
+        return sent_count
+
     async def broadcast_all(self, message: dict, exclude_user: Optional[str] = None) -> int:
         """
         Broadcast a message to every connected user.
@@ -193,7 +260,7 @@ class ConnectionManager:
         if not self.active_connections:
             return 0
 
-        message_json = json.dumps(message)
+        message_json = encode_message(message)
         sent_count = 0
 
         for user_id, sockets in self.active_connections.items():
@@ -380,7 +447,7 @@ class ConnectionManager:
         if not sockets:
             return False
 
-        message = json.dumps({
+        message = encode_message({
             "type": "session_invalidated",
             "reason": reason,
             "timestamp": datetime.utcnow().isoformat()
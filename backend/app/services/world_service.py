@@ -298,7 +298,7 @@ class WorldGenerationService:
 
         # Check cache first
         cache_key = f"chunk:{chunk_id}:{chunk_size}"
-        cached_chunk = await cache_service.get(cache_key)
+        cached_chunk = await cache_service.get(cache_key, l1=True)
 
         if cached_chunk:
             logger.debug(f"Cache hit for chunk {chunk_id}")
@@ -346,7 +346,7 @@ class WorldGenerationService:
         }
 
         # Cache the chunk (chunks are immutable)
-        await cache_service.set(cache_key, chunk_data, ttl=CACHE_TTLS["chunk"])
+        await cache_service.set(cache_key, chunk_data, ttl=CACHE_TTLS["chunk"], l1=True)
 
         logger.info(f"Generated chunk {chunk_id} with {len(lands)} lands")
 
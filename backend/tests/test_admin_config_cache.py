@@ -0,0 +1,40 @@
+"""
+Tests for the in-process admin config snapshot cache
+"""
+
+from sqlalchemy.orm import Session
+
+from app.services.admin_config_service import admin_config_cache
+
+
+class TestAdminConfigCacheInvalidation:
+    """Test that committed config changes drop the cached snapshot."""
+
+    def test_commit_with_config_change_bumps_version(self):
+        session = Session()
+        version = admin_config_cache.version
+        session.info["admin_config_changed"] = True
+
+        session.commit()
+
+        assert admin_config_cache.version == version + 1
+        assert "admin_config_changed" not in session.info
+
+    def test_commit_without_config_change_keeps_version(self):
+        session = Session()
+        version = admin_config_cache.version
+
+        session.commit()
+
+        assert admin_config_cache.version == version
+
+    def test_rollback_discards_pending_change(self):
+        session = Session()
+        version = admin_config_cache.version
+        session.begin()
+        session.info["admin_config_changed"] = True
+
+        session.rollback()
+        session.commit()
+
+        assert admin_config_cache.version == version
@@ -0,0 +1,116 @@
+"""
+Tests for batched audit log writes
+"""
+
+import asyncio
+
+import pytest
+
+from app.services.audit_log_service import AuditLogBatcher
+
+
+class RecordingBatcher(AuditLogBatcher):
+    """Batcher that records batches instead of writing to the database."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.batches = []
+
+    async def write_batch(self, batch):
+        if batch:
+            self.batches.append(batch)
+
+
+class TestAuditLogBatcher:
+    """Test queue draining and flush-on-stop behaviour."""
+
+    @pytest.mark.asyncio
+    async def test_groups_queued_payloads_into_batches(self):
+        batcher = RecordingBatcher(batch_size=3, max_wait_seconds=0.05)
+        for i in range(7):
+            await batcher.enqueue({"event_type": f"e{i}"})
+
+        batcher.start()
+        await asyncio.sleep(0.2)
+        await batcher.stop()
+
+        assert [len(b) for b in batcher.batches] == [3, 3, 1]
+
+    @pytest.mark.asyncio
+    async def test_stop_flushes_remaining_payloads(self):
+        batcher = RecordingBatcher()
+        await batcher.enqueue({"event_type": "a"})
+        await batcher.enqueue({"event_type": "b"})
+
+        await batcher.stop()
+
+        assert batcher.batches == [[{"event_type": "a"}, {"event_type": "b"}]]
+
+
+class SlowBatcher(RecordingBatcher):
+    """Batcher whose writes take a while, to be caught mid-write by stop()."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.writing = asyncio.Event()
+
+    async def write_batch(self, batch):
+        if batch:
+            self.writing.set()
+            await asyncio.sleep(0.05)
+        await super().write_batch(batch)
+
+
+class TestStopDuringWrite:
+    """Test that stop() waits for a batch already being written."""
+
+    @pytest.mark.asyncio
+    async def test_stop_waits_for_inflight_batch(self):
+        batcher = SlowBatcher(max_wait_seconds=0)
+        await batcher.enqueue({"event_type": "a"})
+        batcher.start()
+        await batcher.writing.wait()
+
+        await batcher.stop()
+
+        assert batcher.batches == [[{"event_type": "a"}]]
+
+
+class FlakyBatcher(AuditLogBatcher):
+    """Batcher whose inserts fail for listed rows or a number of attempts."""
+
+    def __init__(self, failures=0, bad_rows=(), **kwargs):
+        super().__init__(retry_delay_seconds=0, **kwargs)
+        self.failures = failures
+        self.bad_rows = bad_rows
+        self.written = []
+
+    async def _insert(self, rows):
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("database unavailable")
+        if any(row["event_type"] in self.bad_rows for row in rows):
+            raise ValueError("bad row")
+        self.written.extend(rows)
+
+
+class TestWriteFailures:
+    """Test that failed batches are retried or dead-lettered, never dropped."""
+
+    @pytest.mark.asyncio
+    async def test_transient_failure_is_retried(self):
+        batcher = FlakyBatcher(failures=2)
+
+        await batcher.write_batch([{"event_type": "a"}, {"event_type": "b"}])
+
+        assert batcher.written == [{"event_type": "a"}, {"event_type": "b"}]
+
+    @pytest.mark.asyncio
+    async def test_bad_row_is_dead_lettered_and_rest_written(self, tmp_path):
+        path = tmp_path / "dead" / "audit.jsonl"
+        batcher = FlakyBatcher(bad_rows=("b",), dead_letter_path=str(path))
+
+        await batcher.write_batch([{"event_type": "a"}, {"event_type": "b"}, {"event_type": "c"}])
+
+        assert batcher.written == [{"event_type": "a"}, {"event_type": "c"}]
+        assert path.read_bytes() == b'{"event_type":"b"}\n'
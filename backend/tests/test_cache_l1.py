@@ -0,0 +1,265 @@
+"""
+Tests for CacheService caching, compression and locks
+"""
+
+from unittest.mock import AsyncMock
+
+import orjson
+import pytest
+
+from app.services.cache_service import LARGE_PAYLOAD_BYTES, CacheService
+
+
+def _service() -> CacheService:
+    service = CacheService("redis://localhost:6379/0")
+    service.client = AsyncMock()
+    return service
+
+
+class TestL1Cache:
+    """Test that L1 entries skip Redis and never leak mutations or stale data."""
+
+    @pytest.mark.asyncio
+    async def test_l1_hit_skips_redis(self):
+        service = _service()
+        service.client.get.return_value = orjson.dumps({"lands": [1, 2]})
+
+        assert await service.get("chunk:0_0:32", l1=True) == {"lands": [1, 2]}
+        assert await service.get("chunk:0_0:32", l1=True) == {"lands": [1, 2]}
+        service.client.get.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_plain_get_bypasses_l1(self):
+        service = _service()
+        await service.set("rate:1", 5, ttl=60, l1=True)
+        service.client.get.return_value = b"6"
+
+        assert await service.get("rate:1") == 6
+
+    @pytest.mark.asyncio
+    async def test_returned_value_is_a_copy(self):
+        service = _service()
+        await service.set("chunk:0_0:32", {"lands": []}, ttl=60, l1=True)
+
+        (await service.get("chunk:0_0:32", l1=True))["lands"].append("owner")
+        assert await service.get("chunk:0_0:32", l1=True) == {"lands": []}
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_falls_through(self):
+        service = _service()
+        await service.set("chunk:0_0:32", {"v": 1}, ttl=60, l1=True)
+        service._l1["chunk:0_0:32"] = (0.0, service._l1["chunk:0_0:32"][1])
+        service.client.get.return_value = orjson.dumps({"v": 2})
+
+        assert await service.get("chunk:0_0:32", l1=True) == {"v": 2}
+
+    @pytest.mark.asyncio
+    async def test_deletes_invalidate_l1(self):
+        service = _service()
+        service.client.scan.return_value = (0, [])
+        for key in ("a:1", "b:1", "chunk:1", "chunk:2"):
+            await service.set(key, 1, ttl=60, l1=True)
+
+        await service.delete("a:1")
+        await service.delete_many("b:1")
+        await service.delete_by_prefix("chunk:")
+        assert service._l1 == {}
+
+    @pytest.mark.asyncio
+    async def test_flush_all_clears_l1(self):
+        service = _service()
+        await service.set("chunk:1", 1, ttl=60, l1=True)
+
+        await service.flush_all()
+        assert service._l1 == {}
+
+
+class TestGetStats:
+    """Test that polled stats reuse a recent INFO memory result."""
+
+    @pytest.mark.asyncio
+    async def test_memory_info_reused_within_ttl(self):
+        service = _service()
+        service.client.info.return_value = {"used_memory": 1024}
+
+        first = await service.get_stats()
+        second = await service.get_stats()
+        assert first["memory"] == second["memory"] == {
+            "used_memory": 1024, "used_memory_human": None, "maxmemory": None, "evicted_keys": None,
+        }
+        service.client.info.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_memory_info_refreshed_after_ttl(self):
+        service = _service()
+        service.client.info.return_value = {"used_memory": 1024}
+        await service.get_stats()
+
+        service._memory_info = (0.0, service._memory_info[1])
+        service.client.info.return_value = {"used_memory": 2048}
+        assert (await service.get_stats())["memory"]["used_memory"] == 2048
+
+
+class TestLargePayloads:
+    """Test that large cached values decode the same off the event loop."""
+
+    @pytest.mark.asyncio
+    async def test_large_value_round_trips(self):
+        service = _service()
+        chunk = {"lands": [{"x": i, "biome": "forest"} for i in range(5000)]}
+        payload = orjson.dumps(chunk)
+        assert len(payload) > LARGE_PAYLOAD_BYTES
+        service.client.get.return_value = payload
+
+        assert await service.get("chunk:0_0:64") == chunk
+
+
+class TestServerAssistedInvalidation:
+    """Test that Redis invalidation pushes keep tracked L1 entries coherent."""
+
+    @pytest.mark.asyncio
+    async def test_tracked_prefix_gets_longer_ttl(self):
+        service = _service()
+        service._tracking = True
+        await service.set("chunk:0_0:32", {"v": 1}, ttl=60, l1=True)
+        await service.set("leaderboard:top", {"v": 1}, ttl=60, l1=True)
+
+        assert service._l1["chunk:0_0:32"][0] > service._l1["leaderboard:top"][0]
+
+    @pytest.mark.asyncio
+    async def test_listener_evicts_pushed_keys(self):
+        service = _service()
+        await service.set("chunk:1", 1, ttl=60, l1=True)
+        await service.set("chunk:2", 2, ttl=60, l1=True)
+        remaining = []
+        messages = iter([[b"message", b"__redis__:invalidate", [b"chunk:1"]]])
+
+        async def read_response():
+            for message in messages:
+                return message
+            remaining.extend(service._l1)
+            raise ConnectionError("closed")
+
+        connection = AsyncMock()
+        connection.read_response.side_effect = read_response
+
+        await service._invalidation_listener(connection)
+        assert remaining == ["chunk:2"]
+
+    @pytest.mark.asyncio
+    async def test_listener_failure_clears_l1_and_stops_tracking(self):
+        service = _service()
+        service._tracking = True
+        await service.set("chunk:2", 2, ttl=60, l1=True)
+        connection = AsyncMock()
+        connection.read_response.side_effect = ConnectionError("closed")
+
+        await service._invalidation_listener(connection)
+        assert service._l1 == {}
+        assert service._tracking is False
+
+
+class TestCompression:
+    """Test that large values are stored compressed and read back transparently."""
+
+    @pytest.mark.asyncio
+    async def test_large_value_stored_compressed(self):
+        service = _service()
+        chunk = {"lands": [{"x": i, "biome": "forest"} for i in range(500)]}
+
+        await service.set("chunk:0_0:32", chunk, ttl=60)
+        stored = service.client.setex.await_args.args[2]
+        assert stored[:1] == b"\x01"
+        assert len(stored) < len(orjson.dumps(chunk))
+
+        service.client.get.return_value = stored
+        assert await service.get("chunk:0_0:32") == chunk
+        assert await service.get_raw("chunk:0_0:32") == orjson.dumps(chunk)
+
+    @pytest.mark.asyncio
+    async def test_small_value_stored_as_plain_json(self):
+        service = _service()
+
+        await service.set("user:1", {"name": "a"}, ttl=60)
+        assert service.client.setex.await_args.args[2] == b'{"name":"a"}'
+
+
+class TestLocks:
+    """Test that locks are released only by the holder that acquired them."""
+
+    @pytest.mark.asyncio
+    async def test_acquire_returns_token(self):
+        service = _service()
+        service.client.set.return_value = True
+
+        token = await service.acquire_lock("lock:land:1")
+        assert token and service.client.set.await_args.args == ("lock:land:1", token)
+
+    @pytest.mark.asyncio
+    async def test_acquire_returns_none_when_held(self):
+        service = _service()
+        service.client.set.return_value = None
+
+        assert await service.acquire_lock("lock:land:1") is None
+
+    @pytest.mark.asyncio
+    async def test_release_checks_token(self):
+        service = _service()
+        service._release_lock_script = AsyncMock(return_value=0)
+
+        assert await service.release_lock("lock:land:1", "stale-token") is False
+        service._release_lock_script.assert_awaited_once_with(keys=["lock:land:1"], args=["stale-token"])
+        service.client.delete.assert_not_awaited()
+
+
+class TestRawValues:
+    """Test that pre-rendered bodies are returned byte-for-byte."""
+
+    @pytest.mark.asyncio
+    async def test_set_raw_round_trips_exact_bytes(self):
+        service = _service()
+        body = b'{"created_at":"2025-01-01T00:00:00Z","lands":[' + b"1," * 1000 + b"1]}"
+
+        await service.set_raw("listing:1", body, ttl=60)
+        service.client.get.return_value = service.client.setex.await_args.args[2]
+
+        assert await service.get_raw("listing:1") == body
+
+
+class TestInFlightInvalidation:
+    """Test that a GET racing an invalidation does not cache the stale value."""
+
+    @pytest.mark.asyncio
+    async def test_invalidation_during_get_skips_l1(self):
+        service = _service()
+
+        async def get_then_invalidate(key):
+            service._invalidate_l1([key.encode()])
+            return orjson.dumps({"v": "stale"})
+
+        service.client.get.side_effect = get_then_invalidate
+
+        assert await service.get("chunk:0_0:32", l1=True) == {"v": "stale"}
+        assert "chunk:0_0:32" not in service._l1
+        assert service._l1_inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_unrelated_invalidation_keeps_population(self):
+        service = _service()
+
+        async def get_then_invalidate_other(key):
+            service._invalidate_l1([b"chunk:9_9:32"])
+            return orjson.dumps({"v": 1})
+
+        service.client.get.side_effect = get_then_invalidate_other
+
+        await service.get("chunk:0_0:32", l1=True)
+        assert "chunk:0_0:32" in service._l1
+
+    @pytest.mark.asyncio
+    async def test_failed_get_releases_marker(self):
+        service = _service()
+        service.client.get.side_effect = ConnectionError("down")
+
+        assert await service.get("chunk:0_0:32", l1=True) is None
+        assert service._l1_inflight == {}
@@ -0,0 +1,62 @@
+"""
+Tests for marketplace listing schemas
+"""
+
+import pytest
+from pydantic import ValidationError
+
+from app.config import settings
+from app.schemas.listing_schema import BuyNowRequest, ListingCreate, ListingResponse, ListingSearch
+
+LAND_IDS = ["123e4567-e89b-12d3-a456-426614174000"]
+
+
+class TestListingCreate:
+    """Test listing-type dependent field validation."""
+
+    def test_auction_requires_price_and_duration(self):
+        with pytest.raises(ValidationError, match="duration_hours required"):
+            ListingCreate(land_ids=LAND_IDS, listing_type="auction", starting_price_bdt=100)
+
+    def test_fixed_price_requires_buy_now_price(self):
+        with pytest.raises(ValidationError, match="buy_now_price_bdt required"):
+            ListingCreate(land_ids=LAND_IDS, listing_type="fixed_price")
+
+    def test_valid_auction_with_buynow(self):
+        listing = ListingCreate(
+            land_ids=LAND_IDS,
+            listing_type="auction_with_buynow",
+            starting_price_bdt=100,
+            buy_now_price_bdt=200,
+            duration_hours=24
+        )
+        assert listing.buy_now_price_bdt == 200
+
+
+class TestRequestPatterns:
+    """Test enumerated string fields."""
+
+    def test_payment_method(self):
+        assert BuyNowRequest(payment_method="bkash").payment_method == "bkash"
+        with pytest.raises(ValidationError):
+            BuyNowRequest(payment_method="paypal")
+        with pytest.raises(ValidationError):
+            BuyNowRequest(payment_method="bkash\n")
+
+    def test_sort_by(self):
+        assert ListingSearch(sort_by="ending_soon").sort_by == "ending_soon"
+        with pytest.raises(ValidationError):
+            ListingSearch(sort_by="random")
+
+
+class TestTrustedResponse:
+    """Test unvalidated construction of server-built responses."""
+
+    def test_skips_validation_by_default(self):
+        listing = ListingResponse.from_trusted({"listing_id": "abc", "bid_count": "n/a"})
+        assert listing.bid_count == "n/a"
+
+    def test_debug_validate_flag(self, monkeypatch):
+        monkeypatch.setattr(settings, "debug_validate", True)
+        with pytest.raises(ValidationError):
+            ListingResponse.from_trusted({"listing_id": "abc"})
@@ -0,0 +1,54 @@
+"""
+Tests for the biome market worker's single-message broadcast
+"""
+
+import json
+
+import pytest
+
+from app.services.biome_market_worker import BiomeMarketWorker
+from app.services.websocket_service import connection_manager
+
+
+class _FakeSocket:
+    def __init__(self):
+        self.sent = []
+
+    async def send_text(self, text):
+        self.sent.append(text)
+
+
+class TestBroadcastUpdate:
+    """Test one update delivered once per market subscriber."""
+
+    @pytest.fixture(autouse=True)
+    def _clean_manager(self):
+        yield
+        connection_manager.rooms.clear()
+        connection_manager.active_connections.clear()
+
+    @pytest.mark.asyncio
+    async def test_single_message_to_all_market_subscribers(self):
+        all_socket, forest_socket, both_socket = _FakeSocket(), _FakeSocket(), _FakeSocket()
+        connection_manager.active_connections.update({
+            "u1": {all_socket}, "u2": {forest_socket}, "u3": {both_socket}
+        })
+        connection_manager.rooms.update({
+            "biome_market_all": {"u1", "u3"},
+            "biome_market:forest": {"u2", "u3"}
+        })
+
+        message = {
+            "type": "biome_market_update",
+            "pool": 10,
+            "redistributions": {"forest": {"redistribution_amount": 5}, "desert": {"redistribution_amount": 5}}
+        }
+        await BiomeMarketWorker().broadcast_update(message)
+
+        for socket in (all_socket, forest_socket, both_socket):
+            assert [json.loads(t) for t in socket.sent] == [message]
+
+    @pytest.mark.asyncio
+    async def test_no_subscribers_sends_nothing(self):
+        sent = await connection_manager.broadcast_text_to_rooms("{}", ["biome_market_all"])
+        assert sent == 0
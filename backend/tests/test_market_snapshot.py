@@ -0,0 +1,87 @@
+"""
+Tests for the cached biome markets payload
+"""
+
+from datetime import datetime
+
+import pytest
+
+from app.models.biome_market import BiomeMarket
+from app.models.land import Biome
+from app.services.biome_market_service import BiomeMarketService, _market_dict
+
+
+class TestMarketsSnapshot:
+    """Test sequence-based invalidation of the serialized markets payload."""
+
+    def test_store_and_get(self):
+        service = BiomeMarketService()
+        seq, cached = service.get_markets_snapshot()
+        assert cached is None
+        service.store_markets_snapshot(seq, b"{}")
+        assert service.get_markets_snapshot() == (seq, b"{}")
+
+    def test_invalidate_drops_payload(self):
+        service = BiomeMarketService()
+        seq, _ = service.get_markets_snapshot()
+        service.store_markets_snapshot(seq, b"{}")
+        service.invalidate_markets_snapshot()
+        assert service.get_markets_snapshot()[1] is None
+
+    def test_stale_build_not_stored(self):
+        service = BiomeMarketService()
+        seq, _ = service.get_markets_snapshot()
+        service.invalidate_markets_snapshot()
+        service.store_markets_snapshot(seq, b"old")
+        assert service.get_markets_snapshot()[1] is None
+
+
+class TestMarketRows:
+    """Test the per-tick cache of market rows for read-only views."""
+
+    @pytest.mark.asyncio
+    async def test_worker_rows_served_without_query(self):
+        service = BiomeMarketService()
+        service.store_market_rows([{"biome": "forest", "market_cash_bdt": 10}])
+
+        rows = await service.get_market_rows(db=None)
+        assert rows == {"forest": {"biome": "forest", "market_cash_bdt": 10}}
+
+    def test_invalidate_drops_rows(self):
+        service = BiomeMarketService()
+        service.store_market_rows([{"biome": "forest"}])
+        service.invalidate_markets_snapshot()
+        assert service._market_rows is None
+
+    @pytest.mark.asyncio
+    async def test_get_market_cached(self):
+        service = BiomeMarketService()
+        service.store_market_rows([{"biome": "forest", "share_price_bdt": 2.5}])
+
+        market = await service.get_market_cached(None, Biome.FOREST)
+        assert market["share_price_bdt"] == 2.5
+
+        with pytest.raises(ValueError):
+            await service.get_market_cached(None, Biome.DESERT)
+
+
+class TestMarketDictMemo:
+    """Test reuse of serialized market dicts across unchanged ticks."""
+
+    def test_reused_until_fields_change(self):
+        market = BiomeMarket(
+            biome=Biome.OCEAN,
+            market_cash_bdt=1000,
+            attention_score=0.0,
+            share_price_bdt=0.1,
+            total_shares=10000,
+            last_redistribution=datetime(2025, 1, 1)
+        )
+
+        first = _market_dict(market)
+        assert _market_dict(market) is first
+
+        market.market_cash_bdt = 2000
+        second = _market_dict(market)
+        assert second is not first
+        assert second["market_cash_bdt"] == 2000
@@ -0,0 +1,68 @@
+"""
+Tests for generated model to_dict serializers
+"""
+
+import uuid
+from datetime import datetime, timezone
+
+from app.models.user import User, UserRole
+from app.models.transaction import Transaction, TransactionStatus, TransactionType
+
+
+class TestUserToDict:
+    """Test User.to_dict output."""
+
+    def test_converts_uuid_enum_and_timestamps(self):
+        user_id = uuid.uuid4()
+        created = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        user = User(
+            user_id=user_id,
+            username="alice",
+            email="alice@example.com",
+            role=UserRole.ADMIN,
+            balance_bdt=100,
+            is_banned=False,
+            verified=True,
+            created_at=created,
+        )
+        data = user.to_dict()
+        assert data["user_id"] == str(user_id)
+        assert data["role"] == "admin"
+        assert data["created_at"] == created.isoformat()
+        assert data["updated_at"] is None
+        assert "password_hash" not in data
+
+
+class TestTransactionToDict:
+    """Test Transaction.to_dict output."""
+
+    def test_nullable_columns_and_seller_receives(self):
+        seller_id = uuid.uuid4()
+        txn = Transaction(
+            transaction_id=uuid.uuid4(),
+            seller_id=seller_id,
+            buyer_id=uuid.uuid4(),
+            transaction_type=TransactionType.BUY_NOW,
+            status=TransactionStatus.COMPLETED,
+            amount_bdt=1000,
+            platform_fee_bdt=50,
+            gateway_fee_bdt=10,
+        )
+        data = txn.to_dict()
+        assert data["land_id"] is None
+        assert data["seller_id"] == str(seller_id)
+        assert data["transaction_type"] == "BUY_NOW"
+        assert data["status"] == "COMPLETED"
+        assert data["seller_receives_bdt"] == 940
+
+    def test_no_seller_means_no_seller_receives(self):
+        txn = Transaction(
+            transaction_id=uuid.uuid4(),
+            buyer_id=uuid.uuid4(),
+            transaction_type=TransactionType.TOPUP,
+            status=TransactionStatus.PENDING,
+            amount_bdt=500,
+            platform_fee_bdt=0,
+            gateway_fee_bdt=0,
+        )
+        assert txn.to_dict()["seller_receives_bdt"] is None
@@ -0,0 +1,31 @@
+"""
+Tests for monthly partition maintenance helpers
+"""
+
+from datetime import date
+
+from app.db.partitions import month_bounds, monthly_partition_ddl, upcoming_months
+
+
+class TestMonthBounds:
+    """Test calendar month boundaries."""
+
+    def test_mid_year_month(self):
+        assert month_bounds(2026, 3) == (date(2026, 3, 1), date(2026, 4, 1))
+
+    def test_december_rolls_over_year(self):
+        assert month_bounds(2025, 12) == (date(2025, 12, 1), date(2026, 1, 1))
+
+
+class TestPartitionDDL:
+    """Test generated partition DDL."""
+
+    def test_partition_name_and_range(self):
+        ddl = monthly_partition_ddl("transactions", 2026, 1)
+        assert "CREATE TABLE IF NOT EXISTS transactions_2026_01" in ddl
+        assert "PARTITION OF transactions" in ddl
+        assert "FROM ('2026-01-01') TO ('2026-02-01')" in ddl
+
+    def test_upcoming_months_crosses_year(self):
+        months = upcoming_months(2, today=date(2025, 11, 20))
+        assert months == [(2025, 11), (2025, 12), (2026, 1)]
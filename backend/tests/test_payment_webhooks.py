@@ -0,0 +1,54 @@
+"""
+Tests for idempotent payment webhook credits
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.models.user import User
+from app.services.payment_service import PaymentGateway, payment_service
+
+
+def _session(claimed: bool):
+    """Session whose duplicate check misses and whose claim succeeds or not."""
+    missing = MagicMock()
+    missing.scalar_one_or_none.return_value = None
+    claim = MagicMock()
+    claim.scalar.return_value = "pay-1" if claimed else None
+
+    db = AsyncMock()
+    db.add = MagicMock()
+    # duplicate SELECT, AdminConfig SELECT, claim INSERT
+    db.execute.side_effect = [missing, missing, claim]
+    return db
+
+
+class TestGatewayTransactionClaim:
+    """Test that a payment id already claimed is never credited again."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_duplicate_is_not_credited(self, monkeypatch):
+        add_balance = AsyncMock()
+        monkeypatch.setattr(User, "add_balance", add_balance)
+
+        processed = await payment_service.process_generic_webhook(
+            _session(claimed=False), PaymentGateway.NAGAD, {}, "pay-1", "user-1", 100, "success"
+        )
+
+        assert processed is True
+        add_balance.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_claimed_payment_is_credited(self, monkeypatch):
+        add_balance = AsyncMock(return_value=100)
+        monkeypatch.setattr(User, "add_balance", add_balance)
+        db = _session(claimed=True)
+
+        processed = await payment_service.process_generic_webhook(
+            db, PaymentGateway.NAGAD, {}, "pay-1", "user-1", 100, "success"
+        )
+
+        assert processed is True
+        add_balance.assert_awaited_once_with(db, "user-1", 100)
+        db.commit.assert_awaited()
@@ -0,0 +1,32 @@
+"""
+Tests for the orjson response class
+"""
+
+import json
+import uuid
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from app.api.responses import ORJSONResponse
+
+
+class TestORJSONResponse:
+    """Test orjson rendering of common API payload types."""
+
+    def test_renders_native_types(self):
+        listing_id = uuid.uuid4()
+        body = json.loads(ORJSONResponse({
+            "listing_id": listing_id,
+            "created_at": datetime(2025, 1, 1, tzinfo=timezone.utc),
+            "price": Decimal("12.50"),
+        }).body)
+        assert body == {
+            "listing_id": str(listing_id),
+            "created_at": "2025-01-01T00:00:00Z",
+            "price": "12.50",
+        }
+
+    def test_status_code_passthrough(self):
+        response = ORJSONResponse({"ok": True}, status_code=201)
+        assert response.status_code == 201
+        assert response.media_type == "application/json"
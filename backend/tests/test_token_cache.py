@@ -0,0 +1,162 @@
+"""
+Tests for AuthService token issuing and verification
+"""
+
+import time
+
+import jwt
+import pytest
+
+from app.services.auth_service import AuthService, InvalidTokenException
+
+
+class TestVerifyTokenCache:
+    """Test that verified payloads are reused but never outlive the token."""
+
+    def test_repeat_verification_served_from_cache(self):
+        service = AuthService(secret_key="test-secret", algorithm="HS256")
+        token = service.create_access_token("user-1", "a@example.com", "user")
+
+        first = service.verify_token(token)
+        assert token in service._token_cache
+        assert service.verify_token(token) == first
+
+    def test_cached_payload_is_a_copy(self):
+        service = AuthService(secret_key="test-secret", algorithm="HS256")
+        token = service.create_access_token("user-1", "a@example.com", "user")
+
+        service.verify_token(token)["sub"] = "tampered"
+        assert service.verify_token(token)["sub"] == "user-1"
+
+    def test_expired_cache_entry_is_reverified(self):
+        service = AuthService(secret_key="test-secret", algorithm="HS256")
+        token = service.create_access_token("user-1", "a@example.com", "user")
+        service.verify_token(token)
+
+        expiry, payload = service._token_cache[token]
+        service._token_cache[token] = (0.0, payload)
+        assert service.verify_token(token)["sub"] == "user-1"
+        assert service._token_cache[token][0] > 0.0
+
+    def test_invalid_token_not_cached(self):
+        service = AuthService(secret_key="test-secret", algorithm="HS256")
+        with pytest.raises(InvalidTokenException):
+            service.verify_token("not-a-token")
+        assert "not-a-token" not in service._token_cache
+
+    def test_invalid_token_rejected_from_negative_cache(self):
+        service = AuthService(secret_key="test-secret", algorithm="HS256")
+        forged = jwt.encode({"sub": "user-1", "type": "access"}, "other-secret", algorithm="HS256")
+
+        with pytest.raises(InvalidTokenException, match="Invalid token"):
+            service.verify_token(forged)
+        assert forged in service._bad_tokens
+
+        service._hmac_decode = None  # a cache hit must not decode again
+        with pytest.raises(InvalidTokenException, match="Invalid token"):
+            service.verify_token(forged)
+
+    def test_time_claim_failures_not_negative_cached(self):
+        service = AuthService(secret_key="test-secret", algorithm="HS256")
+        expired = jwt.encode({"sub": "user-1", "type": "access", "exp": 1}, "test-secret", algorithm="HS256")
+        immature = jwt.encode(
+            {"sub": "user-1", "type": "access", "nbf": int(time.time()) + 60},
+            "test-secret",
+            algorithm="HS256",
+        )
+
+        with pytest.raises(InvalidTokenException, match="expired"):
+            service.verify_token(expired)
+        with pytest.raises(InvalidTokenException):
+            service.verify_token(immature)
+        assert expired not in service._bad_tokens
+        assert immature not in service._bad_tokens
+
+    def test_immature_token_accepted_once_valid(self, monkeypatch):
+        service = AuthService(secret_key="test-secret", algorithm="HS256")
+        now = time.time()
+        token = jwt.encode(
+            {"sub": "user-1", "type": "access", "nbf": int(now) + 5, "exp": int(now) + 600},
+            "test-secret",
+            algorithm="HS256",
+        )
+
+        with pytest.raises(InvalidTokenException):
+            service.verify_token(token)
+        monkeypatch.setattr(time, "time", lambda: now + 10)
+        assert service.verify_token(token)["sub"] == "user-1"
+
+
+class TestHmacCodec:
+    """Test the native HS* codec stays interoperable with PyJWT."""
+
+    SECRET = "test-secret-key-for-hmac-codec"
+
+    def test_tokens_decode_with_pyjwt(self):
+        service = AuthService(secret_key=self.SECRET, algorithm="HS256")
+        token = service.create_access_token("user-1", "a@example.com", "user")
+
+        payload = jwt.decode(token, self.SECRET, algorithms=["HS256"])
+        assert payload["sub"] == "user-1"
+        assert isinstance(payload["exp"], int)
+
+    def test_verifies_pyjwt_tokens(self):
+        service = AuthService(secret_key=self.SECRET, algorithm="HS256")
+        token = jwt.encode(
+            {"sub": "user-1", "type": "access", "exp": int(time.time()) + 60},
+            self.SECRET,
+            algorithm="HS256"
+        )
+        assert service.verify_token(token)["sub"] == "user-1"
+
+    @pytest.mark.parametrize("claims, key, algorithm", [
+        ({"exp": 1}, SECRET, "HS256"),
+        ({}, "wrong-secret", "HS256"),
+        ({}, SECRET, "HS512"),
+    ])
+    def test_rejects_expired_forged_or_wrong_alg(self, claims, key, algorithm):
+        service = AuthService(secret_key=self.SECRET, algorithm="HS256")
+        token = jwt.encode({"sub": "user-1", "type": "access", **claims}, key, algorithm=algorithm)
+        with pytest.raises(InvalidTokenException):
+            service.verify_token(token)
+
+
+class TestTokenPair:
+    """Test issuing access and refresh tokens together."""
+
+    def test_create_token_pair(self):
+        service = AuthService(secret_key="test-secret", algorithm="HS256")
+        access_token, refresh_token = service.create_token_pair(
+            "user-1", "a@example.com", "user", additional_claims={"session_id": "s1"}
+        )
+
+        payload = service.verify_token(access_token)
+        assert payload["sub"] == "user-1"
+        assert payload["session_id"] == "s1"
+        assert refresh_token.count(".") == 0 and len(refresh_token) >= 43
+
+    def test_is_token_expired(self):
+        service = AuthService(secret_key="test-secret", algorithm="HS256")
+        token = service.create_access_token("user-1", "a@example.com", "user")
+        expired = jwt.encode({"sub": "user-1", "exp": int(time.time()) - 10}, "test-secret", algorithm="HS256")
+
+        assert service.is_token_expired(token) is False
+        assert service.is_token_expired(expired) is True
+        assert service.is_token_expired("garbage") is True
+
+    def test_non_numeric_exp_is_expired(self):
+        service = AuthService(secret_key="test-secret", algorithm="HS256")
+        # Encoded by hand: pyjwt refuses to encode a non-numeric exp
+        header = jwt.utils.base64url_encode(b'{"alg":"HS256","typ":"JWT"}').decode()
+        body = jwt.utils.base64url_encode(b'{"sub":"user-1","exp":"soon"}').decode()
+
+        assert service.is_token_expired(f"{header}.{body}.sig") is True
+        assert service.is_token_expired(jwt.encode({"sub": "user-1"}, "test-secret", algorithm="HS256")) is True
+
+    def test_decode_token_unsafe_matches_pyjwt(self):
+        service = AuthService(secret_key="test-secret", algorithm="HS256")
+        token = jwt.encode({"sub": "user-1", "n": 1}, "other-secret", algorithm="HS256")
+
+        assert service.decode_token_unsafe(token) == {"sub": "user-1", "n": 1}
+        with pytest.raises(jwt.DecodeError):
+            service.decode_token_unsafe("garbage")
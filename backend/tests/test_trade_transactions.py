@@ -0,0 +1,150 @@
+"""
+Tests for write-behind trade transaction rows
+"""
+
+import asyncio
+import uuid
+
+import orjson
+import pytest
+
+from app.api.v1.endpoints import biome_market
+from app.api.v1.endpoints.biome_market import _trade_response
+from app.models.land import Biome
+from app.models.transaction import TransactionType
+from app.schemas.biome_trading_schema import TradeResponse, TransactionHistoryResponse
+from app.services import biome_trading_service
+from app.services.insert_batcher import InsertBatcher
+
+
+class TestRecordTrade:
+    """Test that trades are queued and returned as complete records."""
+
+    @pytest.mark.asyncio
+    async def test_queues_row_and_returns_serializable_record(self, monkeypatch):
+        batcher = InsertBatcher(biome_trading_service.Transaction, "trade transaction")
+        monkeypatch.setattr(biome_trading_service, "transaction_batcher", batcher)
+        user_id = uuid.uuid4()
+
+        transaction = await biome_trading_service._record_trade(
+            user_id, TransactionType.BIOME_BUY, Biome.FOREST, 100, 5, 2.0, 50
+        )
+
+        row = batcher.queue.get_nowait()
+        assert row["transaction_id"] == transaction.transaction_id
+        data = transaction.to_dict()
+        assert data["buyer_id"] == str(user_id)
+        assert data["transaction_type"] == "BIOME_BUY"
+        assert data["created_at"] is not None
+
+    @pytest.mark.asyncio
+    async def test_buy_and_sell_rows_share_keys(self, monkeypatch):
+        batcher = InsertBatcher(biome_trading_service.Transaction, "trade transaction")
+        monkeypatch.setattr(biome_trading_service, "transaction_batcher", batcher)
+
+        await biome_trading_service._record_trade(
+            uuid.uuid4(), TransactionType.BIOME_BUY, Biome.FOREST, 100, 5, 2.0, 50
+        )
+        await biome_trading_service._record_trade(
+            uuid.uuid4(), TransactionType.BIOME_SELL, Biome.DESERT, 80, 4, 1.0, 80
+        )
+
+        buy, sell = batcher.queue.get_nowait(), batcher.queue.get_nowait()
+        assert buy.keys() == sell.keys()
+
+
+class TestTradeResponse:
+    """Test that trade responses carry every required field of the schema."""
+
+    @pytest.mark.asyncio
+    async def test_response_body_maps_transaction_fields(self, monkeypatch):
+        batcher = InsertBatcher(biome_trading_service.Transaction, "trade transaction")
+        monkeypatch.setattr(biome_trading_service, "transaction_batcher", batcher)
+        user_id = uuid.uuid4()
+        transaction = await biome_trading_service._record_trade(
+            user_id, TransactionType.BIOME_SELL, Biome.FOREST, 100, 5, 2.0, 50
+        )
+
+        response = _trade_response(transaction, message="sold", realized_gain_bdt=0)
+        body = response.model_dump(mode="json")
+
+        assert TradeResponse.model_validate(body) == response
+        assert body == {
+            "transaction_id": str(transaction.transaction_id),
+            "user_id": str(user_id),
+            "biome": "forest",
+            "type": "BIOME_SELL",
+            "shares": 2.0,
+            "price_per_share_bdt": 50,
+            "total_amount_bdt": 100,
+            "realized_gain_bdt": 0,
+            "executed_at": transaction.created_at.isoformat(),
+            "message": "sold",
+        }
+
+
+class TestTransactionHistory:
+    """Test that history rows are mapped and validated into the response schema."""
+
+    @pytest.mark.asyncio
+    async def test_history_endpoint_maps_rows(self, monkeypatch):
+        batcher = InsertBatcher(biome_trading_service.Transaction, "trade transaction")
+        monkeypatch.setattr(biome_trading_service, "transaction_batcher", batcher)
+        user_id = uuid.uuid4()
+        transaction = await biome_trading_service._record_trade(
+            user_id, TransactionType.BIOME_BUY, Biome.FOREST, 100, 5, 2.0, 50
+        )
+        pagination = {"page": 1, "limit": 50, "total": 1, "pages": 1, "has_next": False}
+
+        async def fake_history(**kwargs):
+            return {"transactions": [transaction.to_dict()], "pagination": pagination}
+
+        monkeypatch.setattr(
+            biome_market.biome_trading_service, "get_transaction_history", fake_history
+        )
+        response = await biome_market.get_transaction_history(
+            biome=None, page=1, limit=50, current_user={"sub": str(user_id)}, db=None
+        )
+
+        body = orjson.loads(response.body)
+        assert TransactionHistoryResponse.model_validate(body)
+        assert body["pagination"] == pagination
+        assert body["transactions"][0]["user_id"] == str(user_id)
+        assert body["transactions"][0]["total_amount_bdt"] == 100
+        assert body["transactions"][0]["type"] == "BIOME_BUY"
+
+
+class FailingInsertBatcher(InsertBatcher):
+    """Trade batcher whose inserts are slow and always fail."""
+
+    def __init__(self, dead_letter_path):
+        super().__init__(
+            biome_trading_service.Transaction,
+            "trade transaction",
+            max_wait_seconds=0,
+            max_retries=1,
+            retry_delay_seconds=0.02,
+            dead_letter_path=dead_letter_path,
+        )
+        self.writing = asyncio.Event()
+
+    async def _insert(self, rows):
+        self.writing.set()
+        await asyncio.sleep(0.02)
+        raise ConnectionError("database unavailable")
+
+
+class TestShutdownDuringWrite:
+    """Test that trade rows being written at shutdown are never silently lost."""
+
+    @pytest.mark.asyncio
+    async def test_stop_waits_for_retries_and_dead_letter(self, tmp_path):
+        path = tmp_path / "transactions.jsonl"
+        batcher = FailingInsertBatcher(str(path))
+        await batcher.enqueue({"transaction_id": "t1"})
+        batcher.start()
+        await batcher.writing.wait()
+
+        await batcher.stop()
+
+        assert path.read_bytes() == b'{"transaction_id":"t1"}\n'
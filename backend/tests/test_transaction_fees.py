@@ -0,0 +1,22 @@
+"""
+Tests for vectorized transaction fee calculation
+"""
+
+import numpy as np
+
+from app.models.transaction import Transaction
+
+
+class TestPlatformFees:
+    """Test batch platform fee calculation."""
+
+    def test_matches_per_row_calculation(self):
+        amounts = [0, 1, 19, 20, 999, 12345, 1_000_000]
+        fees = Transaction.calculate_platform_fees(amounts, 5.0)
+        expected = [Transaction(amount_bdt=a).calculate_platform_fee(5.0) for a in amounts]
+        assert fees.tolist() == expected
+
+    def test_fractional_percent_uses_basis_points(self):
+        fees = Transaction.calculate_platform_fees(np.array([1000, 333]), 2.5)
+        assert fees.dtype == np.int64
+        assert fees.tolist() == [25, 8]
@@ -0,0 +1,121 @@
+"""
+Tests for the per-request user lock-state cache
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+from app import dependencies
+from app.dependencies import (
+    USER_STATE_CHANNEL,
+    _get_locked_until,
+    invalidate_user_state,
+    listen_for_user_state_invalidations,
+)
+
+
+class _FakeResult:
+    def __init__(self, row):
+        self._row = row
+
+    def first(self):
+        return self._row
+
+
+class _FakeSession:
+    """Counts queries and returns a fixed locked_until row."""
+
+    def __init__(self, row):
+        self.row = row
+        self.queries = 0
+
+    async def execute(self, statement):
+        self.queries += 1
+        return _FakeResult(self.row)
+
+
+class TestUserStateCache:
+    """Test caching and invalidation of the lock lookup."""
+
+    def setup_method(self):
+        dependencies._user_state_cache.clear()
+
+    def test_second_lookup_is_cached(self):
+        db = _FakeSession(SimpleNamespace(locked_until=None))
+        assert asyncio.run(_get_locked_until(db, "u1")) == (True, None)
+        assert asyncio.run(_get_locked_until(db, "u1")) == (True, None)
+        assert db.queries == 1
+
+    def test_invalidate_forces_reload(self):
+        locked = datetime.now(timezone.utc) + timedelta(minutes=5)
+        db = _FakeSession(SimpleNamespace(locked_until=None))
+        asyncio.run(_get_locked_until(db, "u1"))
+        db.row = SimpleNamespace(locked_until=locked)
+        asyncio.run(invalidate_user_state("u1"))
+        assert asyncio.run(_get_locked_until(db, "u1")) == (True, locked)
+        assert db.queries == 2
+
+    def test_missing_user_not_cached(self):
+        db = _FakeSession(None)
+        assert asyncio.run(_get_locked_until(db, "ghost")) == (False, None)
+        asyncio.run(_get_locked_until(db, "ghost"))
+        assert db.queries == 2
+
+
+class _FakePubSub:
+    """Yields published messages, blocking like an idle subscription."""
+
+    def __init__(self):
+        self.messages = asyncio.Queue()
+        self.channels = []
+        self.closed = False
+
+    async def subscribe(self, channel):
+        self.channels.append(channel)
+        self.messages.put_nowait({"type": "subscribe", "data": 1})
+
+    async def listen(self):
+        while True:
+            yield await self.messages.get()
+
+    async def aclose(self):
+        self.closed = True
+
+
+class TestCrossWorkerInvalidation:
+    """Test that invalidations are published and applied from other workers."""
+
+    def setup_method(self):
+        dependencies._user_state_cache.clear()
+
+    def test_invalidate_publishes_user_id(self, monkeypatch):
+        publish = AsyncMock()
+        monkeypatch.setattr(dependencies.cache_service, "publish", publish)
+
+        asyncio.run(invalidate_user_state("u1"))
+        publish.assert_awaited_once_with(USER_STATE_CHANNEL, "u1")
+
+    def test_listener_drops_published_users(self, monkeypatch):
+        async def run():
+            pubsub = _FakePubSub()
+            client = SimpleNamespace(pubsub=lambda: pubsub)
+            monkeypatch.setattr(dependencies.cache_service, "client", client)
+            task = asyncio.create_task(listen_for_user_state_invalidations())
+            await asyncio.sleep(0)
+            dependencies._user_state_cache["u1"] = (float("inf"), None)
+            dependencies._user_state_cache["u2"] = (float("inf"), None)
+            pubsub.messages.put_nowait({"type": "message", "data": b"u1"})
+            await asyncio.sleep(0.01)
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+            return pubsub
+
+        pubsub = asyncio.run(run())
+        assert pubsub.channels == [USER_STATE_CHANNEL]
+        assert pubsub.closed
+        assert list(dependencies._user_state_cache) == ["u2"]